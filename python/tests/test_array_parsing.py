@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+r"""
+Thermognosis Engine: Serialized Array Parsing Tests
+Document ID: SPEC-PIPELINE-DATA-FLOW
+
+Verifies that the column-level JIT scanner and the scalar reference parser
+decode literature array literals to bitwise-identical float64 buffers, and
+that malformed records are isolated without collapsing the batch.
+"""
+
+import numpy as np
+import pytest
+
+from thermognosis.utils import array_parsing
+from thermognosis.utils.array_parsing import parse_float_array, parse_manifolds
+
+
+CELLS = [
+    "[300.0, 350.5, 400]",
+    "[1.2e-5, -3.4E+2, 0.1]",
+    "[]",
+    "[0.30000000000000004, 123456789012345678901234, 5e-324]",
+    "[nan, 1.0, 2.0]",
+    "not an array",
+    None,
+]
+
+
+def test_scalar_parser_rejects_non_string():
+    with pytest.raises(TypeError):
+        parse_float_array(None)
+
+
+@pytest.mark.parametrize("cell", ["[nan, 1]", "[1.0, inf]", "[-Infinity]"])
+def test_scalar_parser_rejects_non_finite_tokens(cell):
+    with pytest.raises(ValueError):
+        parse_float_array(cell)
+
+
+def test_manifolds_isolate_failures_and_preserve_order():
+    good = ["[1.0, 2.0]", "[3.0]", "[bad]", "[4.0, 5.0]"]
+    other = ["[1.0, 2.0]", "[3.0, 9.0]", "[1.0]", "[4.0, 5.0]"]
+    result = parse_manifolds((good, other))
+
+    assert result.rows.tolist() == [0, 3]
+    assert result.lengths.tolist() == [2, 2]
+    assert [idx for idx, _ in result.failures] == [1, 2]
+    np.testing.assert_array_equal(result.flats[0], [1.0, 2.0, 4.0, 5.0])
+
+
+@pytest.mark.skipif(not array_parsing.HAS_NUMBA, reason="numba not installed")
+def test_jit_column_matches_scalar_reference():
+    flat, lengths, ok = array_parsing.parse_array_column(CELLS)
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+
+    for i, cell in enumerate(CELLS):
+        if not ok[i]:
+            continue
+        expected = parse_float_array(cell)
+        got = flat[offsets[i]:offsets[i + 1]]
+        assert got.tobytes() == expected.tobytes()
+
+    # Tokens outside the exact fast path must be deferred, never approximated.
+    assert ok[:3].all()
+    assert not ok[3:].any()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+r"""
+Thermognosis Engine: Canonical Serialization Tests
+Document ID: SPEC-ACQ-CHECKSUM
+
+Verifies that every canonical serialization backend produces byte-identical
+output to the stdlib JSON reference, so lineage hashes never depend on which
+optional encoder is installed.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from thermognosis.utils import hashing
+from thermognosis.utils.hashing import _standardize_value, canonical_serialize
+
+
+TREES = [
+    {"b": 1, "a": [1.5, -0.0, float("nan"), float("inf")], "c": {"z": None, "y": True}},
+    {"text": "tab\tquote\"slash\\/ctrl\x01", "unicode": "Bi₂Te₃"},
+    {"del": "x\x7fy", "ctrl": "\x00\x08\x0b\x0c\r\n\x1b\x1f", "\x7f": ["\x1e", "\x7f"]},
+    {"big": 2 ** 70, "small": -(2 ** 63), "set": {3, 1, 2}},
+    pd.DataFrame({"T": [300.0, 350.5], "S": [1.2e-4, float("nan")], "id": ["a", "b"]}),
+    {"frame": pd.DataFrame({"x": [1.508e-9, 1e16, -0.0]}), "n": 3},
+    np.arange(6, dtype=np.float64).reshape(2, 3),
+]
+
+
+def _reference(data) -> bytes:
+    tree = _standardize_value(data, hashing.NUMERICAL_PRECISION)
+    return json.dumps(
+        tree, ensure_ascii=True, allow_nan=False, sort_keys=True, separators=(',', ':')
+    ).encode('utf-8')
+
+
+@pytest.mark.parametrize("data", TREES)
+def test_canonical_bytes_match_stdlib_reference(data) -> None:
+    assert canonical_serialize(data) == _reference(data)
+
+
+def test_streamed_hash_matches_buffered_bytes(monkeypatch) -> None:
+    import hashlib
+
+    monkeypatch.setattr(hashing, "_STREAM_CHUNK_ITEMS", 3)
+    frame = pd.DataFrame({"T": np.linspace(300.0, 800.0, 10), "id": list("abcdefghij")})
+    for data in TREES + [frame, {"rows": list(range(10)), "frame": frame}]:
+        expected = hashlib.sha256(_reference(data)).hexdigest()
+        assert hashing.compute_sha256_hash(data) == expected
+
+
+def test_compute_hash_algorithms() -> None:
+    data = TREES[0]
+    assert hashing.compute_hash(data) == hashing.compute_sha256_hash(data)
+    with pytest.raises(hashing.HashComputationError):
+        hashing.compute_hash(data, algo="md5")
+    if hashing.HAS_BLAKE3:
+        import blake3
+        assert hashing.compute_hash(data, algo="blake3") == blake3.blake3(_reference(data)).hexdigest()
+
+
+def test_immutable_tuples_are_standardized_once() -> None:
+    shared = (("alpha", 0.1), ("beta", 2), None)
+    first = _standardize_value({"cfg": shared}, 12)["cfg"]
+    assert _standardize_value([shared], 12)[0] is first
+    assert _standardize_value(shared, 6) is not first
+
+    mutable = ([1.0], "x")
+    assert _standardize_value(mutable, 12) is not _standardize_value(mutable, 12)
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_batch_hash_matches_single_item_hashes(max_workers) -> None:
+    expected = [hashing.compute_sha256_hash(data) for data in TREES]
+    assert hashing.compute_sha256_hash_batch(TREES, max_workers=max_workers) == expected
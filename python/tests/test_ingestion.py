@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+r"""
+Thermognosis Engine: Raw Measurement Entity Tests
+Document ID: SPEC-CONTRACT-RAW-MEASUREMENT
+
+Pins the derived figure of merit on the immutable measurement entity: it must
+survive a vanishing thermal conductivity and must not leak into the dataclass
+field set.
+"""
+
+import dataclasses
+import math
+
+import pytest
+
+from thermognosis.pipeline.ingestion import (
+    MeasurementQuantities,
+    MeasurementUncertainties,
+    RawMeasurement,
+)
+
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
+
+
+def _measurement(S: float, kappa: float) -> RawMeasurement:
+    return RawMeasurement(
+        id="MEAS_0",
+        mat_id="MAT_0",
+        paper_id="P_0",
+        quantities=MeasurementQuantities(T=300.0, S=S, sigma=1e5, kappa=kappa),
+        uncertainties=MeasurementUncertainties(0.0, 0.0, 0.0, 0.0),
+    )
+
+
+def test_zt_matches_definition() -> None:
+    assert _measurement(1e-4, 1.5).zT == pytest.approx(0.2)
+
+
+@pytest.mark.parametrize("S, expected", [(1e-4, math.inf), (0.0, math.nan)])
+def test_zero_kappa_does_not_raise(S, expected) -> None:
+    zt = _measurement(S, 0.0).zT
+    assert math.isnan(zt) if math.isnan(expected) else zt == expected
+
+
+def test_zt_cache_is_not_a_dataclass_field() -> None:
+    m = _measurement(1e-4, 1.5)
+    m.zT
+    assert "zT" not in {f.name for f in dataclasses.fields(m)}
+    assert "zT" not in dataclasses.asdict(m)
+    assert m == _measurement(1e-4, 1.5)
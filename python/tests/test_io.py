@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+r"""
+Thermognosis Engine: Parquet I/O Tests
+Document ID: SPEC-DB-PARQUET
+
+Checks the schema enforcement boundary of `write_parquet_safely`: pandas
+dtypes round-trip and schema violations are rejected before touching disk.
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from thermognosis.utils.io import SchemaViolationError, write_parquet_safely
+
+
+def test_nullable_integers_round_trip(tmp_path) -> None:
+    df = pd.DataFrame({"n": pd.array([1, None, 3], dtype="Int64")})
+    path = tmp_path / "n.parquet"
+    write_parquet_safely(df, path, pa.schema([pa.field("n", pa.int64())]))
+    assert pq.read_table(path).to_pandas()["n"].dtype == "Int64"
+
+
+def test_nulls_in_non_nullable_field_violate_schema(tmp_path) -> None:
+    df = pd.DataFrame({"T": [300.0, None]})
+    schema = pa.schema([pa.field("T", pa.float64(), nullable=False)])
+    with pytest.raises(SchemaViolationError):
+        write_parquet_safely(df, tmp_path / "t.parquet", schema)
+    assert not list(tmp_path.iterdir())
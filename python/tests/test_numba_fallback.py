@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+r"""
+Thermognosis Engine: Numba Fallback Backend Tests
+Document ID: SPEC-PHYS-CONSISTENCY
+
+Checks that the JIT physics gate reproduces the Rust validation semantics:
+bit-identical zT for admissible states and fail-fast promotion of the first
+violating state.
+"""
+
+import sys
+
+import numpy as np
+import pytest
+
+from thermognosis.wrappers.numba_fallback import HAS_NUMBA, NumbaBackend
+from thermognosis.wrappers.rust_wrapper import RustCore, RustCoreError
+
+pytestmark = pytest.mark.skipif(not HAS_NUMBA, reason="numba not installed")
+
+
+def test_fallback_zt_matches_reference() -> None:
+    rng = np.random.default_rng(0)
+    n = 1000
+    s = rng.uniform(-3e-4, 3e-4, n)
+    sigma = rng.uniform(1e2, 1e5, n)
+    kappa = rng.uniform(0.5, 5.0, n)
+    t = rng.uniform(300.0, 1000.0, n)
+
+    zt = NumbaBackend().check_physics_consistency_py(s, sigma, kappa, t, True)
+    assert np.array_equal(zt, (s * s * sigma * t) / kappa)
+
+
+def test_fallback_reports_first_violation() -> None:
+    ones = np.ones(4)
+    kappa = np.array([1.0, 0.0, 1.0, -1.0])
+    t = np.array([300.0, 300.0, -5.0, 300.0])
+    with pytest.raises(ValueError, match="Negative Thermal Conductivity"):
+        NumbaBackend().check_physics_consistency_py(ones, ones, kappa, t)
+    with pytest.raises(AttributeError, match="propagate_error_py"):
+        NumbaBackend().propagate_error_py(ones, ones, ones, ones)
+
+
+def test_wrapper_fails_fast_on_partial_fallback(monkeypatch) -> None:
+    # A None entry in sys.modules makes `import rust_core` raise ImportError.
+    monkeypatch.setitem(sys.modules, "rust_core", None)
+    with pytest.raises(RustCoreError, match="Numba fallback backend lacks .*propagate_error_py"):
+        RustCore(deterministic=True)
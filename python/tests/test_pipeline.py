@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+r"""
+Thermognosis Engine: Pipeline Orchestrator Tests
+Document ID: SPEC-GOV-ERROR-HIERARCHY
+
+Checks the record-level isolation of the orchestrator's input coercion: a
+malformed credibility prior rejects its own record and nothing else.
+"""
+
+import numpy as np
+import pytest
+
+# The orchestrator pulls in the database writers.
+pytest.importorskip("psycopg2")
+
+from thermognosis.pipeline.orchestrator import _coerce_priors, _reject_records
+from thermognosis.utils.array_parsing import parse_manifolds
+
+
+def test_non_numeric_prior_rejects_only_its_record() -> None:
+    creds = np.array([0.9, "high", float("nan"), "0.25", "nan", None], dtype=object)
+    cred_vec, failures = _coerce_priors(creds)
+    assert [idx for idx, _ in failures] == [1]
+    assert cred_vec[0] == 0.9 and cred_vec[3] == 0.25
+    assert np.isnan(cred_vec[[2, 4, 5]]).all()
+
+    temperature = ["[300.0]", "[310.0, 320.0]", "[bad]", "[330.0]", "[340.0]", "[350.0]"]
+    manifolds = _reject_records(parse_manifolds((temperature,)), failures)
+    assert manifolds.rows.tolist() == [0, 3, 4, 5]
+    assert manifolds.flats[0].tolist() == [300.0, 330.0, 340.0, 350.0]
+    assert manifolds.offsets.tolist() == [0, 1, 2, 3, 4]
+    assert [idx for idx, _ in manifolds.failures] == [1, 2]
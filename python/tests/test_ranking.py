@@ -43,14 +43,12 @@ class MockPGDatabase:
 class MockBulkWriter:
     """Captures transacted updates across cross-system boundaries."""
     def __init__(self) -> None:
-        self.pg_data: List[Tuple[float, str]] = []
-        self.graph_data: List[Dict[str, Any]] = []
+        self.material_ids: List[str] = []
+        self.ranks: List[float] = []
 
-    def update_material_ranks(
-        self, pg_data: List[Tuple[float, str]], graph_data: List[Dict[str, Any]]
-    ) -> None:
-        self.pg_data = pg_data
-        self.graph_data = graph_data
+    def update_material_ranks(self, material_ids: List[str], ranks: np.ndarray) -> None:
+        self.material_ids = list(material_ids)
+        self.ranks = np.asarray(ranks, dtype=np.float64).tolist()
 
 
 class MathStrictRustCoreRanking:
@@ -118,10 +116,10 @@ def test_entropy_regularized_ranking_pipeline() -> None:
     num_ranked: int = ranker.update_all_ranks(alpha=1.0, beta=0.1)
     
     assert num_ranked == len(df['material'].unique()), "Pipeline fragmented sub-manifolds."
-    assert len(writer_mock.pg_data) == num_ranked, "ACID write boundary failure for PG."
-    assert len(writer_mock.graph_data) == num_ranked, "ACID write boundary failure for Graph."
+    assert len(writer_mock.material_ids) == num_ranked, "ACID write boundary failure for PG."
+    assert len(writer_mock.ranks) == num_ranked, "ACID write boundary failure for Graph."
     
-    ranks_dict: Dict[str, float] = {mat_uuid: rank_val for rank_val, mat_uuid in writer_mock.pg_data}
+    ranks_dict: Dict[str, float] = dict(zip(writer_mock.material_ids, writer_mock.ranks))
     
     # Sort materials descending by regularized final rank score
     sorted_materials = sorted(ranks_dict.items(), key=lambda x: x[1], reverse=True)
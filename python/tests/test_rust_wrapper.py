@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+r"""
+Thermognosis Engine: FFI Wrapper Tests
+Document ID: SPEC-GOV-ERROR-HIERARCHY
+
+Checks the `RustCore` boundary contract against stand-in backends: optional
+entry points missing from older compiled cores surface as ``AttributeError``
+(which the pipeline fallbacks catch), and input preparation failures are
+promoted to ``RustCoreError``.
+"""
+
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from thermognosis.utils.array_parsing import parse_manifolds
+from thermognosis.wrappers.rust_wrapper import RustCore, RustCoreError
+
+
+def _unused(*args, **kwargs):
+    raise AssertionError("entry point should not be reached")
+
+
+@pytest.fixture
+def legacy_core(monkeypatch) -> RustCore:
+    """RustCore over a compiled module that predates the fused hard gate."""
+    module = types.ModuleType("rust_core")
+    module.L0_SOMMERFELD, module.L_MIN, module.L_MAX = 2.44e-8, 1.0e-9, 1.0e-7
+    for name in ("compute_zt_from_csv_py", "validate_dimensions_py", "check_physics_consistency_py",
+                 "propagate_error_py", "compute_quality_score_py"):
+        setattr(module, name, _unused)
+    monkeypatch.setitem(sys.modules, "rust_core", module)
+    return RustCore(deterministic=True)
+
+
+def test_missing_fused_gate_raises_attribute_error(legacy_core) -> None:
+    ones = np.ones(3)
+    with pytest.raises(AttributeError, match="compute_hard_constraint_gate_py"):
+        legacy_core.compute_hard_constraint_gate(ones, ones, ones, ones)
+
+
+def test_missing_array_parser_falls_back_to_python(legacy_core) -> None:
+    columns = (["[300.0, 400.0]", "[bad]", "[500.0]"], ["[1.0, 2.0]", "[1.0]", "[3.0]"])
+    parsed = parse_manifolds(columns, rust_core=legacy_core)
+    reference = parse_manifolds(columns)
+    assert parsed.rows.tolist() == reference.rows.tolist() == [0, 2]
+    for got, want in zip(parsed.flats, reference.flats):
+        assert np.array_equal(got, want)
+
+
+@pytest.mark.parametrize("tensor", [[10 ** 400], 10 ** 400, ["x"], None])
+def test_unconvertible_inputs_raise_rust_core_error(legacy_core, tensor) -> None:
+    with pytest.raises(RustCoreError, match="'s'"):
+        legacy_core._prepare_array(tensor, "s")
+
+
+def test_quality_score_retries_legacy_core_with_ones(legacy_core) -> None:
+    seen = []
+
+    def legacy_quality(c, cr, ph, err, sm, meta, hg, lambda_reg, deterministic):
+        if c is None or sm is None or meta is None:
+            raise TypeError("argument 'completeness': 'NoneType' object cannot be converted")
+        seen.append((c, sm, meta))
+        return cr, cr, cr, hg.astype(np.int64)
+
+    legacy_core._fn_quality = legacy_quality
+    metrics = {
+        'credibility': np.full(4, 0.5),
+        'physics_consistency': np.ones(4),
+        'error_magnitude': np.zeros(4),
+        'hard_constraint_gate': np.ones(4, dtype=bool),
+    }
+    legacy_core.compute_quality_score(metrics)
+    (c, sm, meta), = seen
+    assert c is sm is meta
+    assert np.array_equal(c, np.ones(4))
+
+
+def test_quality_score_type_error_raises_rust_core_error(legacy_core) -> None:
+    def broken_quality(*args):
+        raise TypeError("unexpected argument")
+
+    legacy_core._fn_quality = broken_quality
+    metrics = dict.fromkeys(('credibility', 'physics_consistency', 'error_magnitude'), np.ones(2))
+    metrics.update(completeness=np.ones(2), smoothness=np.ones(2), metadata=np.ones(2),
+                   hard_constraint_gate=np.ones(2, dtype=bool))
+    with pytest.raises(RustCoreError, match="Quality evaluation failed"):
+        legacy_core.compute_quality_score(metrics)
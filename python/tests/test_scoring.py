@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+r"""
+Thermognosis Engine: Unified Quality Scoring Tests
+Document ID: SPEC-QUAL-SCORING
+
+Verifies that the vectorized (N, 6) batch scoring models agree with the
+scalar per-record reference implementations, including gated records,
+zero components and classification boundaries.
+"""
+
+import numpy as np
+import pytest
+
+from thermognosis.pipeline.scoring import (
+    CredibilityScorer, QualityScoreError, QualityScorer, QualityVector
+)
+
+
+def _population(n: int = 64, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    q = rng.uniform(0.0, 1.0, size=(n, 6))
+    q[::9, 2] = 0.0
+    q[::11, 4] = 1.0
+    return q
+
+
+def test_batch_models_match_scalar_reference() -> None:
+    scorer = QualityScorer()
+    q = _population()
+    sigma = _population(seed=11) * 0.1
+    gates = np.arange(q.shape[0]) % 5 != 0
+    vectors = [QualityVector(*row) for row in q]
+    sigmas = [QualityVector(*row) for row in sigma]
+
+    np.testing.assert_allclose(
+        scorer.score_linear_batch(gates, q),
+        [scorer.score_linear(g, v) for g, v in zip(gates, vectors)], rtol=1e-12)
+    np.testing.assert_allclose(
+        scorer.score_multiplicative_batch(gates, q),
+        [scorer.score_multiplicative(g, v) for g, v in zip(gates, vectors)], rtol=1e-12)
+    np.testing.assert_allclose(
+        scorer.score_entropy_regularized_batch(gates, q, 0.05),
+        [scorer.score_entropy_regularized(g, v, 0.05) for g, v in zip(gates, vectors)], rtol=1e-12)
+    np.testing.assert_allclose(
+        scorer.score_risk_adjusted_batch(gates, q, sigma, 2.0),
+        [scorer.score_risk_adjusted(g, m, s, 2.0) for g, m, s in zip(gates, vectors, sigmas)], rtol=1e-12)
+
+
+def test_classify_batch_matches_thresholds() -> None:
+    scores = np.array([0.0, 0.4999, 0.5, 0.65, 0.7999, 0.8, 0.9, 1.0, np.nan])
+    expected = [QualityScorer.classify(s) for s in scores]
+    assert list(QualityScorer.classify_batch(scores)) == expected
+
+
+def test_batch_rejects_out_of_bounds_components() -> None:
+    q = _population(4)
+    q[2, 3] = 1.5
+    with pytest.raises(QualityScoreError):
+        QualityScorer().score_linear_batch(np.ones(4, dtype=bool), q)
+
+
+def test_credibility_batch_matches_scalar_reference() -> None:
+    rng = np.random.default_rng(3)
+    n = 32
+    inputs = dict(
+        w_source=rng.uniform(0.0, 1.0, n),
+        n_rep=rng.integers(0, 5, n).astype(float),
+        w_unc=rng.choice([0.0, 0.5, 1.0], n),
+        delta_phys=rng.uniform(-0.5, 2.0, n),
+        n=rng.integers(0, 50, n).astype(float),
+        e_cv=rng.uniform(0.0, 1.0, n),
+        t_pub=rng.uniform(1990.0, 2030.0, n),
+    )
+    batch = CredibilityScorer.calculate_credibility_batch(t_current=2025.0, **inputs)
+    scalar = [
+        CredibilityScorer.calculate_credibility(
+            t_current=2025.0, **{k: v[i] for k, v in inputs.items()})
+        for i in range(n)
+    ]
+    np.testing.assert_allclose(batch, scalar, rtol=1e-12)
+
+
+def test_pareto_front_matches_pairwise_dominance(monkeypatch) -> None:
+    q = np.round(_population(40, seed=5), 1)
+    vectors = [QualityVector(*row) for row in q]
+    expected = [
+        not any(QualityScorer.pareto_dominates(other, v) for other in vectors)
+        for v in vectors
+    ]
+    assert QualityScorer.pareto_front(q).tolist() == expected
+
+    monkeypatch.setattr(QualityScorer, "_PARETO_BROADCAST_MAX", 0)
+    assert QualityScorer.pareto_front(q).tolist() == expected
+
+
+def test_specialized_scorer_matches_linear_model() -> None:
+    scorer = QualityScorer(np.array([0.3, 0.2, 0.2, 0.1, 0.1, 0.1]))
+    score = scorer.compile_specialized()
+    for row in _population(16).tolist():
+        assert score(row) == pytest.approx(scorer.score_linear(True, QualityVector(*row)), rel=1e-12)
+    assert score(row, gate=False) == 0.0
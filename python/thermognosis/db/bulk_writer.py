@@ -25,7 +25,7 @@ Date: 2026-02-22
 """
 
 import logging
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Sequence, Tuple, Optional
 import psycopg2
 import psycopg2.extras
 from psycopg2.pool import AbstractConnectionPool
@@ -123,6 +123,58 @@ class PostgresBulkWriter:
             logger.warning(f"Empty dataset provided for {table_name}. Aborting transaction.")
             return 0
 
+        cols_str = ",".join(columns)
+        # Formulate the optimized INSERT statement
+        query = f"INSERT INTO {table_name} ({cols_str}) VALUES %s"
+        self._execute_values(query, data, page_size)
+        logger.info(f"Successfully committed {len(data)} tuples to {table_name}.")
+        return len(data)
+
+    def execute_update_batch(
+        self,
+        query: str,
+        data: List[Tuple[Any, ...]],
+        page_size: int = 10000
+    ) -> int:
+        """
+        Execute a bulk UPDATE joined against a multi-row VALUES list.
+
+        Implements: SPEC-DB-POSTGRES-SCHEMA
+
+        Parameters
+        ----------
+        query : str
+            Statement containing ``FROM (VALUES %s) AS v(...)`` for the rows.
+        data : List[Tuple[Any, ...]]
+            Row tuples matching the VALUES column list.
+        page_size : int, optional
+            Number of rows per execute_values batch, by default 10000.
+
+        Returns
+        -------
+        int
+            Number of rows submitted.
+
+        Raises
+        ------
+        PostgresBulkInsertError
+            If transactional integrity, constraints, or isolation guarantees fail.
+        """
+        if not data:
+            logger.warning("Empty dataset provided for bulk UPDATE. Aborting transaction.")
+            return 0
+
+        self._execute_values(query, data, page_size)
+        logger.info(f"Successfully committed {len(data)} update tuples.")
+        return len(data)
+
+    def _execute_values(
+        self,
+        query: str,
+        data: List[Tuple[Any, ...]],
+        page_size: int
+    ) -> None:
+        """Runs one execute_values statement in a SERIALIZABLE transaction."""
         conn = self.pool.getconn()
         
         try:
@@ -130,10 +182,6 @@ class PostgresBulkWriter:
             conn.set_session(isolation_level=psycopg2.extensions.ISOLATION_LEVEL_SERIALIZABLE)
             
             with conn.cursor() as cursor:
-                cols_str = ",".join(columns)
-                # Formulate the optimized INSERT statement
-                query = f"INSERT INTO {table_name} ({cols_str}) VALUES %s"
-                
                 # psycopg2.extras.execute_values utilizes PostgreSQL multi-row VALUES logic
                 # for extreme throughput, bypassing single-row parsing overhead.
                 psycopg2.extras.execute_values(
@@ -144,8 +192,6 @@ class PostgresBulkWriter:
                 )
                 
             conn.commit()
-            logger.info(f"Successfully committed {len(data)} tuples to {table_name}.")
-            return len(data)
 
         except psycopg2.IntegrityError as e:
             conn.rollback()
@@ -237,6 +283,68 @@ class GraphBulkWriter:
             raise Neo4jBulkInsertError(f"Graph transaction rollback executed due to: {str(e)}") from e
 
 
+    def execute_columnar_batch(
+        self,
+        cypher_query: str,
+        **columns: Sequence[Any]
+    ) -> int:
+        """
+        Executes a Cypher query over parallel column lists instead of row maps.
+
+        The driver serializes each column as one list parameter, so no
+        per-row dictionary is built in Python. The query indexes the columns
+        itself, e.g. ``UNWIND range(0, size($ids) - 1) AS i ... $ranks[i]``.
+
+        Implements: SPEC-DB-POSTGRES-SCHEMA
+
+        Parameters
+        ----------
+        cypher_query : str
+            The Cypher query referencing each column as a list parameter.
+        **columns : Sequence[Any]
+            Equal-length columns, passed as query parameters by name.
+
+        Returns
+        -------
+        int
+            Number of rows processed in the graph batch.
+
+        Raises
+        ------
+        Neo4jBulkInsertError
+            If the columns are ragged or the graph transaction fails.
+        """
+        lengths = {len(col) for col in columns.values()}
+        if len(lengths) > 1:
+            raise Neo4jBulkInsertError(f"Ragged columnar batch: column lengths {sorted(lengths)}.")
+        n_rows = lengths.pop() if lengths else 0
+        if not n_rows:
+            logger.warning("Empty columnar batch provided for Neo4j. Aborting transaction.")
+            return 0
+
+        # Native Python lists: the driver's packstream encoder does not accept ndarrays.
+        params = {
+            name: col.tolist() if hasattr(col, "tolist") else list(col)
+            for name, col in columns.items()
+        }
+
+        def _tx_logic(tx: Transaction, query: str) -> Any:
+            result = tx.run(query, **params)
+            return result.consume()
+
+        try:
+            with self.driver.session() as session:
+                summary = session.execute_write(_tx_logic, cypher_query)
+                logger.info(
+                    f"Neo4j Columnar Commit Successful. Properties set: {summary.counters.properties_set}"
+                )
+                return n_rows
+
+        except Exception as e:
+            logger.error(f"Neo4j transaction failed during columnar batch execution: {str(e)}")
+            raise Neo4jBulkInsertError(f"Graph transaction rollback executed due to: {str(e)}") from e
+
+
 class UnifiedTranslationalWriter:
     """
     Orchestrates coordinated writes across PostgreSQL and Neo4j to guarantee 
@@ -319,4 +427,63 @@ class UnifiedTranslationalWriter:
             logger.critical("DB-PG-10: Cross-system structural drift detected!")
             raise CrossSystemConsistencyError(
                 "Phase 1 (PG) succeeded, but Phase 2 (Neo4j) failed. System state is partially desynchronized."
-            ) from e
\ No newline at end of file
+            ) from e
+
+    def update_material_ranks(
+        self,
+        material_ids: Sequence[str],
+        ranks: Sequence[float]
+    ) -> None:
+        """
+        Persists entropy-regularized material ranks to PG and Neo4j.
+
+        Both systems receive the two parallel columns directly; the graph side
+        indexes them inside Cypher, so no per-material dictionary is built.
+
+        Implements: SPEC-GRAPH-RANK, SPEC-DB-POSTGRES-SCHEMA (Section 10)
+
+        Parameters
+        ----------
+        material_ids : Sequence[str]
+            Material UUIDs, aligned with `ranks`.
+        ranks : Sequence[float]
+            Regularized rank score per material.
+
+        Raises
+        ------
+        CrossSystemConsistencyError
+            If PG succeeds but Neo4j fails, requiring manual compensation or retry log.
+        """
+        ids = material_ids.tolist() if hasattr(material_ids, "tolist") else list(material_ids)
+        rank_values = ranks.tolist() if hasattr(ranks, "tolist") else list(ranks)
+        if len(ids) != len(rank_values):
+            raise CrossSystemConsistencyError(
+                f"Rank write misaligned: {len(ids)} material IDs for {len(rank_values)} ranks."
+            )
+
+        # 1. Authoritative Transactional Spine (PostgreSQL)
+        logger.info("Initiating Phase 1/2: PostgreSQL Rank Update")
+        self.pg_writer.execute_update_batch(
+            query=(
+                "UPDATE material_registry AS m SET rank = v.rank "
+                "FROM (VALUES %s) AS v(rank, material_uuid) "
+                "WHERE m.material_uuid = v.material_uuid::uuid"
+            ),
+            data=list(zip(rank_values, ids))
+        )
+
+        # 2. Graph Reasoning Layer (Neo4j)
+        neo4j_query = """
+        UNWIND range(0, size($ids) - 1) AS i
+        MATCH (m:Material {uuid: $ids[i]})
+        SET m.rank = $ranks[i]
+        """
+
+        logger.info("Initiating Phase 2/2: Neo4j Rank Propagation")
+        try:
+            self.graph_writer.execute_columnar_batch(neo4j_query, ids=ids, ranks=rank_values)
+        except Neo4jBulkInsertError as e:
+            logger.critical("DB-PG-10: Cross-system structural drift detected!")
+            raise CrossSystemConsistencyError(
+                "Phase 1 (PG) succeeded, but Phase 2 (Neo4j) failed. System state is partially desynchronized."
+            ) from e
@@ -11,6 +11,8 @@ C-contiguous memory tensors for zero-copy FFI execution in the Rust backend.
 """
 
 import logging
+from operator import itemgetter
+
 import numpy as np
 from typing import Any, List, Dict, Tuple
 from sqlalchemy.exc import SQLAlchemyError
@@ -18,6 +20,9 @@ from sqlalchemy.exc import SQLAlchemyError
 # Configure module-level logger
 logger = logging.getLogger(__name__)
 
+# Columnar record layout for the (material_id, temperature) extraction query.
+_STATE_ROW_DTYPE = np.dtype([('mat_id', 'O'), ('T', 'f8')])
+
 
 class GapDetectionError(Exception):
     """
@@ -96,34 +101,31 @@ class GapDetector:
         if not rows:
             raise DatabaseExtractionError("Zero measurements found. Vacuous state space.")
 
-        t_list = []
-        bounds = []
-        material_ids = []
-        
-        current_mat = None
-        start_idx = 0
-        
-        # O(N) single-pass continuous memory allocation strategy
-        for i, row in enumerate(rows):
-            mat_id = row[0]
-            t_val = row[1]
-            
-            t_list.append(t_val)
-            
-            if mat_id != current_mat:
-                if current_mat is not None:
-                    bounds.append((start_idx, i))
-                    material_ids.append(current_mat)
-                current_mat = mat_id
-                start_idx = i
-                
-        # Terminal boundary resolution
-        if current_mat is not None:
-            bounds.append((start_idx, len(rows)))
-            material_ids.append(current_mat)
-
-        # Force strict C-contiguous 64-bit float memory layout for zero-copy FFI
-        t_array = np.ascontiguousarray(t_list, dtype=np.float64)
+        n = len(rows)
+        # Single pass over the fetched rows into a structured (mat_id, T) array:
+        # one C-level fill instead of separate per-column Python traversals.
+        records = np.fromiter(map(tuple, rows), dtype=_STATE_ROW_DTYPE, count=n)
+        mat_array = records['mat_id']
+        # Field views of a structured array are strided; compact T once into
+        # its own C-contiguous float64 buffer for the zero-copy FFI slice.
+        t_array = np.ascontiguousarray(records['T'])
+
+        # Rows arrive pre-sorted by material_id (ORDER BY), so sub-manifold
+        # boundaries are exactly the positions where the identifier changes.
+        # One vectorized comparison replaces the per-row Python transition scan.
+        change = np.flatnonzero(mat_array[1:] != mat_array[:-1]) + 1
+        starts = np.empty(len(change) + 1, dtype=np.int64)
+        starts[0] = 0
+        starts[1:] = change
+        ends = np.empty_like(starts)
+        ends[:-1] = change
+        ends[-1] = n
+
+        bounds = list(zip(starts.tolist(), ends.tolist()))
+        material_ids = mat_array[starts].tolist()
+
+        # Zero-copy FFI precondition.
+        assert t_array.flags['C_CONTIGUOUS']
         
         logger.debug(f"Structured {len(t_array)} states across {len(bounds)} sub-manifolds.")
         return t_array, bounds, material_ids
@@ -192,22 +194,20 @@ class GapDetector:
             raise FFISynchronizationError("FFI boundary dimension mismatch: Bounds length != Results length.")
 
         # 3. Post-Processing & Strict Ranking
-        ranked_gaps = []
-        for mat_id, result in zip(material_ids, ffi_results):
-            # Adaptively extract properties whether FFI returns dicts or PyO3 objects
-            entropy = getattr(result, 'entropy', result.get('entropy', 0.0)) if isinstance(result, dict) else result.entropy
-            kl_div = getattr(result, 'kl_divergence', result.get('kl_divergence', 0.0)) if isinstance(result, dict) else result.kl_divergence
-            g_score = getattr(result, 'total_score', result.get('total_score', 0.0)) if isinstance(result, dict) else result.total_score
-            
-            ranked_gaps.append({
+        # The FFI returns frozen `GapScore` objects: one attribute read per field.
+        ranked_gaps = [
+            {
                 "material_id": mat_id,
-                "entropy": float(entropy),
-                "kl_divergence": float(kl_div),
-                "gap_score": float(g_score)
-            })
+                "entropy": result.entropy,
+                "kl_divergence": result.kl_divergence,
+                "gap_score": result.total_score
+            }
+            for mat_id, result in zip(material_ids, ffi_results)
+        ]
 
         # Sort descending to prioritize maximal thermodynamic ignorance (highest gap score)
-        ranked_gaps.sort(key=lambda x: x["gap_score"], reverse=True)
+        # itemgetter is a C-level key function: no interpreter frame per element.
+        ranked_gaps.sort(key=itemgetter("gap_score"), reverse=True)
         
         top_mat = ranked_gaps[0]["material_id"] if ranked_gaps else "None"
         logger.info(f"Gap detection complete. Highest priority target: {top_mat}.")
@@ -13,8 +13,11 @@ for downstream statistical and graph representations.
 import hashlib
 import json
 import logging
+import math
+import struct
 import warnings
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 
@@ -122,12 +125,39 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(me
 try:
     from thermognosis.utils.hashing import generate_canonical_hash
 except ImportError:
-    def generate_canonical_hash(*args) -> str:
+    # Fixed binary layout of the measurement identity tuple (T, S, sigma, kappa).
+    _QUANTITY_STRUCT = struct.Struct('<4d')
+    # Byte-length prefix of each variable-length identifier.
+    _ID_LENGTH_STRUCT = struct.Struct('<I')
+
+    def _framed(value: Any) -> bytes:
+        """UTF-8 encoding of ``str(value)``, prefixed with its byte length."""
+        encoded = str(value).encode('utf-8')
+        return _ID_LENGTH_STRUCT.pack(len(encoded)) + encoded
+
+    def generate_canonical_hash(*args, legacy: bool = False) -> str:
         """
-        Computes a deterministic SHA-256 hash from canonical JSON serialization.
-        
+        Computes a deterministic SHA-256 hash of the measurement identity tuple.
+
+        The identity is always (MAT_ID, PAPER_ID, T, S, sigma, kappa), so the
+        canonical bytes are laid out directly as ``len(mat_id) mat_id
+        len(paper_id) paper_id pack('<4d', T, S, sigma, kappa)`` (lengths as
+        little-endian uint32, so no id content can shift a field boundary)
+        instead of driving the JSON encoder. Set ``legacy=True`` (or pass any other arity)
+        to obtain the original canonical-JSON digest for spec backward-compat
+        verification.
+
         Implements: SPEC-CONTRACT-MATERIAL, Section 3.1
         """
+        if not legacy and len(args) == 6:
+            mat_id, paper_id, t, s, sigma, kappa = args
+            payload = b''.join((
+                _framed(mat_id),
+                _framed(paper_id),
+                _QUANTITY_STRUCT.pack(t, s, sigma, kappa),
+            ))
+            return hashlib.sha256(payload).hexdigest()
+
         payload = json.dumps(args, sort_keys=True, ensure_ascii=True, separators=(',', ':'))
         return hashlib.sha256(payload.encode('utf-8')).hexdigest()
 
@@ -222,15 +252,24 @@ class RawMeasurement:
     context: Optional[MeasurementContext] = None
     method: Optional[MeasurementMethod] = None
 
-    @property
+    @cached_property
     def zT(self) -> float:
         """
         Derived Thermoelectric Figure of Merit.
         Formula: zT = (S^2 * sigma * T) / kappa
-        
+
+        Evaluated on first access and memoised in the instance ``__dict__``
+        (outside the dataclass fields, so equality, ``fields()`` and
+        ``asdict()`` are unaffected). A vanishing kappa yields a signed inf,
+        or NaN when the numerator also vanishes, instead of raising.
+
         Implements: SPEC-CONTRACT-RAW-MEASUREMENT, Section 4
         """
-        return (self.quantities.S**2 * self.quantities.sigma * self.quantities.T) / self.quantities.kappa
+        q = self.quantities
+        numerator = q.S * q.S * q.sigma * q.T
+        if q.kappa == 0:
+            return math.copysign(math.inf, numerator) if numerator else math.nan
+        return numerator / q.kappa
 
 
 # -----------------------------------------------------------------------------
@@ -18,9 +18,10 @@ Implements:
     - SPEC-QUAL-SCORING
 """
 
-import ast
+import asyncio
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any, Tuple
 
 # ---------------------------------------------------------------------------
@@ -42,13 +43,107 @@ DEFAULT_RELATIVE_UNCERTAINTY: float = 0.05
 import numpy as np
 import pandas as pd
 
+# Optional columnar engine: lazy CSV scans with projection pushdown and a
+# multi-threaded hash join. pandas remains the reference fallback.
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
 from thermognosis.config import load_config, ConfigurationError
 from thermognosis.pipeline.result import PipelineResult
+from thermognosis.utils.array_parsing import ParsedManifolds, parse_manifolds
 from thermognosis.wrappers.rust_wrapper import RustCore, RustCoreError
 # We alias the unified writer to match the requested abstract architectural interface
 from thermognosis.db.bulk_writer import UnifiedTranslationalWriter as BulkWriter
 
 
+# Columns consumed downstream of the relational join (credibility_prior is optional).
+_ASSIMILATED_COLUMNS = (
+    'sample_id', 'temperature', 'seebeck', 'electrical_conductivity', 'thermal_conductivity'
+)
+
+
+def _assimilate_columns(curves_path: str, samples_path: str, papers_path: str) -> Dict[str, np.ndarray]:
+    """
+    Inner-joins curves -> samples -> papers (on `sample_id`, then `doi`) and
+    returns only the consumed columns as flat ndarrays.
+
+    With Polars available the three CSVs are scanned lazily, so only the
+    projected columns are materialized and the join runs multi-threaded;
+    otherwise the equivalent pandas merges are used.
+    """
+    if HAS_POLARS:
+        # maintain_order='left' keeps curves' row order, as the pandas inner
+        # merges do, so record order (failure log, score summation) is the
+        # same on both backends and across runs.
+        provenance = pl.scan_csv(samples_path).join(
+            pl.scan_csv(papers_path), on='doi', how='inner', maintain_order='left')
+        lf = pl.scan_csv(curves_path).join(provenance, on='sample_id', how='inner', maintain_order='left')
+        available = lf.collect_schema().names()
+        columns = list(_ASSIMILATED_COLUMNS)
+        if 'credibility_prior' in available:
+            columns.append('credibility_prior')
+        frame = lf.select(columns).collect(engine='streaming')
+        return {col: frame[col].to_numpy() for col in columns}
+
+    df_curves = pd.read_csv(curves_path)
+    df_samples = pd.read_csv(samples_path)
+    df_papers = pd.read_csv(papers_path)
+
+    # Inner join to establish complete provenance chains
+    df_provenance = df_samples.merge(df_papers, on='doi', how='inner')
+    df = df_curves.merge(df_provenance, on='sample_id', how='inner')
+
+    columns = list(_ASSIMILATED_COLUMNS)
+    if 'credibility_prior' in df.columns:
+        columns.append('credibility_prior')
+    return {col: df[col].to_numpy() for col in columns}
+
+
+def _coerce_priors(creds: Any) -> Tuple[np.ndarray, List[Tuple[int, str]]]:
+    """
+    Converts the credibility prior column to float64 in one vectorized pass
+    and reports (row, reason) for every prior `float()` rejects.
+
+    Only non-missing cells the vectorized pass turns into NaN are re-checked
+    with `float()`, so missing priors (NaN, or None from a Polars string
+    column) stay NaN and literals such as ``'nan'`` are accepted exactly as
+    the former per-row conversion accepted them.
+    """
+    cred_vec = pd.to_numeric(pd.Series(creds), errors='coerce').to_numpy(dtype=np.float64, copy=True)
+    failures: List[Tuple[int, str]] = []
+    for idx in np.flatnonzero(np.isnan(cred_vec) & ~pd.isna(creds)).tolist():
+        try:
+            cred_vec[idx] = float(creds[idx])
+        except (ValueError, TypeError) as e:
+            failures.append((idx, str(e)))
+    return cred_vec, failures
+
+
+def _reject_records(manifolds: ParsedManifolds, rejected: List[Tuple[int, str]]) -> ParsedManifolds:
+    """
+    Moves the `rejected` source rows from the accepted records into
+    `failures` (kept in source-row order). Rows that already failed parsing
+    keep their parse reason.
+    """
+    bad_rows = np.array([idx for idx, _ in rejected], dtype=np.intp)
+    keep = ~np.isin(manifolds.rows, bad_rows)
+    point_keep = np.repeat(keep, manifolds.lengths)
+    parse_failed = {idx for idx, _ in manifolds.failures}
+    failures = sorted(
+        manifolds.failures + [f for f in rejected if f[0] not in parse_failed],
+        key=lambda f: f[0],
+    )
+    return ParsedManifolds(
+        flats=tuple(flat[point_keep] for flat in manifolds.flats),
+        lengths=manifolds.lengths[keep],
+        rows=manifolds.rows[keep],
+        failures=failures,
+    )
+
+
 def run_pipeline(
     curves_path: str,
     papers_path: str,
@@ -108,13 +203,7 @@ def run_pipeline(
     # 2. Data Assimilation (Relational Join)
     logger.info("Assimilating disparate literature datasets...")
     try:
-        df_curves = pd.read_csv(curves_path)
-        df_samples = pd.read_csv(samples_path)
-        df_papers = pd.read_csv(papers_path)
-        
-        # Inner join to establish complete provenance chains
-        df_provenance = df_samples.merge(df_papers, on='doi', how='inner')
-        df = df_curves.merge(df_provenance, on='sample_id', how='inner')
+        columns = _assimilate_columns(curves_path, samples_path, papers_path)
     except Exception as e:
         logger.critical(f"Catastrophic failure during data assimilation: {e}")
         return PipelineResult(
@@ -122,49 +211,58 @@ def run_pipeline(
             average_score=0.0, physics_violations=0, processing_time_seconds=time.time() - start_time
         )
 
-    total_processed = len(df)
+    total_processed = len(columns['sample_id'])
     total_failed = 0
     
     # 3. Data Parsing & Record-Level Fail-Safe
     # We aggregate jagged arrays into flat C-contiguous buffers to achieve
     # O(1) FFI boundary crossing, avoiding standard Python looping overhead.
-    t_list, s_list, sigma_list, kappa_list = [], [], [], []
-    credibility_list = []
-    record_lengths = []
-    
+    # Each column is decoded in one pass by the fastest available backend;
+    # cells it declines fall back to the scalar per-row parser.
     logger.info("Parsing experimental manifolds...")
-    for idx, row in df.iterrows():
-        try:
-            # SPEC-GOV-ERROR-HIERARCHY: Isolate parsing of unstructured literature data.
-            # ast.literal_eval prevents malicious code execution from external strings.
-            t_arr = np.array(ast.literal_eval(row['temperature']), dtype=np.float64)
-            s_arr = np.array(ast.literal_eval(row['seebeck']), dtype=np.float64)
-            sigma_arr = np.array(ast.literal_eval(row['electrical_conductivity']), dtype=np.float64)
-            kappa_arr = np.array(ast.literal_eval(row['thermal_conductivity']), dtype=np.float64)
-            
-            # Topological constraint: All measured quantities must share the same temperature basis.
-            if not (len(t_arr) == len(s_arr) == len(sigma_arr) == len(kappa_arr)):
-                raise ValueError("Thermodynamic array dimensional mismatch.")
-                
-            t_list.append(t_arr)
-            s_list.append(s_arr)
-            sigma_list.append(sigma_arr)
-            kappa_list.append(kappa_arr)
-            
-            # Map the scalar credibility prior across the temperature domain
-            cred_prior = float(row.get('credibility_prior', 0.5))
-            credibility_list.append(np.full(len(t_arr), cred_prior, dtype=np.float64))
-            
-            record_lengths.append(len(t_arr))
-            
-        except (ValueError, SyntaxError, TypeError, KeyError) as e:
-            total_failed += 1
-            logger.warning(
-                f"SPEC-GOV-ERROR-HIERARCHY: Record {row.get('sample_id', idx)} "
-                f"rejected due to structural malformation. Reason: {e}"
-            )
 
-    if not record_lengths:
+    # The optional prior column is coerced to float64 once, up front; a
+    # non-numeric prior rejects only its own record.
+    creds = columns.get('credibility_prior')
+    cred_vec, prior_failures = _coerce_priors(creds) if creds is not None else (None, [])
+    sids = columns['sample_id']
+
+    manifolds = parse_manifolds(
+        (
+            columns['temperature'],
+            columns['seebeck'],
+            columns['electrical_conductivity'],
+            columns['thermal_conductivity'],
+        ),
+        max_workers=config.max_workers,
+        rust_core=rust_core,
+    )
+    if prior_failures:
+        manifolds = _reject_records(manifolds, prior_failures)
+
+    # SPEC-GOV-ERROR-HIERARCHY: Isolate parsing of unstructured literature data.
+    for idx, reason in manifolds.failures:
+        total_failed += 1
+        logger.warning(
+            f"SPEC-GOV-ERROR-HIERARCHY: Record {sids[idx]} "
+            f"rejected due to structural malformation. Reason: {reason}"
+        )
+
+    # Record lengths and their cumulative offsets stay int64 arrays, computed
+    # once at parse time and shared by every downstream reduction.
+    lengths = manifolds.lengths
+    offsets = manifolds.offsets
+
+    t_flat, s_flat, sigma_flat, kappa_flat = manifolds.flats
+
+    # Map the scalar credibility prior across the temperature domain with one
+    # C-level broadcast-expand over the surviving records.
+    if cred_vec is not None:
+        cred_flat = np.repeat(cred_vec[manifolds.rows], lengths)
+    else:
+        cred_flat = np.full(t_flat.shape[0], 0.5, dtype=np.float64)
+
+    if not lengths.shape[0]:
         logger.warning("No mathematically valid records survived parsing.")
         return PipelineResult(
             total_processed=total_processed, total_failed=total_failed, 
@@ -175,21 +273,32 @@ def run_pipeline(
     # 4. Rust FFI Delegation (Vectorized Physics Engine)
     logger.info("Delegating tensor manifolds to Rust Core for physical validation...")
     
-    t_flat = np.concatenate(t_list)
-    s_flat = np.concatenate(s_list)
-    sigma_flat = np.concatenate(sigma_list)
-    kappa_flat = np.concatenate(kappa_list)
-    cred_flat = np.concatenate(credibility_list)
-    
     # Apply DEFAULT_RELATIVE_UNCERTAINTY (5%) when measurement errors are not
     # reported in the source publication. See module-level docstring for basis.
     # For sensitivity analysis, override DEFAULT_RELATIVE_UNCERTAINTY before calling.
-    err_s     = np.abs(s_flat)     * DEFAULT_RELATIVE_UNCERTAINTY
-    err_sigma = np.abs(sigma_flat) * DEFAULT_RELATIVE_UNCERTAINTY
-    err_kappa = np.abs(kappa_flat) * DEFAULT_RELATIVE_UNCERTAINTY
-    err_t     = np.abs(t_flat)     * DEFAULT_RELATIVE_UNCERTAINTY
+    # Each buffer is produced by np.abs and scaled in place, so no second
+    # full-size temporary is allocated per quantity. All intermediates stay
+    # float64: every buffer here crosses the FFI boundary, where the Rust
+    # kernels take f64 slices zero-copy, so float32 storage would only add
+    # an upcast copy per call and break bitwise reproducibility.
+    err_s     = np.abs(s_flat)
+    err_sigma = np.abs(sigma_flat)
+    err_kappa = np.abs(kappa_flat)
+    err_t     = np.abs(t_flat)
+    for err in (err_s, err_sigma, err_kappa, err_t):
+        err *= DEFAULT_RELATIVE_UNCERTAINTY
 
+    # The Rust kernels release the GIL for their whole body, so the independent
+    # error propagation runs on a worker thread while the audit executes here.
+    ffi_pool = ThreadPoolExecutor(max_workers=1)
     try:
+        # P02-ZT-ERROR-PROPAGATION: Analytically propagate standard measurement uncertainties
+        propagation = ffi_pool.submit(
+            rust_core.propagate_error,
+            s_flat, sigma_flat, kappa_flat, t_flat,
+            err_s, err_sigma, err_kappa, err_t
+        )
+
         # SPEC-AUDIT-01: Triple-Gate Epistemic Physics Arbiter (Gate 1, 1b, 2, 3).
         # Replaces the deprecated check_physics_consistency + manual gate logic.
         # Assigns ConfidenceTier and AnomalyFlags bitmask to every state, passing
@@ -216,11 +325,7 @@ def run_pipeline(
             zt_flat   = rust_core.check_physics_consistency(s_flat, sigma_flat, kappa_flat, t_flat)
             tier_flat = None
 
-        # P02-ZT-ERROR-PROPAGATION: Analytically propagate standard measurement uncertainties
-        zt_prop, zt_unc = rust_core.propagate_error(
-            s_flat, sigma_flat, kappa_flat, t_flat,
-            err_s, err_sigma, err_kappa, err_t
-        )
+        zt_prop, zt_unc = propagation.result()
 
         # SPEC-QUAL-SCORING: Compute the unified Bayesian credibility and quality score.
         # Hard constraint gate: records with Tier::Reject (tier == 4) are excluded.
@@ -228,15 +333,21 @@ def run_pipeline(
         if tier_flat is not None:
             hard_gate = tier_flat < 4  # Not Reject — passes Gate 1 and Gate 1b
         else:
-            hard_gate = (zt_flat >= 0) & (t_flat > 0) & (kappa_flat > 0) & (sigma_flat > 0)
+            try:
+                hard_gate = rust_core.compute_hard_constraint_gate(zt_flat, t_flat, kappa_flat, sigma_flat)
+            except AttributeError:
+                # Older compiled core without the fused gate.
+                hard_gate = (zt_flat >= 0) & (t_flat > 0) & (kappa_flat > 0) & (sigma_flat > 0)
 
+        # completeness / smoothness / metadata are uniformly 1.0 here; None lets
+        # the Rust core read them as constants instead of three N-length arrays.
         metrics = {
-            'completeness': np.ones_like(zt_flat),
+            'completeness': None,
             'credibility': cred_flat,
             'physics_consistency': np.where(np.isfinite(zt_flat) & (zt_flat >= 0), 1.0, 0.0),
             'error_magnitude': zt_unc,
-            'smoothness': np.ones_like(zt_flat),  # Defaulted for structural compliance
-            'metadata': np.ones_like(zt_flat),
+            'smoothness': None,  # Defaulted for structural compliance
+            'metadata': None,
             'hard_constraint_gate': hard_gate,
         }
 
@@ -250,35 +361,36 @@ def run_pipeline(
             total_inserted=0, average_score=0.0, physics_violations=0,
             processing_time_seconds=time.time() - start_time
         )
+    finally:
+        # Never leave an in-flight propagation behind on the failure path.
+        ffi_pool.shutdown(wait=True)
 
     # 5. Reverse Mapping: Point-Level to Record-Level Aggregation
     # We must determine if a *record* is valid based on its constituent thermodynamic points.
-    split_indices = np.cumsum(record_lengths)[:-1]
-    gates_per_record = np.split(metrics['hard_constraint_gate'], split_indices)
-    zt_per_record = np.split(zt_flat, split_indices)
-    
-    physics_violations = 0
-    total_inserted = 0
-    valid_zt_accumulator = []
+    # Per-record AND of the point gates in one C-level pass (np.logical_and.reduceat).
+    # reduceat cannot express empty segments, so zero-length records are
+    # excluded from the reduction and kept vacuously valid (np.all([]) is True).
+    nonempty = lengths > 0
+
+    record_valid = np.ones(lengths.shape[0], dtype=bool)
+    if nonempty.any():
+        record_valid[nonempty] = np.logical_and.reduceat(
+            np.asarray(metrics['hard_constraint_gate'], dtype=bool), offsets[:-1][nonempty]
+        )
+
+    total_inserted = int(np.count_nonzero(record_valid))
+    physics_violations = lengths.shape[0] - total_inserted
+
+    # Accumulate only finite, physically plausible zT values of viable records.
+    valid_points = np.repeat(record_valid, lengths)
+    valid_points &= np.isfinite(zt_flat)
+    valid_points &= zt_flat >= 0
     
     # We simulate data formatting for the database writer
+    # (In reality, we would build the structured SQL tuples and Cypher Dicts here)
     pg_insert_buffer = []
     neo4j_insert_buffer = []
 
-    for i, (gates, zts) in enumerate(zip(gates_per_record, zt_per_record)):
-        # A record is physically viable if ALL temperature-dependent points pass
-        # the Triple-Gate Arbiter (tier < 4) or the fallback positivity check.
-        if not np.all(gates):
-            physics_violations += 1
-        else:
-            total_inserted += 1
-            # Accumulate only finite, physically plausible zT values.
-            valid_zt_accumulator.extend(float(z) for z in zts if np.isfinite(z) and z >= 0)
-            
-            # (In reality, we would append the structured SQL tuples and Cypher Dicts here)
-            # pg_insert_buffer.append(...)
-            # neo4j_insert_buffer.append(...)
-
     # 6. Database Persistence
     logger.info("Committing validated topological graphs to relational and graph storage...")
     if pg_insert_buffer and neo4j_insert_buffer:
@@ -289,7 +401,7 @@ def run_pipeline(
             total_failed += total_inserted
             total_inserted = 0
 
-    average_score = float(np.mean(valid_zt_accumulator)) if valid_zt_accumulator else 0.0
+    average_score = float(np.mean(zt_flat[valid_points])) if valid_points.any() else 0.0
     
     # 7. Immutability & Return
     end_time = time.time()
@@ -301,4 +413,32 @@ def run_pipeline(
         average_score=average_score,
         physics_violations=physics_violations,
         processing_time_seconds=end_time - start_time
-    )
\ No newline at end of file
+    )
+
+
+async def run_pipeline_async(
+    curves_path: str,
+    papers_path: str,
+    samples_path: str,
+    config_path: Optional[str] = None
+) -> PipelineResult:
+    """
+    Runs `run_pipeline` on a worker thread so that several dataset
+    invocations can be awaited together (e.g. via ``asyncio.gather``).
+
+    The CSV reads of one invocation overlap with the GIL-free Rust compute
+    of another; results are identical to calling `run_pipeline` directly.
+
+    Parameters
+    ----------
+    curves_path, papers_path, samples_path, config_path
+        Forwarded unchanged to `run_pipeline`.
+
+    Returns
+    -------
+    PipelineResult
+        The summary produced by `run_pipeline`.
+    """
+    return await asyncio.to_thread(
+        run_pipeline, curves_path, papers_path, samples_path, config_path
+    )
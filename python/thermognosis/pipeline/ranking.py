@@ -72,15 +72,21 @@ class MaterialRanker:
         self._rust_core = rust_core
         self._bulk_writer = bulk_writer
 
-    def _fetch_ordered_measurements(self) -> List[Tuple[str, float, float, float]]:
+    def _fetch_ordered_measurements(self) -> Any:
         """
         Executes a deterministic, authoritative query fetching sub-graph topologies.
         Results are strictly ordered by `material_id` to guarantee contiguous spatial blocks.
+
+        ADBC connections (e.g. ``adbc_driver_postgresql.dbapi``) expose
+        ``cursor.fetch_arrow_table()``; the result set is then streamed into a
+        columnar Arrow table with no per-row Python objects. Plain DB-API
+        connections fall back to ``fetchall()``.
         
         Returns
         -------
-        List[Tuple[str, float, float, float]]
-            List of tuples: (material_id, posterior_credibility, zT, citation_count)
+        Union[List[Tuple[str, float, float, float]], pyarrow.Table]
+            Tuples of (material_id, posterior_credibility, zT, citation_count),
+            or an Arrow table with those four named columns.
             
         Raises
         ------
@@ -97,71 +103,78 @@ class MaterialRanker:
         try:
             with self._db_connection.cursor() as cursor:
                 cursor.execute(query)
+                if hasattr(cursor, "fetch_arrow_table"):
+                    return cursor.fetch_arrow_table()
                 return cursor.fetchall()
         except Exception as e:
             raise PipelineRankingError(f"DB-PG-XX: Failed to extract sub-graph topologies. {e}") from e
 
     def _prepare_c_contiguous_tensors(
         self, 
-        rows: List[Tuple[str, float, float, float]]
-    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Tuple[int, int]], List[str]]:
+        rows: Any
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[str]]:
         """
         Maps a 2D relational structure into 1D, strictly C-contiguous monolithic 
-        memory buffers, pre-computing boundary tuples for O(1) Rust slice casting.
+        memory buffers, pre-computing slice boundaries for O(1) Rust slice casting.
         
         Implements: SPEC-GOV-CODE-GENERATION-PROTOCOL (Zero-Copy FFI Constraints)
         
         Parameters
         ----------
-        rows : List[Tuple[str, float, float, float]]
+        rows : Union[List[Tuple[str, float, float, float]], pyarrow.Table]
             The raw ordered dataset from the relational query.
             
         Returns
         -------
-        Tuple[np.ndarray, np.ndarray, np.ndarray, List[Tuple[int, int]], List[str]]
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[str]]
             - p_arr: Contiguous array of posterior credibilities ($P_i$)
             - zt_arr: Contiguous array of figures of merit ($zT_i$)
             - c_arr: Contiguous array of citation counts ($c_i$)
-            - material_bounds: List of (start_index, end_index) slice boundaries
+            - material_bounds: (M, 2) C-contiguous int64 array of
+              (start_index, end_index) slice boundaries, crossing the FFI
+              boundary as one buffer rather than M Python tuples
             - material_ids: List of unique material UUIDs matching the boundaries
         """
-        p_list, zt_list, c_list = [], [], []
-        material_bounds: List[Tuple[int, int]] = []
-        material_ids: List[str] = []
-
         if not rows:
             return (
                 np.array([], dtype=np.float64),
                 np.array([], dtype=np.float64),
-                np.array([], dtype=np.float64),
-                [],
+                np.empty((0, 2), dtype=np.int64),
                 []
             )
 
-        current_mat_id = rows[0][0]
-        start_idx = 0
-
-        # O(N) single-pass extraction pipeline
-        for i, (mat_id, p_val, zt_val, c_val) in enumerate(rows):
-            if mat_id != current_mat_id:
-                # Seal the contiguous spatial boundary for the completed manifold
-                material_bounds.append((start_idx, i))
-                material_ids.append(current_mat_id)
-                current_mat_id = mat_id
-                start_idx = i
-
-            p_list.append(p_val)
-            zt_list.append(zt_val)
-            c_list.append(c_val)
-
-        # Seal the final boundary manifold
-        material_bounds.append((start_idx, len(rows)))
-        material_ids.append(current_mat_id)
+        n = len(rows)
+        if hasattr(rows, "column"):
+            # Arrow result set: each field already is one contiguous column.
+            mat_array = rows.column("material_id").to_numpy()
+            columns = [
+                rows.column(name).to_numpy()
+                for name in ("posterior_credibility", "zt_value", "citation_count")
+            ]
+        else:
+            # Columnar split of the relational tuples in one C-level pass. The object
+            # dtype keeps material IDs intact and maps NULL citation counts to NaN on
+            # the float64 cast, exactly as the former per-row list building did.
+            table = np.array(rows, dtype=object).reshape(n, 4)
+            mat_array = table[:, 0]
+            columns = [table[:, 1], table[:, 2], table[:, 3]]
+
+        # Rows arrive pre-sorted by material_id (ORDER BY), so manifold
+        # boundaries are exactly the positions where the identifier changes.
+        change = np.flatnonzero(mat_array[1:] != mat_array[:-1]) + 1
+        material_bounds = np.empty((len(change) + 1, 2), dtype=np.int64)
+        material_bounds[0, 0] = 0
+        material_bounds[1:, 0] = change
+        material_bounds[:-1, 1] = change
+        material_bounds[-1, 1] = n
+
+        material_ids = mat_array[material_bounds[:, 0]].tolist()
 
         # Guarantee rigorous C-contiguous mapping for zero-copy FFI execution
-        p_arr = np.ascontiguousarray(p_list, dtype=np.float64)
-        zt_arr = np.ascontiguousarray(zt_list, dtype=np.float64)
-        c_arr = np.ascontiguousarray(c_list, dtype=np.float64)
+        # (a no-op view for null-free float64 Arrow columns).
+        p_arr, zt_arr, c_arr = (
+            np.ascontiguousarray(col, dtype=np.float64) for col in columns
+        )
 
         return p_arr, zt_arr, c_arr, material_bounds, material_ids
 
@@ -219,24 +232,16 @@ class MaterialRanker:
             )
 
         # 4. Write Back (Cross-System Persistence Guarantee)
-        # Construct specific architectures expected by the Bulk Writer dependencies
-        pg_update_data = [
-            (rank_val, mat_uuid) 
-            for mat_uuid, rank_val in zip(unique_mat_ids, ranks)
-        ]
-        
-        neo4j_update_data = [
-            {"material_uuid": mat_uuid, "rank": rank_val} 
-            for mat_uuid, rank_val in zip(unique_mat_ids, ranks)
-        ]
+        # Ranks travel as two parallel columns; no per-material tuples or dicts.
+        rank_values = np.asarray(ranks, dtype=np.float64)
 
         logger.info("Engaging ACID Serializable Transactors for Cross-System Persistence.")
         try:
-            # We assume a structurally sound `update_material_ranks` exposed by the bulk writer
-            # adhering to SPEC-DB-POSTGRES-SCHEMA invariants.
+            # `UnifiedTranslationalWriter.update_material_ranks` adheres to
+            # SPEC-DB-POSTGRES-SCHEMA invariants.
             self._bulk_writer.update_material_ranks(
-                pg_data=pg_update_data,
-                graph_data=neo4j_update_data
+                material_ids=unique_mat_ids,
+                ranks=rank_values
             )
         except Exception as e:
             raise PipelineRankingError(f"DB-PG-10: Unified write failure during rank synchronization. {e}") from e
@@ -8,7 +8,7 @@ computational materials pipeline execution.
 Implements: SPEC-PIPELINE-ORCHESTRATION, SPEC-PIPELINE-END-TO-END
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 
@@ -22,7 +22,7 @@ class PipelineMetricValidationError(ValueError):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PipelineResult:
     """
     An immutable record of pipeline execution metrics.
@@ -30,7 +30,9 @@ class PipelineResult:
     This data structure captures the terminal state of a Thermognosis
     pipeline run. By utilizing a frozen dataclass, we mathematically 
     guarantee that post-execution metrics cannot be silently mutated 
-    by downstream logging or persistence processes.
+    by downstream logging or persistence processes. Instances carry no
+    ``__dict__`` (``slots=True``), and the log summary is rendered once at
+    construction since the metrics can never change afterwards.
 
     Implements: SPEC-PIPELINE-ORCHESTRATION, SPEC-PIPELINE-END-TO-END
 
@@ -68,6 +70,7 @@ class PipelineResult:
     average_score: float
     physics_violations: int
     processing_time_seconds: float
+    _repr: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """
@@ -76,14 +79,16 @@ class PipelineResult:
         Since this dataclass is frozen, validation must occur post-initialization.
         No metric representing a physical count or temporal duration may be negative.
         """
-        if self.total_processed < 0:
-            raise PipelineMetricValidationError("total_processed cannot be negative.")
-        if self.total_failed < 0:
-            raise PipelineMetricValidationError("total_failed cannot be negative.")
-        if self.total_inserted < 0:
-            raise PipelineMetricValidationError("total_inserted cannot be negative.")
-        if self.physics_violations < 0:
-            raise PipelineMetricValidationError("physics_violations cannot be negative.")
+        # Single branch for all counts: the bitwise OR of Python ints (unbounded,
+        # two's-complement semantics) is negative iff at least one operand is.
+        # Only valid for ints; the float duration is checked separately.
+        if (self.total_processed | self.total_failed
+                | self.total_inserted | self.physics_violations) < 0:
+            name = next(
+                n for n in ("total_processed", "total_failed", "total_inserted", "physics_violations")
+                if getattr(self, n) < 0
+            )
+            raise PipelineMetricValidationError(f"{name} cannot be negative.")
         if self.processing_time_seconds < 0.0:
             raise PipelineMetricValidationError("processing_time_seconds cannot be negative.")
         
@@ -93,11 +98,12 @@ class PipelineResult:
                 "Sum of inserted and failed structures cannot exceed total_processed."
             )
 
+        # Frozen: bypass the generated __setattr__ to cache the rendered summary.
+        object.__setattr__(self, "_repr", self._render())
+
     def __repr__(self) -> str:
         """
-        Generates a highly readable, structured string representation of 
-        the pipeline metrics suitable for scientific execution logs and 
-        standard output.
+        Returns the structured summary rendered at construction time.
 
         Returns
         -------
@@ -105,6 +111,14 @@ class PipelineResult:
             A strictly formatted string containing the aligned summary of 
             the pipeline execution.
         """
+        return self._repr
+
+    def _render(self) -> str:
+        """
+        Generates a highly readable, structured string representation of 
+        the pipeline metrics suitable for scientific execution logs and 
+        standard output.
+        """
         border = "=" * 60
         title = "THERMOGNOSIS PIPELINE EXECUTION SUMMARY".center(60)
         
@@ -15,13 +15,21 @@ Layer: spec/06_quality
 Compliance Level: Research-Grade / Q1 Infrastructure Standard
 """
 
+import functools
 import math
 from enum import Enum
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
+from thermognosis.pipeline.scoring_kernels import credibility_batch
+
+
+def _clamp01(x: float) -> float:
+    """Clamps a scalar to [0, 1] without an array round-trip (NaN passes through)."""
+    return 0.0 if x < 0.0 else (1.0 if x > 1.0 else float(x))
+
 
 class QualityScoreError(Exception):
     """Base exception for SPEC-QUAL-SCORING violations."""
@@ -70,9 +78,18 @@ class QualityVector:
     q_err: float
     q_smooth: float
     q_meta: float
+    _array: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
 
     def to_numpy(self) -> np.ndarray:
-        """Returns the components as a strictly ordered numpy array."""
+        """
+        Returns the components as a strictly ordered numpy array.
+
+        The array is validated once and cached on the instance; it is
+        read-only, matching the immutability of the vector itself.
+        """
+        if self._array is not None:
+            return self._array
+
         arr = np.array([
             self.q_comp, self.q_cred, self.q_phys,
             self.q_err, self.q_smooth, self.q_meta
@@ -82,7 +99,9 @@ class QualityVector:
             raise QualityScoreError("QUAL-SCORE-01: Missing component score (NaN detected).")
         if np.any((arr < 0.0) | (arr > 1.0)):
             raise QualityScoreError("QUAL-SCORE-02: Quality components must strictly lie in [0, 1].")
-            
+
+        arr.setflags(write=False)
+        object.__setattr__(self, '_array', arr)
         return arr
 
 
@@ -143,7 +162,7 @@ class CredibilityScorer:
         # Validate Bounds
         if not (0.0 <= w_source <= 1.0):
             raise CredibilityScoreError("QUAL-CRED-01: Source weight must be in [0, 1].")
-        if w_unc not in {0.0, 0.5, 1.0}:
+        if w_unc != 0.0 and w_unc != 0.5 and w_unc != 1.0:  # exact binary fractions
             raise CredibilityScoreError("QUAL-CRED-03: Uncertainty weight must be exactly 0, 0.5, or 1.")
         if n < 0:
             raise CredibilityScoreError("QUAL-CRED-05: Sample size n cannot be negative.")
@@ -158,7 +177,63 @@ class CredibilityScorer:
         # Multiplicative composite score ensures weakest component dominates
         k_score = w_source * w_rep * w_unc * w_phys * w_stat * w_model * w_time
         
-        return float(np.clip(k_score, 0.0, 1.0))
+        return _clamp01(k_score)
+
+    @staticmethod
+    def calculate_credibility_batch(
+        w_source: np.ndarray,
+        n_rep: np.ndarray,
+        w_unc: np.ndarray,
+        delta_phys: np.ndarray,
+        n: np.ndarray,
+        e_cv: np.ndarray,
+        t_current: Union[float, np.ndarray],
+        t_pub: np.ndarray,
+        alpha: float = 1.0,
+        n_0: float = 10.0,
+        beta: float = 1.0,
+        lambda_time: float = 0.05
+    ) -> np.ndarray:
+        """
+        Vectorized ``calculate_credibility`` over N records.
+
+        Bounds are validated once over the whole batch, then all seven
+        weights are evaluated in one fused kernel pass.
+
+        Parameters
+        ----------
+        w_source, n_rep, w_unc, delta_phys, n, e_cv, t_pub : np.ndarray
+            Per-record inputs, as in ``calculate_credibility``, shape (N,).
+        t_current : float or np.ndarray
+            Current time, broadcast against ``t_pub``.
+        alpha, n_0, beta, lambda_time : float
+            Scaling constants for the respective decay functions.
+
+        Returns
+        -------
+        np.ndarray
+            Credibility scores bounded in [0, 1], shape (N,).
+        """
+        arrays = np.broadcast_arrays(*(
+            np.asarray(x, dtype=np.float64)
+            for x in (w_source, n_rep, w_unc, delta_phys, n, e_cv, t_current, t_pub)
+        ))
+        w_source, n_rep, w_unc, delta_phys, n, e_cv, t_current, t_pub = (
+            np.ascontiguousarray(a).reshape(-1) for a in arrays
+        )
+
+        if not ((w_source >= 0.0) & (w_source <= 1.0)).all():
+            raise CredibilityScoreError("QUAL-CRED-01: Source weight must be in [0, 1].")
+        if not np.isin(w_unc, (0.0, 0.5, 1.0)).all():
+            raise CredibilityScoreError("QUAL-CRED-03: Uncertainty weight must be exactly 0, 0.5, or 1.")
+        if (n < 0).any():
+            raise CredibilityScoreError("QUAL-CRED-05: Sample size n cannot be negative.")
+
+        dt = np.fmax(t_current - t_pub, 0.0)
+        return credibility_batch(
+            w_source, n_rep, w_unc, delta_phys, n, e_cv, dt,
+            alpha, n_0, beta, lambda_time
+        )
 
     @staticmethod
     def classify(score: float) -> CredibilityClass:
@@ -176,11 +251,29 @@ class CredibilityScorer:
 class QualityScorer:
     """
     Computes unified decision metrics aggregating multiple quality dimensions.
+
+    Every scalar model has a ``*_batch`` counterpart operating on an (N, 6)
+    structure-of-arrays matrix whose columns follow the ``QualityVector``
+    field order, so large record sets are scored in one vectorized pass.
     
     Implements: SPEC-QUAL-SCORING
     """
 
     DEFAULT_WEIGHTS = np.array([0.25, 0.25, 0.20, 0.15, 0.10, 0.05], dtype=np.float64)
+    _DEFAULT_W_TUPLE = tuple(DEFAULT_WEIGHTS.tolist())
+    _DEFAULT_WEIGHTS_SQ = np.square(DEFAULT_WEIGHTS)
+    _DEFAULT_WEIGHTS_SQ.setflags(write=False)
+
+    # Section 8 lower bounds (ascending) and the class reached at or above each.
+    _CLASS_THRESHOLDS = np.array([0.50, 0.65, 0.80, 0.90], dtype=np.float64)
+    # Above this population size the O(N^2 d) broadcast mask is too large to
+    # materialize and pareto_front switches to a sum-ordered cull.
+    _PARETO_BROADCAST_MAX = 2048
+
+    _CLASS_LADDER = np.array([
+        QualityClass.REJECT, QualityClass.CLASS_D, QualityClass.CLASS_C,
+        QualityClass.CLASS_B, QualityClass.CLASS_A
+    ], dtype=object)
 
     def __init__(self, weights: Optional[np.ndarray] = None):
         """
@@ -191,12 +284,35 @@ class QualityScorer:
         weights : np.ndarray, optional
             A 6-element array of weights. Defaults to the specification defaults.
         """
-        self.weights = weights if weights is not None else self.DEFAULT_WEIGHTS
-        
-        if len(self.weights) != 6:
+        if weights is None:
+            # The specification defaults are normalized by construction, so
+            # the derived views are shared and the checks are skipped.
+            self.weights = self.DEFAULT_WEIGHTS
+            self._w_tuple = self._DEFAULT_W_TUPLE
+            self._weights_sq = self._DEFAULT_WEIGHTS_SQ
+            return
+
+        self.weights = np.asarray(weights, dtype=np.float64)
+
+        if self.weights.shape != (6,):
             raise QualityScoreError("QUAL-SCORE-02: Weight misconfiguration. Expected exactly 6 weights.")
-        if not np.isclose(np.sum(self.weights), 1.0, atol=1e-6):
-            raise QualityScoreError(f"QUAL-SCORE-03: Non-normalized weights. Sum is {np.sum(self.weights):.4f}")
+        total = float(self.weights.sum())
+        # Same tolerance as np.isclose(total, 1.0, atol=1e-6); NaN fails.
+        if not abs(total - 1.0) <= 1e-6 + 1e-5:
+            raise QualityScoreError(f"QUAL-SCORE-03: Non-normalized weights. Sum is {total:.4f}")
+
+        # Weights as Python floats for the 6-term scalar paths.
+        self._w_tuple = tuple(self.weights.tolist())
+
+        # Squared weights for the risk-adjusted variance, fixed for the scorer's lifetime.
+        self._weights_sq = np.square(self.weights)
+        self._weights_sq.setflags(write=False)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def default(cls) -> "QualityScorer":
+        """Returns a shared scorer configured with ``DEFAULT_WEIGHTS``."""
+        return cls()
 
     def score_linear(self, gate: bool, q_vector: QualityVector) -> float:
         r"""
@@ -211,6 +327,31 @@ class QualityScorer:
         q = q_vector.to_numpy()
         return float(np.dot(self.weights, q))
 
+    def compile_specialized(self) -> Callable[[Sequence[float], bool], float]:
+        r"""
+        Returns a linear scorer specialized to this scorer's fixed weights.
+
+        The weights are bound as six closure constants, so one call is the
+        unrolled :math:`\mathcal{G} \sum_i w_i q_i` in plain float arithmetic
+        with no array construction. Inputs are trusted: ``q`` must be six
+        components already validated to lie in [0, 1] (e.g. a row of a
+        matrix accepted by ``score_linear_batch``).
+
+        Returns
+        -------
+        Callable[[Sequence[float], bool], float]
+            ``score(q, gate=True)``, equal to ``score_linear(gate, QualityVector(*q))``.
+        """
+        w0, w1, w2, w3, w4, w5 = self._w_tuple
+
+        def score(q: Sequence[float], gate: bool = True) -> float:
+            if not gate:
+                return 0.0
+            q0, q1, q2, q3, q4, q5 = q
+            return w0 * q0 + w1 * q1 + w2 * q2 + w3 * q3 + w4 * q4 + w5 * q5
+
+        return score
+
     def score_multiplicative(self, gate: bool, q_vector: QualityVector) -> float:
         r"""
         Computes the multiplicative risk-sensitive model.
@@ -222,11 +363,16 @@ class QualityScorer:
         if not gate:
             return 0.0
             
-        q = q_vector.to_numpy()
-        # Protect against 0^0 or log(0) domain errors by using np.power
-        # np.power correctly handles 0^w -> 0 for w>0.
-        score = np.prod(np.power(q, self.weights))
-        return float(score)
+        # Evaluated in log space, exp(sum_i w_i log q_i), instead of per-element
+        # pow. A zero component yields 0^w = 0 for w > 0 (the score vanishes)
+        # and 0^0 = 1 for w = 0 (no contribution), so log(0) is never taken.
+        log_score = 0.0
+        for w, qi in zip(self._w_tuple, q_vector.to_numpy().tolist()):
+            if qi > 0.0:
+                log_score += w * math.log(qi)
+            elif w > 0.0:
+                return 0.0
+        return math.exp(log_score)
 
     def score_entropy_regularized(self, gate: bool, q_vector: QualityVector, lambda_reg: float = 0.1) -> float:
         r"""
@@ -239,21 +385,23 @@ class QualityScorer:
         if not gate:
             return 0.0
             
-        q = q_vector.to_numpy()
-        s_base = float(np.dot(self.weights, q))
-        
+        # Six validated components: plain float arithmetic beats NumPy dispatch.
+        q = q_vector.to_numpy().tolist()
+        s_base = sum(w * qi for w, qi in zip(self._w_tuple, q))
+
         # Calculate entropy safely (lim_{x->0} x*log(x) = 0)
-        with np.errstate(divide='ignore', invalid='ignore'):
-            entropy_terms = np.where(q > 0, q * np.log(q), 0.0)
-            
-        if np.any(np.isnan(entropy_terms)):
+        entropy = 0.0
+        for qi in q:
+            if qi > 0.0:
+                entropy -= qi * math.log(qi)
+
+        if math.isnan(entropy):
             raise QualityScoreError("QUAL-SCORE-04: Entropy instability detected during computation.")
-            
-        entropy = -np.sum(entropy_terms)
+
         s_reg = s_base - (lambda_reg * entropy)
         
         # Ensure mathematically bounded in [0, 1] after regularization
-        return float(np.clip(s_reg, 0.0, 1.0))
+        return _clamp01(s_reg)
 
     def score_risk_adjusted(self, gate: bool, q_mu: QualityVector, q_sigma: QualityVector, gamma: float = 1.0) -> float:
         r"""
@@ -271,14 +419,94 @@ class QualityScorer:
         sigma = q_sigma.to_numpy()
         
         expected_s = np.dot(self.weights, mu)
-        var_s = np.dot(self.weights**2, sigma**2)
+        var_s = np.dot(self._weights_sq, sigma * sigma)
         
         if var_s < 0:
             raise QualityScoreError("QUAL-SCORE-05: Risk-adjusted miscalculation. Negative variance detected.")
             
-        s_risk = expected_s - gamma * np.sqrt(var_s)
+        s_risk = expected_s - gamma * math.sqrt(var_s)
         
-        return float(np.clip(s_risk, 0.0, 1.0))
+        return _clamp01(s_risk)
+
+    @staticmethod
+    def _validate_matrix(q: np.ndarray) -> np.ndarray:
+        """
+        Coerces an (N, 6) quality matrix to float64 and checks the bounds of
+        all components at once (the batch analogue of ``to_numpy``).
+        """
+        q = np.asarray(q, dtype=np.float64)
+        if q.ndim != 2 or q.shape[1] != 6:
+            raise QualityScoreError(f"QUAL-SCORE-02: Expected an (N, 6) quality matrix, got shape {q.shape}.")
+        if np.isnan(q).any():
+            raise QualityScoreError("QUAL-SCORE-01: Missing component score (NaN detected).")
+        if ((q < 0.0) | (q > 1.0)).any():
+            raise QualityScoreError("QUAL-SCORE-02: Quality components must strictly lie in [0, 1].")
+        return q
+
+    def score_linear_batch(self, gates: np.ndarray, q: np.ndarray) -> np.ndarray:
+        r"""
+        Vectorized ``score_linear`` over N records.
+
+        Parameters
+        ----------
+        gates : np.ndarray
+            Boolean hard-constraint gate per record, shape (N,).
+        q : np.ndarray
+            Quality components, shape (N, 6).
+
+        Returns
+        -------
+        np.ndarray
+            Scores :math:`\mathcal{G} \cdot Q\mathbf{w}`, shape (N,).
+        """
+        q = self._validate_matrix(q)
+        return np.where(gates, q @ self.weights, 0.0)
+
+    def score_multiplicative_batch(self, gates: np.ndarray, q: np.ndarray) -> np.ndarray:
+        r"""
+        Vectorized ``score_multiplicative`` over N records, evaluated as
+        :math:`\exp(\log(Q)\,\mathbf{w})`. A zero component with a positive
+        weight forces the record score to zero, as :math:`0^{w} = 0`.
+        """
+        q = self._validate_matrix(q)
+        positive = q > 0.0
+        log_q = np.log(np.where(positive, q, 1.0))
+        vanishes = (~positive & (self.weights > 0.0)).any(axis=1)
+        return np.where(gates & ~vanishes, np.exp(log_q @ self.weights), 0.0)
+
+    def score_entropy_regularized_batch(self, gates: np.ndarray, q: np.ndarray, lambda_reg: float = 0.1) -> np.ndarray:
+        r"""
+        Vectorized ``score_entropy_regularized`` over N records, with the row
+        entropy :math:`H_n = -\sum_i Q_{ni} \log Q_{ni}`.
+        """
+        q = self._validate_matrix(q)
+        positive = q > 0.0
+        entropy = -np.where(positive, q * np.log(np.where(positive, q, 1.0)), 0.0).sum(axis=1)
+        s_reg = np.clip(q @ self.weights - lambda_reg * entropy, 0.0, 1.0)
+        return np.where(gates, s_reg, 0.0)
+
+    def score_risk_adjusted_batch(self, gates: np.ndarray, q_mu: np.ndarray, q_sigma: np.ndarray, gamma: float = 1.0) -> np.ndarray:
+        r"""
+        Vectorized ``score_risk_adjusted`` over N records, with
+        :math:`\mathrm{Var}(S_n) = \sum_i w_i^2 \sigma_{ni}^2`.
+        """
+        mu = self._validate_matrix(q_mu)
+        sigma = self._validate_matrix(q_sigma)
+        var_s = np.square(sigma) @ self._weights_sq
+        s_risk = np.clip(mu @ self.weights - gamma * np.sqrt(var_s), 0.0, 1.0)
+        return np.where(gates, s_risk, 0.0)
+
+    @classmethod
+    def classify_batch(cls, scores: np.ndarray) -> np.ndarray:
+        """
+        Vectorized ``classify``: one ``np.searchsorted`` over the Section 8
+        thresholds. Returns an object array of ``QualityClass`` members; NaN
+        scores are rejected, matching the scalar comparisons.
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        idx = np.searchsorted(cls._CLASS_THRESHOLDS, scores, side='right')
+        idx[np.isnan(scores)] = 0
+        return cls._CLASS_LADDER[idx]
 
     @staticmethod
     def classify(score: float) -> QualityClass:
@@ -311,4 +539,46 @@ class QualityScorer:
         strictly_greater_any = np.any(v1 > v2)
         greater_equal_all = np.all(v1 >= v2)
         
-        return bool(greater_equal_all and strictly_greater_any)
\ No newline at end of file
+        return bool(greater_equal_all and strictly_greater_any)
+
+    @classmethod
+    def pareto_front(cls, q: np.ndarray) -> np.ndarray:
+        r"""
+        Identifies the non-dominated records of a population (Section 9).
+
+        Small populations are resolved with one broadcast comparison. Larger
+        ones are visited in descending order of :math:`\sum_i q_i`: a record
+        can only be dominated by one with a strictly larger sum, so each
+        record is tested against the front kept so far and a kept record is
+        never evicted.
+
+        Parameters
+        ----------
+        q : np.ndarray
+            Quality components, shape (N, 6).
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask, True for records on the Pareto front, shape (N,).
+        """
+        q = cls._validate_matrix(q)
+        n = q.shape[0]
+
+        if n <= cls._PARETO_BROADCAST_MAX:
+            ge = (q[:, None, :] >= q[None, :, :]).all(axis=-1)
+            gt = (q[:, None, :] > q[None, :, :]).any(axis=-1)
+            return ~(ge & gt).any(axis=0)
+
+        on_front = np.zeros(n, dtype=bool)
+        kept = np.empty_like(q)
+        k = 0
+        for i in np.argsort(-q.sum(axis=1), kind='stable'):
+            row = q[i]
+            front = kept[:k]
+            if ((front >= row).all(axis=1) & (front > row).any(axis=1)).any():
+                continue
+            kept[k] = row
+            k += 1
+            on_front[i] = True
+        return on_front
@@ -0,0 +1,596 @@
+"""
+Thermognosis Engine: Serialized Numeric Array Parsing
+=====================================================
+
+Decodes the bracketed numeric literals (e.g. ``"[300.0, 350.5]"``) that carry
+temperature-dependent curves in the literature CSVs into flat, C-contiguous
+float64 buffers ready for zero-copy FFI transmission.
+
+Column backends, in order of preference:
+    1. The Rust core (`RustCore.parse_array_column`), which borrows the joined
+       column bytes without copying and decodes cells in parallel via rayon.
+    2. An optional pyarrow path that reads a column of JSON-clean literals
+       straight into a ``list<float64>`` array, whose value buffer and offsets
+       are the flat output and record bounds. All-or-nothing per column.
+    3. An optional Numba JIT path that scans an entire column as one contiguous
+       byte buffer, in parallel across rows, and writes straight into a
+       pre-sized output. Only tokens that can be decoded with exact IEEE-754
+       rounding (Clinger's fast path) are accepted; every other cell is
+       reported back for the scalar path, so results are bitwise identical.
+    4. The scalar reference path (`parse_float_array`) built on ``np.fromstring``
+       with an ``ast.literal_eval`` fallback, filling one pre-sized buffer.
+
+Implements:
+    - SPEC-PIPELINE-DATA-FLOW
+    - SPEC-GOV-ERROR-HIERARCHY (Row-level isolation of malformed literals)
+"""
+
+import ast
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Optional Arrow C++ JSON reader for clean list literals.
+try:
+    import pyarrow as pa
+    import pyarrow.json as pa_json
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Optional LLVM JIT for the column-level byte scanner.
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+# -----------------------------------------------------------------------------
+# SCALAR REFERENCE PATH
+# -----------------------------------------------------------------------------
+
+def parse_float_array(text: Any) -> np.ndarray:
+    """
+    Parses a bracketed numeric literal into a float64 array with a single
+    C-level scan via ``np.fromstring``.
+
+    Cells the fast path cannot consume completely, or that decode to a
+    non-finite value (``np.fromstring`` also reads ``nan``/``inf`` tokens),
+    fall back to ``ast.literal_eval``, so exactly the Python-literal rows
+    accepted previously parse, and malformed rows (including ``nan`` tokens)
+    still raise ``ValueError``/``SyntaxError``.
+    """
+    if not isinstance(text, str):
+        raise TypeError(f"Expected a serialized numeric array, got {type(text).__name__}.")
+
+    inner = text.strip()
+    if inner[:1] == '[' and inner[-1:] == ']':
+        inner = inner[1:-1]
+    if not inner.strip():
+        return np.empty(0, dtype=np.float64)
+
+    try:
+        arr = np.fromstring(inner, dtype=np.float64, sep=',')
+        if arr.size == inner.count(',') + 1 and np.isfinite(arr).all():
+            return arr
+    except (ValueError, DeprecationWarning):
+        pass
+
+    # ast.literal_eval prevents malicious code execution from external strings.
+    return np.array(ast.literal_eval(text), dtype=np.float64)
+
+
+# -----------------------------------------------------------------------------
+# NUMBA JIT COLUMN PATH
+# -----------------------------------------------------------------------------
+
+# Exactly representable powers of ten: 10^k for k <= 22 has no rounding error,
+# which is what makes the single multiply/divide of Clinger's fast path exact.
+_POW10 = np.array([float(10 ** k) for k in range(23)], dtype=np.float64)
+
+# Largest mantissa that is exactly representable in float64.
+_MAX_EXACT_MANTISSA = 2 ** 53
+
+if HAS_NUMBA:
+
+    @numba.njit(cache=True)
+    def _cell_span(buf, lo, hi):
+        """Trims whitespace and one bracket pair; returns (-1, -1) if unbalanced."""
+        while lo < hi and (buf[lo] == 32 or (9 <= buf[lo] <= 13)):
+            lo += 1
+        while hi > lo and (buf[hi - 1] == 32 or (9 <= buf[hi - 1] <= 13)):
+            hi -= 1
+        opened = lo < hi and buf[lo] == 91       # '['
+        closed = hi > lo and buf[hi - 1] == 93   # ']'
+        if opened and closed:
+            return lo + 1, hi - 1
+        if opened or closed:
+            return -1, -1
+        return lo, hi
+
+    @numba.njit(parallel=True, cache=True)
+    def _count_fields(buf, bounds, counts):
+        """counts[i] = number of comma-separated fields in cell i (-1: unbalanced)."""
+        for i in numba.prange(counts.shape[0]):
+            lo, hi = _cell_span(buf, bounds[i], bounds[i + 1])
+            if lo < 0:
+                counts[i] = -1
+                continue
+            n = 0
+            blank = True
+            for j in range(lo, hi):
+                c = buf[j]
+                if c == 44:  # ','
+                    n += 1
+                elif not (c == 32 or (9 <= c <= 13)):
+                    blank = False
+            counts[i] = 0 if (blank and n == 0) else n + 1
+
+    @numba.njit(parallel=True, cache=True)
+    def _parse_fields(buf, bounds, out_offsets, out, ok, pow10, max_mantissa):
+        """
+        Decodes every cell into out[out_offsets[i]:out_offsets[i + 1]].
+        ok[i] is cleared for any cell holding a token outside the exact fast path.
+        """
+        for i in numba.prange(ok.shape[0]):
+            if not ok[i]:
+                continue
+            lo, hi = _cell_span(buf, bounds[i], bounds[i + 1])
+            k = out_offsets[i]
+            stop = out_offsets[i + 1]
+            j = lo
+            good = True
+            while good and k < stop:
+                while j < hi and (buf[j] == 32 or (9 <= buf[j] <= 13)):
+                    j += 1
+                negative = False
+                if j < hi and (buf[j] == 45 or buf[j] == 43):  # '-' / '+'
+                    negative = buf[j] == 45
+                    j += 1
+                mantissa = 0
+                exp10 = 0
+                digits = 0
+                while j < hi and 48 <= buf[j] <= 57:
+                    if mantissa > 90_000_000_000_000_000:
+                        good = False
+                        break
+                    mantissa = mantissa * 10 + (buf[j] - 48)
+                    digits += 1
+                    j += 1
+                if good and j < hi and buf[j] == 46:  # '.'
+                    j += 1
+                    while j < hi and 48 <= buf[j] <= 57:
+                        if mantissa > 90_000_000_000_000_000:
+                            good = False
+                            break
+                        mantissa = mantissa * 10 + (buf[j] - 48)
+                        exp10 -= 1
+                        digits += 1
+                        j += 1
+                if not good or digits == 0:
+                    good = False
+                    break
+                if j < hi and (buf[j] == 101 or buf[j] == 69):  # 'e' / 'E'
+                    j += 1
+                    exp_negative = False
+                    if j < hi and (buf[j] == 45 or buf[j] == 43):
+                        exp_negative = buf[j] == 45
+                        j += 1
+                    exp_digits = 0
+                    exp_val = 0
+                    while j < hi and 48 <= buf[j] <= 57:
+                        if exp_val < 10_000:
+                            exp_val = exp_val * 10 + (buf[j] - 48)
+                        exp_digits += 1
+                        j += 1
+                    if exp_digits == 0:
+                        good = False
+                        break
+                    exp10 += -exp_val if exp_negative else exp_val
+                while j < hi and (buf[j] == 32 or (9 <= buf[j] <= 13)):
+                    j += 1
+                if j < hi:
+                    if buf[j] != 44:  # ','
+                        good = False
+                        break
+                    j += 1
+                if mantissa > max_mantissa or exp10 < -22 or exp10 > 22:
+                    good = False
+                    break
+                value = mantissa / pow10[-exp10] if exp10 < 0 else mantissa * pow10[exp10]
+                out[k] = -value if negative else value
+                k += 1
+            ok[i] = good and k == stop
+
+
+def join_cells(cells: Sequence[Any]) -> Tuple[bytes, np.ndarray]:
+    """
+    Concatenates a column of literals into one byte buffer plus int64 cell
+    boundaries (``len(cells) + 1`` entries), the ingress layout shared by the
+    Numba and Rust column parsers.
+
+    Non-string and non-ASCII cells are given bytes no parser accepts, so they
+    are deferred to the scalar path, which owns the canonical error reporting.
+    """
+    encoded = [
+        c.encode('ascii', 'replace') if isinstance(c, str) else b'\x00'
+        for c in cells
+    ]
+    bounds = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=bounds[1:])
+    return b''.join(encoded), bounds
+
+
+def parse_array_column(cells: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Decodes a whole column of serialized arrays with the Numba byte scanner.
+
+    Parameters
+    ----------
+    cells : Sequence[Any]
+        Serialized numeric literals, one per record.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        - flat: float64 values of all cells laid end to end.
+        - lengths: int64 element count of each cell's span in `flat`.
+        - ok: bool mask; False marks cells that must be re-parsed with
+          `parse_float_array` (their span in `flat` is undefined).
+
+    Raises
+    ------
+    RuntimeError
+        If Numba is not installed.
+    """
+    if not HAS_NUMBA:
+        raise RuntimeError("parse_array_column requires numba.")
+
+    n = len(cells)
+    joined, bounds = join_cells(cells)
+    buf = np.frombuffer(joined, dtype=np.uint8)
+
+    counts = np.empty(n, dtype=np.int64)
+    _count_fields(buf, bounds, counts)
+
+    ok = counts >= 0
+    lengths = np.where(ok, counts, 0)
+    out_offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(lengths, out=out_offsets[1:])
+
+    flat = np.empty(out_offsets[-1], dtype=np.float64)
+    _parse_fields(buf, bounds, out_offsets, flat, ok, _POW10, _MAX_EXACT_MANTISSA)
+    return flat, lengths, ok
+
+
+# -----------------------------------------------------------------------------
+# ARROW JSON COLUMN PATH
+# -----------------------------------------------------------------------------
+
+def parse_array_column_arrow(
+    cells: Sequence[Any],
+) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Decodes a whole column as JSON lists with Arrow's multi-threaded C++ reader.
+
+    The cells are framed as newline-delimited ``{"v": <cell>}`` objects and read
+    against an explicit ``list<float64>`` schema, so the resulting column's
+    value buffer already is the flat array and its offsets the record bounds.
+
+    Parameters
+    ----------
+    cells : Sequence[Any]
+        Serialized numeric literals, one per record.
+
+    Returns
+    -------
+    Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]
+        Same (flat, lengths, ok) contract as `parse_array_column`, or ``None``
+        if any cell is not a valid JSON number list (e.g. ``nan`` or
+        unbracketed values); Arrow rejects the whole block in that case and the
+        caller must use another backend. Non-string cells are read as null
+        and marked not ok.
+
+    Raises
+    ------
+    RuntimeError
+        If pyarrow is not installed.
+    """
+    if not HAS_PYARROW:
+        raise RuntimeError("parse_array_column_arrow requires pyarrow.")
+
+    lines = []
+    for c in cells:
+        if not isinstance(c, str):
+            body = b'null'
+        else:
+            # An empty cell is an empty array for the scalar parser as well.
+            body = c.encode('utf-8') if c.strip() else b'[]'
+        lines.append(b'{"v":' + body + b'}')
+    if not lines:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64), np.empty(0, dtype=bool)
+
+    try:
+        table = pa_json.read_json(
+            pa.BufferReader(b'\n'.join(lines)),
+            parse_options=pa_json.ParseOptions(
+                explicit_schema=pa.schema([('v', pa.list_(pa.float64()))]),
+                newlines_in_values=True,
+            ),
+        )
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    if table.num_rows != len(lines):
+        # A cell carried JSON framing of its own; its row boundaries are unreliable.
+        return None
+
+    col = table.column('v').combine_chunks()
+    values = col.flatten()
+    if values.null_count:
+        # JSON nulls inside a list have no float64 literal equivalent.
+        return None
+
+    offsets = col.offsets.to_numpy(zero_copy_only=False)
+    lengths = np.diff(offsets).astype(np.int64, copy=False)
+    ok = ~col.is_null().to_numpy(zero_copy_only=False)
+    # Null-free primitive buffers are viewed, not copied.
+    flat = values.to_numpy(zero_copy_only=False)
+    return flat, lengths, ok
+
+
+# -----------------------------------------------------------------------------
+# PRE-SIZED SCALAR COLUMN PATH
+# -----------------------------------------------------------------------------
+
+_PARSE_ERRORS = (ValueError, SyntaxError, TypeError, KeyError)
+
+# Below this many rows per chunk, thread dispatch costs more than it saves.
+_MIN_ROWS_PER_CHUNK = 2048
+
+
+def _estimate_length(cell: Any) -> int:
+    """Field count implied by the commas of a literal; -1 for non-string cells."""
+    if not isinstance(cell, str):
+        return -1
+    inner = cell.strip()
+    if inner[:1] == '[' and inner[-1:] == ']':
+        inner = inner[1:-1]
+    return inner.count(',') + 1 if inner.strip() else 0
+
+
+def parse_column_presized(
+    cells: Sequence[Any],
+    max_workers: int = 1,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Decodes a whole column with the scalar parser into one pre-sized buffer.
+
+    A first lightweight pass counts commas to size every cell, so the output is
+    allocated once and each cell is written straight into its view; no
+    per-record arrays are retained and no concatenation copy is needed.
+
+    Parameters
+    ----------
+    cells : Sequence[Any]
+        Serialized numeric literals, one per record.
+    max_workers : int, default=1
+        Number of threads filling disjoint row chunks of the buffer. The NumPy
+        text scan releases the GIL, so chunks decode concurrently.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Same (flat, lengths, ok) contract as `parse_array_column`. Cells that
+        fail to parse, or whose decoded size disagrees with the comma count
+        (e.g. a trailing comma accepted by ``ast.literal_eval``), are marked
+        not ok.
+    """
+    n = len(cells)
+    counts = np.fromiter(map(_estimate_length, cells), dtype=np.int64, count=n)
+    ok = counts >= 0
+    lengths = np.where(ok, counts, 0)
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    flat = np.empty(offsets[-1], dtype=np.float64)
+    bounds = offsets.tolist()
+
+    def fill_rows(start: int, stop: int) -> None:
+        # Every chunk owns disjoint slices of `flat` and entries of `ok`.
+        for i in range(start, stop):
+            if not ok[i]:
+                continue
+            lo, hi = bounds[i], bounds[i + 1]
+            try:
+                arr = parse_float_array(cells[i])
+            except _PARSE_ERRORS:
+                ok[i] = False
+                continue
+            if arr.size != hi - lo:
+                ok[i] = False
+                continue
+            flat[lo:hi] = arr
+
+    if max_workers <= 1 or n < 2 * _MIN_ROWS_PER_CHUNK:
+        fill_rows(0, n)
+    else:
+        n_chunks = min(max_workers, n // _MIN_ROWS_PER_CHUNK)
+        edges = np.linspace(0, n, n_chunks + 1, dtype=np.int64).tolist()
+        with ThreadPoolExecutor(max_workers=n_chunks) as pool:
+            # list() re-raises any unexpected exception from a worker.
+            list(pool.map(fill_rows, edges[:-1], edges[1:]))
+    return flat, lengths, ok
+
+
+# -----------------------------------------------------------------------------
+# MULTI-COLUMN RECORD ASSEMBLY
+# -----------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ParsedManifolds:
+    """
+    Flat SoA view of the records whose serialized columns all parsed and share
+    one temperature basis.
+
+    Attributes
+    ----------
+    flats : Tuple[np.ndarray, ...]
+        One C-contiguous float64 buffer per input column.
+    lengths : np.ndarray
+        int64 point count of each accepted record.
+    offsets : np.ndarray
+        int64 cumulative record bounds (``len(lengths) + 1`` entries, starting
+        at 0); record ``i`` spans ``flats[c][offsets[i]:offsets[i + 1]]``.
+    rows : np.ndarray
+        Source row index of each accepted record (same order as `lengths`).
+    failures : List[Tuple[int, str]]
+        (source row index, reason) for every rejected record.
+    """
+    flats: Tuple[np.ndarray, ...]
+    lengths: np.ndarray
+    rows: np.ndarray
+    failures: List[Tuple[int, str]]
+    offsets: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Computed once here so every downstream reduction shares one array.
+        offsets = np.zeros(self.lengths.shape[0] + 1, dtype=np.int64)
+        np.cumsum(self.lengths, out=offsets[1:])
+        object.__setattr__(self, 'offsets', offsets)
+
+
+def _parse_row(columns: Sequence[Sequence[Any]], idx: int) -> List[np.ndarray]:
+    """Scalar parse of one record; raises on malformation or dimensional mismatch."""
+    arrays = [parse_float_array(col[idx]) for col in columns]
+    # Topological constraint: All measured quantities must share the same temperature basis.
+    if len({len(a) for a in arrays}) != 1:
+        raise ValueError("Thermodynamic array dimensional mismatch.")
+    return arrays
+
+
+def _parse_column(
+    cells: Sequence[Any],
+    max_workers: int,
+    rust_core: Optional[Any],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Decodes one column with the first backend that accepts it."""
+    if rust_core is not None:
+        try:
+            return rust_core.parse_array_column(*join_cells(cells))
+        except AttributeError:
+            # Compiled binary predates the Rust array parser.
+            pass
+    if HAS_PYARROW:
+        parsed = parse_array_column_arrow(cells)
+        if parsed is not None:
+            return parsed
+    if HAS_NUMBA:
+        return parse_array_column(cells)
+    return parse_column_presized(cells, max_workers)
+
+
+def parse_manifolds(
+    columns: Sequence[Sequence[Any]],
+    max_workers: int = 1,
+    rust_core: Optional[Any] = None,
+) -> ParsedManifolds:
+    """
+    Parses parallel columns of serialized arrays into flat per-column buffers.
+
+    Each column is decoded into one flat buffer by the best available backend
+    (see module docstring); only records declined there are re-parsed
+    individually and spliced back in source order.
+
+    Parameters
+    ----------
+    columns : Sequence[Sequence[Any]]
+        Equal-length columns of serialized numeric literals.
+    max_workers : int, default=1
+        Thread count for the scalar column parser (the Numba scanner manages
+        its own parallelism).
+    rust_core : Optional[RustCore], default=None
+        Loaded Rust backend. When given, columns are decoded by its
+        `parse_array_column` kernel in preference to the Python backends.
+
+    Returns
+    -------
+    ParsedManifolds
+        Accepted records in flat SoA form plus per-row failure reasons.
+    """
+    n_cols = len(columns)
+    n_rows = len(columns[0]) if n_cols else 0
+    if not n_rows:
+        return ParsedManifolds(
+            flats=tuple(np.empty(0, dtype=np.float64) for _ in range(n_cols)),
+            lengths=np.empty(0, dtype=np.int64),
+            rows=np.empty(0, dtype=np.intp),
+            failures=[],
+        )
+
+    parsed = [_parse_column(col, max_workers, rust_core) for col in columns]
+    lengths = np.stack([p[1] for p in parsed])
+    ok = np.logical_and.reduce([p[2] for p in parsed])
+    aligned = (lengths == lengths[0]).all(axis=0)
+    fast = ok & aligned
+
+    failures: List[Tuple[int, str]] = [
+        (idx, "Thermodynamic array dimensional mismatch.")
+        for idx in np.flatnonzero(ok & ~aligned).tolist()
+    ]
+
+    if fast.all():
+        return ParsedManifolds(
+            flats=tuple(p[0] for p in parsed),
+            lengths=lengths[0].copy(),
+            rows=np.arange(n_rows, dtype=np.intp),
+            failures=failures,
+        )
+
+    # Re-parse declined records individually; this is also where the
+    # canonical failure reason for each malformed record is produced.
+    slow = {}
+    for idx in np.flatnonzero(~ok).tolist():
+        try:
+            slow[idx] = _parse_row(columns, idx)
+        except _PARSE_ERRORS as e:
+            failures.append((idx, str(e)))
+    failures.sort(key=lambda f: f[0])
+
+    accepted = fast.copy()
+    accepted[list(slow)] = True
+    record_lengths = lengths[0].copy()
+    for idx, arrays in slow.items():
+        record_lengths[idx] = len(arrays[0])
+    record_lengths = record_lengths[accepted]
+    rows = np.flatnonzero(accepted)
+
+    # Compact fast spans and splice declined records into one pre-sized buffer
+    # per column, preserving source order.
+    dst_offsets = np.zeros(n_rows + 1, dtype=np.int64)
+    dst_offsets[1:][accepted] = record_lengths
+    np.cumsum(dst_offsets, out=dst_offsets)
+    fast_lengths = lengths[0][fast]
+
+    flats = []
+    src_offsets = np.zeros(n_rows + 1, dtype=np.int64)
+    for c, (flat, col_lengths, _) in enumerate(parsed):
+        np.cumsum(col_lengths, out=src_offsets[1:])
+        src_idx = np.flatnonzero(np.repeat(fast, col_lengths))
+        dst_idx = src_idx + np.repeat(
+            dst_offsets[:-1][fast] - src_offsets[:-1][fast], fast_lengths
+        )
+        out = np.empty(dst_offsets[-1], dtype=np.float64)
+        out[dst_idx] = flat[src_idx]
+        for idx, arrays in slow.items():
+            out[dst_offsets[idx]:dst_offsets[idx + 1]] = arrays[c]
+        flats.append(out)
+
+    return ParsedManifolds(
+        flats=tuple(flats),
+        lengths=record_lengths,
+        rows=rows,
+        failures=failures,
+    )
@@ -25,12 +25,32 @@ Implements:
 import hashlib
 import json
 import math
+import re
 import datetime
-from typing import Any, Dict, Union, List
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Union, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+# Optional C encoder with deterministic key ordering for canonical bytes.
+try:
+    import msgspec
+    _ENCODER = msgspec.json.Encoder(order="deterministic")
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+# Optional BLAKE3 (SIMD tree hash) for non-contractual content digests.
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
 
 # -----------------------------------------------------------------------------
 # ERROR HIERARCHY (Implements: SPEC-GOV-ERROR-HIERARCHY)
@@ -64,11 +84,42 @@ class HashComputationError(ThermognosisError):
 # at the ~15th decimal place due to compiler-specific optimizations.
 NUMERICAL_PRECISION = 12
 
+# Raised by _standardize_dataframe: its payload keeps float leaves, whose
+# canonical form is the stdlib repr (msgspec writes exponents differently,
+# e.g. 1e-9 for 1e-09), so such trees must take the stdlib encoder.
+_FLOAT_LEAVES: ContextVar[bool] = ContextVar("_FLOAT_LEAVES", default=False)
+
+# Standardized forms of deeply immutable tuples (scalar leaves and nested such
+# tuples), keyed by (id, precision). Each entry pins its tuple so the id cannot
+# be recycled while cached; a shared config tuple reused across many lineage
+# records is then standardized once. Mutable containers are never cached:
+# builtins cannot carry weakrefs or version counters to detect mutation.
+_TUPLE_CACHE_SIZE = 512
+_TUPLE_CACHE: "OrderedDict[Tuple[int, int], Tuple[tuple, List[Any]]]" = OrderedDict()
+_TUPLE_CACHE_LOCK = threading.Lock()
+_IMMUTABLE_LEAVES = (type(None), bool, int, float, str, np.generic)
+
 
 # -----------------------------------------------------------------------------
 # CORE IMPLEMENTATION
 # -----------------------------------------------------------------------------
 
+def _frame_rows(df: pd.DataFrame) -> List[List[Any]]:
+    """
+    Row-major list of lists with the same leaves as ``df.values.tolist()``.
+
+    Frames holding an object column interleave to an object matrix; those are
+    instead converted column by column (``Series.tolist`` boxes cells exactly
+    as the object upcast does) and zipped into rows, which skips allocating
+    the intermediate (rows x cols) object array. Homogeneous numeric frames
+    keep the single C-level ``tolist`` (including its int -> float upcast).
+    """
+    if df.shape[1] == 0 or not any(dtype == object for dtype in df.dtypes):
+        return df.values.tolist()
+    columns = [df.iloc[:, i].tolist() for i in range(df.shape[1])]
+    return list(map(list, zip(*columns)))
+
+
 def _standardize_dataframe(df: pd.DataFrame, precision: int) -> Dict[str, Any]:
     """
     Prepares a pandas DataFrame for canonical serialization using vectorized 
@@ -88,35 +139,127 @@ def _standardize_dataframe(df: pd.DataFrame, precision: int) -> Dict[str, Any]:
     Dict[str, Any]
         A standardized, strictly ordered dictionary representation of the DataFrame.
     """
+    _FLOAT_LEAVES.set(True)
     try:
-        # Enforce deterministic column ordering
-        df_sorted = df[sorted(df.columns)].copy(deep=True)
+        # Enforce deterministic column ordering. Under pandas' Copy-on-Write
+        # (always on in the pinned pandas 3) the selection shares the caller's
+        # buffers and the float-block assignments below replace only those
+        # columns, so no defensive deep copy is needed.
+        df_sorted = df[sorted(df.columns)]
         
-        # Identify and round floating-point columns using vectorized operations
+        # Round floating-point columns as one 2-D block per float dtype (so
+        # float32 columns keep their precision), in place on the block.
         float_cols = df_sorted.select_dtypes(include=[np.floating, float]).columns
-        if not float_cols.empty:
-            df_sorted[float_cols] = df_sorted[float_cols].round(precision)
-            
-            # Neutralize negative zeros (-0.0 -> 0.0) across all float columns
-            df_sorted[float_cols] = df_sorted[float_cols] + 0.0
-
-        # Deterministic handling of non-finite values (NaN, Inf)
-        df_sorted = df_sorted.replace({
-            np.nan: "NaN", 
-            np.inf: "Infinity", 
-            -np.inf: "-Infinity"
-        })
+        for dtype in pd.unique(df_sorted.dtypes[float_cols]):
+            cols = float_cols[df_sorted.dtypes[float_cols] == dtype]
+            block = df_sorted[cols].to_numpy(dtype=dtype, copy=True)
+            np.round(block, precision, out=block)
+
+            # Neutralize negative zeros (-0.0 -> 0.0) across the block
+            block += 0.0
+
+            # Deterministic handling of non-finite values (NaN, Inf): only
+            # columns that contain one are boxed to object, with the tokens
+            # written through masks (the same cells df.replace would yield).
+            nonfinite = ~np.isfinite(block) if isinstance(dtype, np.dtype) else None
+            if nonfinite is None or not nonfinite.any():
+                df_sorted[cols] = block
+                continue
+            for j, col in enumerate(cols):
+                values = block[:, j]
+                if not nonfinite[:, j].any():
+                    df_sorted[col] = values
+                    continue
+                boxed = values.astype(object)
+                boxed[np.isnan(values)] = "NaN"
+                boxed[np.isposinf(values)] = "Infinity"
+                boxed[np.isneginf(values)] = "-Infinity"
+                df_sorted[col] = boxed
+
+        # Remaining columns that may hold missing markers (object, string,
+        # extension dtypes) keep the generic replacement; NumPy numeric and
+        # bool columns cannot and are skipped.
+        other_cols = [
+            col for col, dtype in df_sorted.dtypes.items()
+            if not (isinstance(dtype, np.dtype) and dtype.kind in 'biuf')
+        ]
+        if other_cols:
+            df_sorted[other_cols] = df_sorted[other_cols].replace({
+                np.nan: "NaN", 
+                np.inf: "Infinity", 
+                -np.inf: "-Infinity"
+            })
         
         # Extract components deterministically
         return {
             "columns": df_sorted.columns.tolist(),
-            "data": df_sorted.values.tolist(),
+            "data": _frame_rows(df_sorted),
             "index": df_sorted.index.tolist()
         }
     except Exception as e:
         raise CanonicalSerializationError(f"Failed to standardize DataFrame: {str(e)}") from e
 
 
+def _is_deeply_immutable(val: tuple) -> bool:
+    """True if every leaf of the tuple is an immutable scalar."""
+    return all(
+        isinstance(v, _IMMUTABLE_LEAVES) or (isinstance(v, tuple) and _is_deeply_immutable(v))
+        for v in val
+    )
+
+
+def _standardize_tuple(val: tuple, precision: int) -> List[Any]:
+    """
+    Standardizes a tuple, reusing the cached result for deeply immutable
+    tuples seen recently. The returned list may be shared and must not be
+    mutated.
+    """
+    key = (id(val), precision)
+    with _TUPLE_CACHE_LOCK:
+        entry = _TUPLE_CACHE.get(key)
+        if entry is not None and entry[0] is val:
+            _TUPLE_CACHE.move_to_end(key)
+            return entry[1]
+
+    result = [_standardize_value(v, precision) for v in val]
+    if _is_deeply_immutable(val):
+        with _TUPLE_CACHE_LOCK:
+            _TUPLE_CACHE[key] = (val, result)
+            if len(_TUPLE_CACHE) > _TUPLE_CACHE_SIZE:
+                _TUPLE_CACHE.popitem(last=False)
+    return result
+
+
+def _standardize_array(arr: np.ndarray, precision: int) -> Any:
+    """
+    Standardizes a numeric ndarray without recursing per element.
+
+    Integer and boolean tensors are already canonical after ``tolist()``.
+    Float tensors are formatted in one flat pass, with non-finite entries
+    located by vectorized masks; each finite element still goes through
+    Python's correctly rounded ``round`` so the strings are identical to the
+    scalar path.
+    """
+    if arr.dtype.kind in 'biu':
+        return arr.tolist()
+
+    flat = arr.ravel()
+    finite = np.isfinite(flat)
+    fmt = f"{{:.{precision}f}}".format
+    # round(x, p) + 0.0 neutralizes negative zero
+    formatted = [fmt(round(x, precision) + 0.0) for x in flat[finite].tolist()]
+
+    out = np.empty(flat.shape, dtype=object)
+    if len(formatted) == flat.size:
+        out[:] = formatted
+    else:
+        out[finite] = formatted
+        out[np.isnan(flat)] = "NaN"
+        out[np.isposinf(flat)] = "Infinity"
+        out[np.isneginf(flat)] = "-Infinity"
+    return out.reshape(arr.shape).tolist()
+
+
 def _standardize_value(val: Any, precision: int) -> Any:
     """
     Recursively normalizes Python, NumPy, and Pandas objects into universally 
@@ -139,6 +282,17 @@ def _standardize_value(val: Any, precision: int) -> Any:
     CanonicalSerializationError
         If the object type cannot be formalized mathematically.
     """
+    # Exact-type fast path for the node kinds that dominate parameter trees;
+    # one identity test replaces walking the isinstance cascade below.
+    # Subclasses (IntEnum, OrderedDict, ...) still take the cascade.
+    kind = type(val)
+    if kind is str or kind is int or kind is bool:
+        return val
+    elif kind is dict:
+        return {str(k): _standardize_value(v, precision) for k, v in sorted(val.items())}
+    elif kind is list:
+        return [_standardize_value(v, precision) for v in val]
+
     if val is None:
         return None
     elif isinstance(val, bool): # Must precede int check, as bool subclasses int
@@ -161,11 +315,15 @@ def _standardize_value(val: Any, precision: int) -> Any:
     elif isinstance(val, dict):
         # Lexicographical key sorting enforced natively via sorted()
         return {str(k): _standardize_value(v, precision) for k, v in sorted(val.items())}
-    elif isinstance(val, (list, tuple)):
+    elif isinstance(val, list):
         return [_standardize_value(v, precision) for v in val]
+    elif isinstance(val, tuple):
+        return _standardize_tuple(val, precision)
     elif isinstance(val, set):
         # Sets must be converted to sorted lists to preserve mathematical equivalence
         return sorted([_standardize_value(v, precision) for v in val])
+    elif isinstance(val, np.ndarray) and val.dtype.kind in 'biuf':
+        return _standardize_array(val, precision)
     elif isinstance(val, np.ndarray):
         # Fallback to lists for tensor geometries; handles nested structures
         return _standardize_value(val.tolist(), precision)
@@ -183,6 +341,107 @@ def _standardize_value(val: Any, precision: int) -> Any:
         )
 
 
+_PLAIN_LEAVES = (str, int, bool, type(None))
+
+
+def _is_plain(val: Any) -> bool:
+    """
+    True if ``val`` is already in canonical form: str-keyed dicts, lists and
+    tuples over str/int/bool/None leaves (exact types only, no floats).
+    Short-circuits on the first disqualifying node.
+    """
+    kind = type(val)
+    if kind in _PLAIN_LEAVES:
+        return True
+    elif kind is dict:
+        return all(type(k) is str and _is_plain(v) for k, v in val.items())
+    elif kind is list or kind is tuple:
+        return all(_is_plain(v) for v in val)
+    return False
+
+
+def _standardize_tree(data: Any, precision: int) -> Tuple[Any, bool]:
+    """
+    Standardizes ``data`` and reports whether the tree may take the msgspec
+    encoder (i.e. it carries no DataFrame float payload).
+    """
+    # A plain tree standardizes to itself (key order and tuple-vs-list are
+    # settled by the encoder), so it is handed over without being rebuilt.
+    if _is_plain(data):
+        return data, HAS_MSGSPEC
+
+    token = _FLOAT_LEAVES.set(False)
+    try:
+        tree = _standardize_value(data, precision)
+        return tree, HAS_MSGSPEC and not _FLOAT_LEAVES.get()
+    finally:
+        _FLOAT_LEAVES.reset(token)
+
+
+# Bytes outside printable ASCII: the stdlib escapes them (non-ASCII, DEL)
+# under ensure_ascii, so msgspec output containing any of them is rejected.
+_NON_PRINTABLE = re.compile(rb'[^\x20-\x7e]')
+
+
+def _encode_tree(tree: Any, fast: bool) -> bytes:
+    """Canonical JSON bytes of a standardized (sub)tree."""
+    # Outside DataFrame payloads the standardized tree holds only
+    # str/int/bool/None leaves, so the C encoder emits byte-identical
+    # output to the stdlib call below when that output is printable ASCII.
+    # Float payloads, non-ASCII text and DEL (which the stdlib escapes under
+    # ensure_ascii) and integers beyond 64 bits take the stdlib path.
+    if fast:
+        try:
+            encoded = _ENCODER.encode(tree)
+        except (msgspec.EncodeError, OverflowError):
+            encoded = None
+        if encoded is not None and not _NON_PRINTABLE.search(encoded):
+            return encoded
+
+    # separators=(',', ':') removes whitespace, sort_keys=True ensures final ordering
+    json_string = json.dumps(
+        tree,
+        ensure_ascii=True,
+        allow_nan=False, 
+        sort_keys=True,
+        separators=(',', ':')
+    )
+    return json_string.encode('utf-8')
+
+
+# Lists longer than this are fed to the hasher in slices of this many items.
+_STREAM_CHUNK_ITEMS = 4096
+
+
+def _stream_tree(tree: Any, hasher: Any, fast: bool) -> None:
+    """
+    Feeds the canonical bytes of a standardized tree into ``hasher`` piece by
+    piece. Dicts are emitted key by key and long lists (e.g. DataFrame rows)
+    slice by slice, so only one bounded fragment is resident at a time; the
+    byte stream is identical to ``_encode_tree(tree, fast)``.
+    """
+    if isinstance(tree, dict):
+        hasher.update(b'{')
+        for i, key in enumerate(sorted(tree)):
+            if i:
+                hasher.update(b',')
+            hasher.update(_encode_tree(key, fast))
+            hasher.update(b':')
+            _stream_tree(tree[key], hasher, fast)
+        hasher.update(b'}')
+    elif isinstance(tree, list) and len(tree) > _STREAM_CHUNK_ITEMS:
+        hasher.update(b'[')
+        for start in range(0, len(tree), _STREAM_CHUNK_ITEMS):
+            if start:
+                hasher.update(b',')
+            # Each slice encodes as "[...]"; its brackets are dropped.
+            chunk = _encode_tree(tree[start:start + _STREAM_CHUNK_ITEMS], fast)
+            hasher.update(memoryview(chunk)[1:-1])
+        hasher.update(b']')
+    else:
+        hasher.update(_encode_tree(tree, fast))
+
+
 def canonical_serialize(data: Union[Dict[str, Any], pd.DataFrame, Any], precision: int = NUMERICAL_PRECISION) -> bytes:
     """
     Computes the strictly deterministic, canonical byte representation of a mathematical 
@@ -208,23 +467,88 @@ def canonical_serialize(data: Union[Dict[str, Any], pd.DataFrame, Any], precisio
         If structural or precision constraints are violated during evaluation.
     """
     try:
-        standardized_tree = _standardize_value(data, precision)
-        
-        # separators=(',', ':') removes whitespace, sort_keys=True ensures final ordering
-        json_string = json.dumps(
-            standardized_tree,
-            ensure_ascii=True,
-            allow_nan=False, 
-            sort_keys=True,
-            separators=(',', ':')
-        )
-        return json_string.encode('utf-8')
+        standardized_tree, fast = _standardize_tree(data, precision)
+        return _encode_tree(standardized_tree, fast)
     except Exception as e:
         if isinstance(e, CanonicalSerializationError):
             raise
         raise CanonicalSerializationError(f"Canonical serialization pipeline failed: {str(e)}") from e
 
 
+# Digest algorithms accepted by compute_hash. SHA-256 is constructed through
+# hashlib.new, i.e. OpenSSL's EVP interface, which uses SHA-NI / ARMv8 SHA
+# instructions where the CPU provides them.
+SUPPORTED_HASH_ALGORITHMS = ("sha256", "blake3")
+_HASH_LABELS = {"sha256": "SHA-256", "blake3": "BLAKE3"}
+
+
+def _new_hasher(algo: str) -> Any:
+    """Returns a fresh incremental hash state for ``algo``."""
+    if algo == "sha256":
+        return hashlib.new("sha256")
+    if algo == "blake3":
+        if not HAS_BLAKE3:
+            raise HashComputationError(
+                "BLAKE3 hashing requested but the 'blake3' package is not installed."
+            )
+        return blake3.blake3()
+    raise HashComputationError(
+        f"Unsupported hash algorithm '{algo}'. Expected one of {SUPPORTED_HASH_ALGORITHMS}."
+    )
+
+
+def compute_hash(data: Union[Dict[str, Any], pd.DataFrame, Any], algo: str = "sha256",
+                 precision: int = NUMERICAL_PRECISION) -> str:
+    """
+    Calculates the digest of the canonical serialization of ``data`` with the
+    requested algorithm.
+
+    The canonical bytes are streamed into the hash state rather than
+    materialized as one buffer, so peak memory stays at the standardized
+    tree plus one bounded fragment.
+
+    Lineage and versioning hashes are contractually SHA-256 (see
+    ``compute_sha256_hash``); ``algo="blake3"`` is intended for internal
+    content addressing (caches, deduplication) where only speed matters.
+
+    Implements: SPEC-ACQ-CHECKSUM
+
+    Parameters
+    ----------
+    data : Union[Dict[str, Any], pd.DataFrame, Any]
+        The entity to hash.
+    algo : str, optional
+        One of ``SUPPORTED_HASH_ALGORITHMS``. Defaults to ``"sha256"``.
+    precision : int, optional
+        Floating point precision constraint. Defaults to NUMERICAL_PRECISION (12).
+
+    Returns
+    -------
+    str
+        The 64-character lowercase hex digest.
+
+    Raises
+    ------
+    HashComputationError
+        If the algorithm is unavailable or the hash cannot be computed from
+        the canonical serialization.
+    """
+    hasher = _new_hasher(algo)
+    try:
+        try:
+            standardized_tree, fast = _standardize_tree(data, precision)
+            _stream_tree(standardized_tree, hasher, fast)
+        except CanonicalSerializationError:
+            raise
+        except Exception as e:
+            raise CanonicalSerializationError(f"Canonical serialization pipeline failed: {str(e)}") from e
+        return hasher.hexdigest()
+    except CanonicalSerializationError as e:
+        raise HashComputationError(f"Cannot compute hash due to serialization violation: {str(e)}") from e
+    except Exception as e:
+        raise HashComputationError(f"Unexpected failure during {_HASH_LABELS[algo]} hash evaluation: {str(e)}") from e
+
+
 def compute_sha256_hash(data: Union[Dict[str, Any], pd.DataFrame, Any], precision: int = NUMERICAL_PRECISION) -> str:
     """
     Calculates the cryptographic SHA-256 dataset/model hash required by the 
@@ -232,6 +556,8 @@ def compute_sha256_hash(data: Union[Dict[str, Any], pd.DataFrame, Any], precisio
 
     Formula:
     \\[ H_{\\mathcal{D}} = \\mathrm{Hash}(\\text{canonical serialization}) \\]
+
+    Equivalent to ``compute_hash(data, "sha256", precision)``.
     
     Implements: SPEC-CONTRACT-VERSIONING
 
@@ -252,10 +578,45 @@ def compute_sha256_hash(data: Union[Dict[str, Any], pd.DataFrame, Any], precisio
     HashComputationError
         If the hash cannot be computed from the canonical serialization.
     """
-    try:
-        canonical_bytes = canonical_serialize(data, precision=precision)
-        return hashlib.sha256(canonical_bytes).hexdigest()
-    except CanonicalSerializationError as e:
-        raise HashComputationError(f"Cannot compute hash due to serialization violation: {str(e)}") from e
-    except Exception as e:
-        raise HashComputationError(f"Unexpected failure during SHA-256 hash evaluation: {str(e)}") from e
\ No newline at end of file
+    return compute_hash(data, "sha256", precision)
+
+
+def compute_sha256_hash_batch(items: Iterable[Any], precision: int = NUMERICAL_PRECISION,
+                              max_workers: Optional[int] = None) -> List[str]:
+    """
+    Calculates ``compute_sha256_hash`` for every item of a collection, e.g.
+    all records of a lineage graph.
+
+    All items share the module-level msgspec encoder (no per-call setup).
+    With ``max_workers`` > 1 the items are spread over a thread pool: tree
+    standardization still holds the GIL, but hashlib and msgspec release it
+    on large buffers, so batches of big frames or arrays overlap.
+
+    Implements: SPEC-CONTRACT-VERSIONING
+
+    Parameters
+    ----------
+    items : Iterable[Any]
+        The entities to hash.
+    precision : int, optional
+        Floating point precision constraint. Defaults to NUMERICAL_PRECISION (12).
+    max_workers : int, optional
+        Thread pool size. ``None`` or 1 hashes serially in the calling thread.
+
+    Returns
+    -------
+    List[str]
+        One 64-character lowercase hex digest per item, in input order.
+
+    Raises
+    ------
+    HashComputationError
+        If any item cannot be hashed.
+    """
+    def digest(item: Any) -> str:
+        return compute_hash(item, "sha256", precision)
+
+    if max_workers is None or max_workers <= 1:
+        return [digest(item) for item in items]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(digest, items))
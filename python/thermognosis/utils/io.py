@@ -8,7 +8,9 @@ for Parquet, JSON, and YAML formats. Guarantees atomic writes to prevent
 race conditions across heterogeneous compute environments.
 """
 
+import functools
 import json
+import os
 import threading
 import uuid
 from pathlib import Path
@@ -19,6 +21,13 @@ import pyarrow as pa
 import pyarrow.parquet as pq
 import yaml
 
+# Prefer the libyaml-backed safe loader/dumper (same safety semantics as
+# yaml.safe_load / yaml.safe_dump, an order of magnitude faster).
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
 
 # =============================================================================
 # EXCEPTION HIERARCHY
@@ -51,13 +60,33 @@ class MetadataCorruptionError(ThermognosisIOError):
 # CONCURRENCY CONTROL
 # =============================================================================
 
-_FILE_LOCKS: Dict[Path, threading.Lock] = {}
-_GLOBAL_LOCK = threading.Lock()
+@functools.lru_cache(maxsize=4096)
+def _resolve_cached(path_str: str, cwd: str) -> Path:
+    return Path(path_str).resolve()
+
+
+def _resolve_path(file_path: Union[str, Path]) -> Path:
+    """
+    Memoized ``Path.resolve()``. Relative paths are keyed together with the
+    current working directory; the cache assumes symlinks along a path are
+    not re-pointed while the process runs.
+    """
+    path_str = os.fspath(file_path)
+    cwd = "" if os.path.isabs(path_str) else os.getcwd()
+    return _resolve_cached(path_str, cwd)
+
+
+# Fixed pool of striped locks: a path maps to stripe hash(path) & (N - 1).
+# Lookup needs no global lock and the pool never grows with the number of
+# distinct files touched. Paths sharing a stripe merely serialize; no
+# operation here holds two file locks at once, so collisions cannot deadlock.
+_LOCK_STRIPE_COUNT = 1024  # must be a power of two
+_LOCK_STRIPES = tuple(threading.Lock() for _ in range(_LOCK_STRIPE_COUNT))
 
 def _get_file_lock(path: Path) -> threading.Lock:
     """
-    Retrieves or creates a threading lock for a specific file path to guarantee
-    thread-safe read/write operations within the same process.
+    Retrieves the striped threading lock guarding a specific file path to
+    guarantee thread-safe read/write operations within the same process.
     
     Parameters
     ----------
@@ -69,22 +98,46 @@ def _get_file_lock(path: Path) -> threading.Lock:
     threading.Lock
         The lock associated with the file path.
     """
-    resolved_path = path.resolve()
-    with _GLOBAL_LOCK:
-        if resolved_path not in _FILE_LOCKS:
-            _FILE_LOCKS[resolved_path] = threading.Lock()
-        return _FILE_LOCKS[resolved_path]
+    return _LOCK_STRIPES[hash(str(_resolve_path(path))) & (_LOCK_STRIPE_COUNT - 1)]
+
+
+def _durable_replace(temp_path: Path, path: Path) -> None:
+    """
+    Atomically publishes ``temp_path`` at ``path`` so that a crash leaves
+    either the old or the complete new file: the data is fsync'ed before the
+    rename, and on POSIX the parent directory is fsync'ed after it so the
+    rename itself is persisted.
+    """
+    fd = os.open(temp_path, os.O_RDWR)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    os.replace(temp_path, path)
+
+    if os.name == "posix":  # directories cannot be opened for fsync on Windows
+        dir_fd = os.open(path.parent, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
 
 # =============================================================================
 # PARQUET I/O (SPEC-DB-PARQUET)
 # =============================================================================
 
+# Rows per Parquet row group emitted by write_parquet_safely.
+_PARQUET_ROW_GROUP_ROWS = 64_000
+
+
 def write_parquet_safely(
     df: pd.DataFrame, 
     file_path: Union[str, Path], 
     schema: pa.Schema,
-    compression: str = "snappy"
+    compression: str = "zstd",
+    compression_level: Optional[int] = None
 ) -> None:
     """
     Thread-safe, schema-enforced, atomic write of a DataFrame to a Parquet file.
@@ -105,7 +158,10 @@ def write_parquet_safely(
     schema : pa.Schema
         The strictly enforced PyArrow schema.
     compression : str, optional
-        The compression algorithm to use (default is "snappy").
+        The compression algorithm to use (default is "zstd").
+    compression_level : int, optional
+        Codec-specific compression level. Defaults to 3 for zstd (close to
+        snappy's speed at a better ratio) and to the codec default otherwise.
         
     Raises
     ------
@@ -114,7 +170,7 @@ def write_parquet_safely(
     AtomicWriteError
         If the file system fails to replace the temporary file atomically.
     """
-    path = Path(file_path).resolve()
+    path = _resolve_path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
     
     # Generate unique temporary path for atomic write
@@ -133,10 +189,21 @@ def write_parquet_safely(
     with lock:
         try:
             # Write to temporary file first
-            pq.write_table(table, temp_path, compression=compression)
+            if compression_level is None and compression == "zstd":
+                compression_level = 3
+            # Row groups of at most _PARQUET_ROW_GROUP_ROWS; Arrow encodes and
+            # compresses the columns of each group on its thread pool.
+            with pq.ParquetWriter(
+                temp_path, table.schema,
+                compression=compression,
+                compression_level=compression_level,
+                use_dictionary=True
+            ) as writer:
+                for batch in table.to_batches(max_chunksize=_PARQUET_ROW_GROUP_ROWS):
+                    writer.write_batch(batch)
             
             # Atomic swap (POSIX atomic, Windows generally atomic in modern Python)
-            temp_path.replace(path)
+            _durable_replace(temp_path, path)
         except Exception as e:
             if temp_path.exists():
                 temp_path.unlink()
@@ -145,7 +212,8 @@ def write_parquet_safely(
 
 def read_parquet_safely(
     file_path: Union[str, Path], 
-    expected_schema: Optional[pa.Schema] = None
+    expected_schema: Optional[pa.Schema] = None,
+    zero_copy: bool = False
 ) -> pd.DataFrame:
     """
     Thread-safe, schema-validated read of a Parquet file.
@@ -158,6 +226,11 @@ def read_parquet_safely(
         The source file path.
     expected_schema : pa.Schema, optional
         If provided, validates the read data against this PyArrow schema.
+    zero_copy : bool, optional
+        If True, numeric columns without nulls are returned as read-only
+        views of the Arrow buffers (one block per column) instead of being
+        copied into consolidated pandas blocks. Suitable for read-only
+        analysis; in-place writes to such columns raise ``ValueError``.
         
     Returns
     -------
@@ -173,7 +246,7 @@ def read_parquet_safely(
     ThermognosisIOError
         If the file cannot be read due to corruption or access issues.
     """
-    path = Path(file_path).resolve()
+    path = _resolve_path(file_path)
     
     if not path.exists():
         raise FileNotFoundError(f"Parquet file not found: {path}")
@@ -181,25 +254,41 @@ def read_parquet_safely(
     lock = _get_file_lock(path)
     with lock:
         try:
-            table = pq.read_table(path)
+            # Memory-mapped handle: the footer alone yields the schema, so a
+            # mismatch is rejected before any column chunk is decoded.
+            parquet_file = pq.ParquetFile(path, memory_map=True)
+            file_schema = parquet_file.schema_arrow
         except Exception as e:
             raise ThermognosisIOError(f"Failed to read Parquet file at {path}: {str(e)}") from e
 
-    if expected_schema is not None:
-        if not table.schema.equals(expected_schema, check_metadata=False):
-            raise SchemaViolationError(
-                f"Schema mismatch detected when reading {path.name}. "
-                f"Expected:\n{expected_schema}\nFound:\n{table.schema}"
-            )
+        if expected_schema is not None:
+            if not file_schema.equals(expected_schema, check_metadata=False):
+                raise SchemaViolationError(
+                    f"Schema mismatch detected when reading {path.name}. "
+                    f"Expected:\n{expected_schema}\nFound:\n{file_schema}"
+                )
 
-    return table.to_pandas()
+        try:
+            table = parquet_file.read(use_threads=True)
+        except Exception as e:
+            raise ThermognosisIOError(f"Failed to read Parquet file at {path}: {str(e)}") from e
+
+    # self_destruct releases each Arrow column as soon as it is converted,
+    # so the table and the frame are never fully resident together.
+    return table.to_pandas(split_blocks=zero_copy, self_destruct=True)
 
 
 # =============================================================================
 # SECURE METADATA I/O
 # =============================================================================
 
-def write_json_metadata(data: Dict[str, Any], file_path: Union[str, Path]) -> None:
+def write_json_metadata(
+    data: Dict[str, Any],
+    file_path: Union[str, Path],
+    *,
+    sort_keys: bool = False,
+    indent: Optional[int] = 4
+) -> None:
     """
     Thread-safe, atomic write of dictionary metadata to a JSON file.
     Ensures that provenance and contextual metadata (C, M) are never partially written.
@@ -212,13 +301,21 @@ def write_json_metadata(data: Dict[str, Any], file_path: Union[str, Path]) -> No
         Metadata dictionary (must be JSON serializable).
     file_path : Union[str, Path]
         The destination file path.
+    sort_keys : bool, optional
+        Emit keys in sorted order (default False: the writer's own insertion
+        order is kept, which avoids a sort at every nesting level). Canonical,
+        order-independent identity is provided by ``compute_sha256_hash``,
+        not by this file layout.
+    indent : int, optional
+        Indentation width (default 4); ``None`` writes compact single-line
+        JSON through the C encoder.
         
     Raises
     ------
     AtomicWriteError
         If atomic replacement fails.
     """
-    path = Path(file_path).resolve()
+    path = _resolve_path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
     temp_path = path.with_suffix(f".tmp.{uuid.uuid4().hex}")
     
@@ -226,8 +323,8 @@ def write_json_metadata(data: Dict[str, Any], file_path: Union[str, Path]) -> No
     with lock:
         try:
             with temp_path.open('w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, sort_keys=True)
-            temp_path.replace(path)
+                f.write(json.dumps(data, indent=indent, sort_keys=sort_keys))
+            _durable_replace(temp_path, path)
         except Exception as e:
             if temp_path.exists():
                 temp_path.unlink()
@@ -253,7 +350,7 @@ def read_json_metadata(file_path: Union[str, Path]) -> Dict[str, Any]:
     MetadataCorruptionError
         If the JSON is malformed.
     """
-    path = Path(file_path).resolve()
+    path = _resolve_path(file_path)
     
     lock = _get_file_lock(path)
     with lock:
@@ -284,7 +381,7 @@ def write_yaml_metadata(data: Dict[str, Any], file_path: Union[str, Path]) -> No
     AtomicWriteError
         If atomic replacement fails.
     """
-    path = Path(file_path).resolve()
+    path = _resolve_path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
     temp_path = path.with_suffix(f".tmp.{uuid.uuid4().hex}")
     
@@ -292,8 +389,8 @@ def write_yaml_metadata(data: Dict[str, Any], file_path: Union[str, Path]) -> No
     with lock:
         try:
             with temp_path.open('w', encoding='utf-8') as f:
-                yaml.safe_dump(data, f, default_flow_style=False, sort_keys=True)
-            temp_path.replace(path)
+                yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=True)
+            _durable_replace(temp_path, path)
         except Exception as e:
             if temp_path.exists():
                 temp_path.unlink()
@@ -302,7 +399,8 @@ def write_yaml_metadata(data: Dict[str, Any], file_path: Union[str, Path]) -> No
 
 def read_yaml_metadata(file_path: Union[str, Path]) -> Dict[str, Any]:
     """
-    Thread-safe, strictly secure read of YAML metadata using yaml.safe_load.
+    Thread-safe, strictly secure read of YAML metadata using the YAML safe loader
+    (libyaml-backed when available).
     Prevents arbitrary code execution from malicious configuration files.
     
     Parameters
@@ -320,13 +418,13 @@ def read_yaml_metadata(file_path: Union[str, Path]) -> Dict[str, Any]:
     MetadataCorruptionError
         If the YAML is malformed or violates safe-load limits.
     """
-    path = Path(file_path).resolve()
+    path = _resolve_path(file_path)
     
     lock = _get_file_lock(path)
     with lock:
         try:
             with path.open('r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
                 return data if data is not None else {}
         except yaml.YAMLError as e:
             raise MetadataCorruptionError(f"YAML metadata corruption or security violation in {path}: {str(e)}") from e
@@ -0,0 +1,130 @@
+"""
+Thermognosis Engine - Numba Fallback Backend
+============================================
+
+JIT-compiled stand-in for the compiled `rust_core` extension on platforms
+without a prebuilt wheel. `RustCore` adopts it only once it provides every
+required entry point; so far only the physics gate
+(`check_physics_consistency_py`) is ported, so `RustCore()` still fails fast
+with ``RustCoreError`` when the compiled core is missing. Every other entry
+point is absent and raises ``AttributeError``, exactly like a compiled core
+that predates it.
+
+The kernel mirrors `ThermoelectricState::validate` in the Rust core: the
+same check order and the same zT expression evaluated in the same operand
+order, so accepted states yield bit-identical zT values.
+
+Implements:
+    - SPEC-PHYS-CONSISTENCY
+    - SPEC-PHYS-CONSTRAINTS
+"""
+
+from typing import Optional
+
+import numpy as np
+
+# Optional LLVM JIT for the fused record loop.
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Lorenz-number bounds exported by the Rust core (constants.rs).
+L0_SOMMERFELD = 2.44e-8
+L_MIN = 1.0e-9
+L_MAX = 1.0e-7
+
+# Per-state violation codes written by the kernel (0 = admissible).
+_OK, _NON_FINITE, _NEG_T, _NEG_SIGMA, _NEG_KAPPA, _NEG_ZT = range(6)
+
+
+if HAS_NUMBA:
+
+    @numba.njit(parallel=True, cache=True)
+    def _physics_kernel(s, sigma, kappa, t, out, code):
+        """Fused validation + zT, one state per iteration; outputs preallocated."""
+        for i in numba.prange(out.shape[0]):
+            s_i = s[i]
+            sigma_i = sigma[i]
+            kappa_i = kappa[i]
+            t_i = t[i]
+            out[i] = np.nan
+            if not (np.isfinite(s_i) and np.isfinite(sigma_i)
+                    and np.isfinite(kappa_i) and np.isfinite(t_i)):
+                code[i] = _NON_FINITE
+            elif t_i <= 0.0:
+                code[i] = _NEG_T
+            elif sigma_i <= 0.0:
+                code[i] = _NEG_SIGMA
+            elif kappa_i <= 0.0:
+                code[i] = _NEG_KAPPA
+            else:
+                zt = (s_i * s_i * sigma_i * t_i) / kappa_i
+                if zt < 0.0:
+                    code[i] = _NEG_ZT
+                else:
+                    code[i] = _OK
+                    out[i] = zt
+
+
+def _violation_message(code: int, s: float, sigma: float, kappa: float, t: float) -> str:
+    """Formats a violation code with the Rust `ValidationError` wording."""
+    if code == _NON_FINITE:
+        bad = next(v for v in (s, sigma, kappa, t) if not np.isfinite(v))
+        return f"PCON-03: Bound Violation - Value is NaN or Infinite: {bad}"
+    if code == _NEG_T:
+        return f"PC-02/PCON-02: Negative Absolute Temperature: T = {t} <= 0"
+    if code == _NEG_SIGMA:
+        return f"PC-02/PCON-02: Negative Electrical Conductivity: sigma = {sigma} <= 0"
+    if code == _NEG_KAPPA:
+        return f"PC-02/PCON-02: Negative Thermal Conductivity: kappa = {kappa} <= 0"
+    zt = (s * s * sigma * t) / kappa
+    return f"PC-05/PCON-05: Thermodynamic Violation - Negative Figure of Merit: ZT = {zt} < 0"
+
+
+class NumbaBackend:
+    """
+    Drop-in subset of the `rust_core` module surface backed by Numba.
+
+    Attribute access for any binding not implemented here raises
+    ``AttributeError`` naming the missing native entry point.
+    """
+
+    L0_SOMMERFELD = L0_SOMMERFELD
+    L_MIN = L_MIN
+    L_MAX = L_MAX
+
+    @staticmethod
+    def check_physics_consistency_py(s: np.ndarray, sigma: np.ndarray, kappa: np.ndarray,
+                                     t: np.ndarray, deterministic: bool = False,
+                                     out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Validates the states and returns zT (written into ``out`` when given),
+        raising ``ValueError`` on the lowest-index violation. States are
+        independent, so the parallel loop is reproducible and
+        ``deterministic`` needs no separate path.
+        """
+        n = s.shape[0]
+        for other in (sigma, kappa, t):
+            if other.shape[0] != n:
+                raise ValueError(
+                    "Dimensionality Violation: Input arrays must have identical lengths. "
+                    f"Expected {n}, Found {other.shape[0]}.")
+        if out is None:
+            out = np.empty(n, dtype=np.float64)
+        elif out.shape[0] != n:
+            raise ValueError(
+                "Dimensionality Violation: Input arrays must have identical lengths. "
+                f"Expected {n}, Found {out.shape[0]}.")
+        code = np.empty(n, dtype=np.int8)
+        _physics_kernel(s, sigma, kappa, t, out, code)
+        bad = np.flatnonzero(code)
+        if bad.size:
+            i = bad[0]
+            raise ValueError(_violation_message(
+                int(code[i]), float(s[i]), float(sigma[i]), float(kappa[i]), float(t[i])))
+        return out
+
+    def __getattr__(self, name: str):
+        raise AttributeError(name)
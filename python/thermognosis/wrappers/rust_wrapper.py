@@ -16,13 +16,22 @@ Implements:
 
 import logging
 from pathlib import Path
-from typing import Dict, Tuple, Union, Any, Optional, List
+from typing import Callable, Dict, Tuple, Union, Any, Optional, List
 
 import numpy as np
 
 # Configure module-level logger
 logger = logging.getLogger(__name__)
 
+# Quality-score inputs in FFI argument order; absent optional components are
+# passed as None and treated as uniformly 1.0 by the Rust core.
+_QUALITY_KEYS = (
+    'completeness', 'credibility', 'physics_consistency',
+    'error_magnitude', 'smoothness', 'metadata',
+)
+_QUALITY_OPTIONAL = frozenset(('completeness', 'smoothness', 'metadata'))
+_QUALITY_REQUIRED = frozenset(_QUALITY_KEYS + ('hard_constraint_gate',)) - _QUALITY_OPTIONAL
+
 
 class RustCoreError(Exception):
     """
@@ -37,6 +46,21 @@ class RustCoreError(Exception):
     pass
 
 
+# Entry points the pipeline cannot run without; a fallback backend is only
+# adopted when it provides all of them.
+_REQUIRED_ENTRY_POINTS = (
+    'compute_zt_from_csv_py', 'validate_dimensions_py', 'check_physics_consistency_py',
+    'propagate_error_py', 'compute_quality_score_py',
+)
+
+
+def _unavailable(name: str, backend_name: str) -> Callable[..., Any]:
+    """Stand-in for a required entry point the loaded backend lacks; raises `RustCoreError` when called."""
+    def call(*args: Any, **kwargs: Any) -> Any:
+        raise RustCoreError(f"'{name}' is not provided by the loaded {backend_name} backend")
+    return call
+
+
 class RustCore:
     """
     Highly optimized Python <-> Rust interface layer for the Thermognosis Engine.
@@ -58,7 +82,9 @@ class RustCore:
                 
         Raises:
             RustCoreError: If the compiled `rust_core` shared library cannot be 
-                located or imported in the current environment.
+                located or imported and the Numba fallback backend (see
+                `numba_fallback`) is unavailable or does not provide every
+                required entry point.
         """
         self.deterministic = deterministic
         try:
@@ -66,49 +92,85 @@ class RustCore:
             # import rust_core
             import rust_core as backend
             self._backend = backend
-            
-            # Expose absolute physical bounds from the Rust core
-            self.L0_SOMMERFELD = self._backend.L0_SOMMERFELD
-            self.L_MIN = self._backend.L_MIN
-            self.L_MAX = self._backend.L_MAX
-            
+            self._backend_name = "compiled rust_core"
             logger.info(f"Successfully loaded rust_core FFI backend. Deterministic mode: {self.deterministic}")
             
         except ImportError as e:
-            logger.critical("Failed to load the compiled Rust FFI module 'rust_core'. "
-                            "Ensure the crate is compiled and in the PYTHONPATH.")
-            raise RustCoreError(f"Rust backend initialization failed: {e}") from e
+            from thermognosis.wrappers.numba_fallback import HAS_NUMBA, NumbaBackend
+            if not HAS_NUMBA:
+                logger.critical("Failed to load the compiled Rust FFI module 'rust_core'. "
+                                "Ensure the crate is compiled and in the PYTHONPATH.")
+                raise RustCoreError(f"Rust backend initialization failed: {e}") from e
+
+            # JIT fallback: adopted only if it covers every required entry
+            # point, so a partial port still fails fast here rather than on
+            # every later call. Optional entry points stay absent
+            # (AttributeError), letting the Python fallbacks engage.
+            fallback = NumbaBackend()
+            missing = [name for name in _REQUIRED_ENTRY_POINTS if not hasattr(fallback, name)]
+            if missing:
+                logger.critical("Failed to load the compiled Rust FFI module 'rust_core' and the "
+                                "Numba fallback backend does not provide %s.", missing)
+                raise RustCoreError(
+                    f"Rust backend initialization failed: {e} "
+                    f"(Numba fallback backend lacks {', '.join(missing)})"
+                ) from e
+            self._backend = fallback
+            self._backend_name = "Numba fallback"
+            logger.warning("Compiled 'rust_core' unavailable (%s); using the Numba fallback "
+                           "backend.", e)
+
+        # Expose absolute physical bounds from the Rust core
+        self.L0_SOMMERFELD = self._backend.L0_SOMMERFELD
+        self.L_MIN = self._backend.L_MIN
+        self.L_MAX = self._backend.L_MAX
+
+        # Hot-path entry points resolved once, so each call skips the
+        # module attribute lookup on the backend.
+        self._fn_csv = self._required("compute_zt_from_csv_py")
+        self._fn_validate = self._required("validate_dimensions_py")
+        self._fn_physics = self._required("check_physics_consistency_py")
+        self._fn_propagate = self._required("propagate_error_py")
+        self._fn_quality = self._required("compute_quality_score_py")
+        # Optional: compiled cores older than the fused gate lack it (None).
+        self._fn_gate = getattr(self._backend, "compute_hard_constraint_gate_py", None)
 
-    def _prepare_f64_array(self, tensor: Any, name: str) -> np.ndarray:
+    def _required(self, name: str) -> Callable[..., Any]:
+        """Resolves an entry point every compiled core provides (see `_unavailable`)."""
+        fn = getattr(self._backend, name, None)
+        return fn if fn is not None else _unavailable(name, self._backend_name)
+
+    def _prepare_array(self, tensor: Any, name: str, dtype: type = np.float64) -> np.ndarray:
         """
-        Memory Safety Guarantee: Forces the input into a 1D, C-contiguous, 
-        float64 NumPy array to satisfy Rust's zero-copy slice extraction macro.
+        Memory Safety Guarantee: Forces the input into a 1D, C-contiguous 
+        NumPy array of `dtype` to satisfy Rust's zero-copy slice extraction macro.
         
         Args:
             tensor (Any): The input scalar, list, or array.
             name (str): Identifier for logging/error context.
+            dtype (type): Target element type, ``np.float64`` (physical tensors)
+                or ``np.bool_`` (logical masks).
             
         Returns:
-            np.ndarray: A contiguous np.float64 array.
+            np.ndarray: A contiguous array of the requested dtype.
             
         Raises:
-            RustCoreError: If the tensor cannot be safely cast to float64.
-        """
-        try:
-            arr_1d = np.atleast_1d(tensor)
-            return np.ascontiguousarray(arr_1d, dtype=np.float64)
-        except Exception as e:
-            raise RustCoreError(f"FFI Memory Preparation Violation for '{name}': {e}") from e
-
-    def _prepare_bool_array(self, tensor: Any, name: str) -> np.ndarray:
-        """
-        Memory Safety Guarantee: Forces the input into a 1D, C-contiguous, 
-        boolean NumPy array for logical masking in Rust.
+            RustCoreError: If the tensor is None or cannot be safely cast to `dtype`.
         """
+        # Fast path: already in FFI layout, hand the buffer over untouched.
+        if (isinstance(tensor, np.ndarray) and tensor.dtype == dtype
+                and tensor.ndim == 1 and tensor.flags.c_contiguous):
+            return tensor
+        if tensor is None:
+            # np.asarray would silently turn None into NaN.
+            raise RustCoreError(f"FFI Memory Preparation Violation for '{name}': input is None")
         try:
-            arr_1d = np.atleast_1d(tensor)
-            return np.ascontiguousarray(arr_1d, dtype=np.bool_)
-        except Exception as e:
+            # Single-state queries: build the length-1 buffer directly.
+            if np.isscalar(tensor):
+                return np.array([tensor], dtype=dtype)
+            arr_1d = tensor if getattr(tensor, "ndim", 0) >= 1 else np.atleast_1d(tensor)
+            return np.ascontiguousarray(arr_1d, dtype=dtype)
+        except (TypeError, ValueError, OverflowError) as e:
             raise RustCoreError(f"FFI Memory Preparation Violation for '{name}': {e}") from e
 
     def compute_zt_from_csv(self, path: Union[str, Path]) -> Dict[str, Any]:
@@ -127,9 +189,9 @@ class RustCore:
                 within the Rust backend.
         """
         try:
-            # Assuming the PyO3 module is loaded as self._backend
-            # Convert path to strictly a string, guaranteeing compatibility across environments.
-            return self._backend.compute_zt_from_csv_py(str(path), self.deterministic)
+            # Path objects cross the FFI as-is; PyO3 resolves them via os.fspath
+            # into an OS-native PathBuf without a str() round-trip.
+            return self._fn_csv(path, self.deterministic)
         except Exception as e:
             raise RustCoreError(f"Rust core failed during CSV processing: {str(e)}") from e
 
@@ -157,11 +219,11 @@ class RustCore:
         Raises:
             RustCoreError: On dimension mismatch, unknown units, or FFI errors.
         """
-        v_arr = self._prepare_f64_array(values, "values")
-        u_arr = self._prepare_f64_array(uncertainties, "uncertainties")
+        v_arr = self._prepare_array(values, "values")
+        u_arr = self._prepare_array(uncertainties, "uncertainties")
         
         try:
-            out_vals, out_uncs = self._backend.validate_dimensions_py(
+            out_vals, out_uncs = self._fn_validate(
                 v_arr, u_arr, source_unit, target_unit, self.deterministic
             )
             return out_vals, out_uncs
@@ -172,7 +234,8 @@ class RustCore:
                                   s: Union[float, np.ndarray], 
                                   sigma: Union[float, np.ndarray], 
                                   kappa: Union[float, np.ndarray], 
-                                  t: Union[float, np.ndarray]) -> np.ndarray:
+                                  t: Union[float, np.ndarray],
+                                  out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Validates thermodynamic constraints across state parameters.
         
@@ -183,24 +246,28 @@ class RustCore:
             sigma (Union[float, np.ndarray]): Electrical conductivity in S/m.
             kappa (Union[float, np.ndarray]): Thermal conductivity in W/(m·K).
             t (Union[float, np.ndarray]): Absolute Temperature (T) in K.
+            out (Optional[np.ndarray]): Preallocated 1D, C-contiguous float64
+                buffer of the input length that receives zT in place, so a loop
+                can reuse one buffer across calls. Allocated by NumPy if None.
             
         Returns:
-            np.ndarray: The computed dimensionless figure of merit (zT).
+            np.ndarray: The computed dimensionless figure of merit (zT); `out`
+                itself when given.
             
         Raises:
             RustCoreError: On thermodynamic violation (e.g., negative T or kappa).
         """
-        s_arr = self._prepare_f64_array(s, "s")
-        sigma_arr = self._prepare_f64_array(sigma, "sigma")
-        kappa_arr = self._prepare_f64_array(kappa, "kappa")
-        t_arr = self._prepare_f64_array(t, "t")
+        s_arr = self._prepare_array(s, "s")
+        sigma_arr = self._prepare_array(sigma, "sigma")
+        kappa_arr = self._prepare_array(kappa, "kappa")
+        t_arr = self._prepare_array(t, "t")
         
         try:
-            zt_out = self._backend.check_physics_consistency_py(
-                s_arr, sigma_arr, kappa_arr, t_arr, self.deterministic
+            zt_out = self._fn_physics(
+                s_arr, sigma_arr, kappa_arr, t_arr, self.deterministic, out=out
             )
             return zt_out
-        except (ValueError, RuntimeError) as e:
+        except (ValueError, RuntimeError, TypeError) as e:
             raise RustCoreError(f"Physical consistency violation detected: {e}") from e
 
     def propagate_error(self, 
@@ -211,7 +278,9 @@ class RustCore:
                         err_s: Union[float, np.ndarray], 
                         err_sigma: Union[float, np.ndarray], 
                         err_kappa: Union[float, np.ndarray], 
-                        err_t: Union[float, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+                        err_t: Union[float, np.ndarray],
+                        out_zt: Optional[np.ndarray] = None,
+                        out_unc: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Computes zT and its first-order analytical propagation of standard measurement uncertainties.
         
@@ -220,6 +289,8 @@ class RustCore:
         Args:
             s, sigma, kappa, t: Nominal physical parameters.
             err_s, err_sigma, err_kappa, err_t: Corresponding 1-sigma uncertainties.
+            out_zt, out_unc: Optional distinct preallocated float64 output
+                buffers written in place (see `check_physics_consistency`).
             
         Returns:
             Tuple[np.ndarray, np.ndarray]: 
@@ -229,24 +300,24 @@ class RustCore:
         Raises:
             RustCoreError: If negative variance occurs or dimensions mismatch.
         """
-        s_arr = self._prepare_f64_array(s, "s")
-        sigma_arr = self._prepare_f64_array(sigma, "sigma")
-        kappa_arr = self._prepare_f64_array(kappa, "kappa")
-        t_arr = self._prepare_f64_array(t, "t")
+        s_arr = self._prepare_array(s, "s")
+        sigma_arr = self._prepare_array(sigma, "sigma")
+        kappa_arr = self._prepare_array(kappa, "kappa")
+        t_arr = self._prepare_array(t, "t")
         
-        es_arr = self._prepare_f64_array(err_s, "err_s")
-        esigma_arr = self._prepare_f64_array(err_sigma, "err_sigma")
-        ekappa_arr = self._prepare_f64_array(err_kappa, "err_kappa")
-        et_arr = self._prepare_f64_array(err_t, "err_t")
+        es_arr = self._prepare_array(err_s, "err_s")
+        esigma_arr = self._prepare_array(err_sigma, "err_sigma")
+        ekappa_arr = self._prepare_array(err_kappa, "err_kappa")
+        et_arr = self._prepare_array(err_t, "err_t")
         
         try:
-            out_zt, out_unc = self._backend.propagate_error_py(
+            out_zt, out_unc = self._fn_propagate(
                 s_arr, sigma_arr, kappa_arr, t_arr,
                 es_arr, esigma_arr, ekappa_arr, et_arr,
-                self.deterministic
+                self.deterministic, out_zt=out_zt, out_unc=out_unc
             )
             return out_zt, out_unc
-        except (ValueError, RuntimeError) as e:
+        except (ValueError, RuntimeError, TypeError) as e:
             raise RustCoreError(f"Uncertainty propagation failed: {e}") from e
 
     def compute_quality_score(self, 
@@ -258,9 +329,11 @@ class RustCore:
         Document IDs: SPEC-QUAL-SCORING, SPEC-QUAL-CREDIBILITY, SPEC-QUAL-COMPLETENESS
         
         Args:
-            metrics (Dict[str, Union[float, np.ndarray]]): Dictionary containing exactly:
-                'completeness', 'credibility', 'physics_consistency', 'error_magnitude',
-                'smoothness', 'metadata', 'hard_constraint_gate' (boolean array).
+            metrics (Dict[str, Union[float, np.ndarray]]): Dictionary containing
+                'credibility', 'physics_consistency', 'error_magnitude' and
+                'hard_constraint_gate' (boolean array). 'completeness',
+                'smoothness' and 'metadata' are optional; when absent or None
+                they are uniformly 1.0 and no array is allocated for them.
             lambda_reg (float): Regularization penalty mapping parameter. Default is 0.01.
             
         Returns:
@@ -273,32 +346,190 @@ class RustCore:
         Raises:
             RustCoreError: If required keys are missing or computational instability occurs.
         """
-        required_keys = {
-            'completeness', 'credibility', 'physics_consistency', 
-            'error_magnitude', 'smoothness', 'metadata', 'hard_constraint_gate'
-        }
-        
-        if not required_keys.issubset(metrics.keys()):
-            missing = required_keys - set(metrics.keys())
+        missing = _QUALITY_REQUIRED.difference(metrics)
+        if missing:
             raise RustCoreError(f"Missing required metrics for quality scoring: {missing}")
 
-        c_arr = self._prepare_f64_array(metrics['completeness'], "completeness")
-        cr_arr = self._prepare_f64_array(metrics['credibility'], "credibility")
-        ph_arr = self._prepare_f64_array(metrics['physics_consistency'], "physics_consistency")
-        err_arr = self._prepare_f64_array(metrics['error_magnitude'], "error_magnitude")
-        sm_arr = self._prepare_f64_array(metrics['smoothness'], "smoothness")
-        meta_arr = self._prepare_f64_array(metrics['metadata'], "metadata")
-        hg_arr = self._prepare_bool_array(metrics['hard_constraint_gate'], "hard_constraint_gate")
+        arrays = []
+        for key in _QUALITY_KEYS:
+            value = metrics.get(key)
+            if value is None and key in _QUALITY_OPTIONAL:
+                arrays.append(None)
+            else:
+                arrays.append(self._prepare_array(value, key))
+        c_arr, cr_arr, ph_arr, err_arr, sm_arr, meta_arr = arrays
+        hg_arr = self._prepare_array(metrics['hard_constraint_gate'], "hard_constraint_gate", np.bool_)
         
         try:
-            base, reg, ent, cls_labels = self._backend.compute_quality_score_py(
-                c_arr, cr_arr, ph_arr, err_arr, sm_arr, meta_arr, hg_arr,
-                float(lambda_reg), self.deterministic
-            )
+            try:
+                base, reg, ent, cls_labels = self._fn_quality(
+                    c_arr, cr_arr, ph_arr, err_arr, sm_arr, meta_arr, hg_arr,
+                    float(lambda_reg), self.deterministic
+                )
+            except TypeError:
+                if not any(a is None for a in (c_arr, sm_arr, meta_arr)):
+                    raise
+                # Binaries predating the optional metrics reject None: retry
+                # with one all-ones buffer shared by every omitted metric.
+                ones = np.ones(max(a.shape[0] for a in (cr_arr, ph_arr, err_arr, hg_arr)))
+                c_arr, sm_arr, meta_arr = (
+                    ones if a is None else a for a in (c_arr, sm_arr, meta_arr)
+                )
+                base, reg, ent, cls_labels = self._fn_quality(
+                    c_arr, cr_arr, ph_arr, err_arr, sm_arr, meta_arr, hg_arr,
+                    float(lambda_reg), self.deterministic
+                )
             return base, reg, ent, cls_labels
-        except (ValueError, RuntimeError) as e:
+        except (ValueError, RuntimeError, TypeError) as e:
             raise RustCoreError(f"Quality evaluation failed: {e}") from e
 
+    def compute_hard_constraint_gate(self,
+                                     zt: Union[float, np.ndarray],
+                                     t: Union[float, np.ndarray],
+                                     kappa: Union[float, np.ndarray],
+                                     sigma: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Evaluates the positivity hard-constraint gate in one fused Rust pass.
+
+        Document IDs: SPEC-PHYS-CONSTRAINTS
+
+        Args:
+            zt (Union[float, np.ndarray]): Figure of merit.
+            t (Union[float, np.ndarray]): Absolute Temperature (K).
+            kappa (Union[float, np.ndarray]): Thermal conductivity (W/mK).
+            sigma (Union[float, np.ndarray]): Electrical conductivity (S/m).
+
+        Returns:
+            np.ndarray: Boolean mask, `(zT >= 0) & (T > 0) & (kappa > 0) & (sigma > 0)`.
+
+        Raises:
+            AttributeError: If the loaded backend predates the fused gate.
+            RustCoreError: If array dimensions mismatch.
+        """
+        if self._fn_gate is None:
+            raise AttributeError("compute_hard_constraint_gate_py")
+        zt_arr = self._prepare_array(zt, "zt")
+        t_arr = self._prepare_array(t, "t")
+        kappa_arr = self._prepare_array(kappa, "kappa")
+        sigma_arr = self._prepare_array(sigma, "sigma")
+
+        try:
+            return self._fn_gate(zt_arr, t_arr, kappa_arr, sigma_arr)
+        except (ValueError, RuntimeError) as e:
+            raise RustCoreError(f"Hard-constraint gate failed: {e}") from e
+
+    def compute_material_rank_batch(self,
+                                    p: Union[float, np.ndarray],
+                                    zt: Union[float, np.ndarray],
+                                    c: Union[float, np.ndarray],
+                                    material_bounds: Any,
+                                    alpha: float,
+                                    beta: float) -> np.ndarray:
+        """
+        Computes the citation-aware, entropy-regularized rank of every material.
+
+        Document IDs: SPEC-GRAPH-RANK, G03-EMBEDDING-RANK-THEORY
+
+        Args:
+            p (Union[float, np.ndarray]): Posterior credibilities, grouped by material.
+            zt (Union[float, np.ndarray]): Figures of merit, aligned with `p`.
+            c (Union[float, np.ndarray]): Citation counts, aligned with `p`.
+            material_bounds (Any): (M, 2) half-open (start, end) slices; sent
+                across the FFI boundary as one C-contiguous int64 buffer.
+            alpha (float): Logarithmic citation weighting factor.
+            beta (float): Entropy regularization multiplier.
+
+        Returns:
+            np.ndarray: One regularized rank per material (float64).
+
+        Raises:
+            RustCoreError: On dimensional mismatch, invalid bounds, or FFI errors.
+        """
+        p_arr = self._prepare_array(p, "p")
+        zt_arr = self._prepare_array(zt, "zt")
+        c_arr = self._prepare_array(c, "c")
+        try:
+            bounds_arr = np.ascontiguousarray(material_bounds, dtype=np.int64).reshape(-1, 2)
+        except (ValueError, TypeError) as e:
+            raise RustCoreError(f"FFI Memory Preparation Violation for 'material_bounds': {e}") from e
+
+        try:
+            return self._backend.compute_material_rank_batch_py(
+                p_arr, zt_arr, c_arr, bounds_arr, float(alpha), float(beta)
+            )
+        except (ValueError, RuntimeError, TypeError) as e:
+            raise RustCoreError(f"Material rank evaluation failed: {e}") from e
+
+    def compute_information_gain_batch(self,
+                                       t: Union[float, np.ndarray],
+                                       bounds: List[Tuple[int, int]],
+                                       t_min: float,
+                                       t_max: float,
+                                       num_bins: int,
+                                       gamma_1: float,
+                                       gamma_2: float) -> List[Any]:
+        """
+        Computes the spatial exploration entropy and KL divergence per sub-manifold.
+
+        Document IDs: SPEC-ACTIVE-GAP, CL02-INFORMATION-GAIN-SELECTION
+
+        The Rust kernel runs entirely inside `py.allow_threads`, so concurrent
+        Python threads (e.g. the next SQL fetch) proceed while the rayon
+        reduction executes.
+
+        Args:
+            t (Union[float, np.ndarray]): Flat temperature array (K), grouped by material.
+            bounds (List[Tuple[int, int]]): Half-open (start, end) slices into `t`.
+            t_min, t_max (float): Temperature integration domain (K).
+            num_bins (int): Number of histogram microstates (K).
+            gamma_1, gamma_2 (float): Weights of H and D_KL in the gap score.
+
+        Returns:
+            List[Any]: One result per bound exposing `entropy`, `kl_divergence`
+                and `total_score`.
+
+        Raises:
+            RustCoreError: On invalid bounds, degenerate domain, or FFI errors.
+        """
+        t_arr = self._prepare_array(t, "t")
+
+        try:
+            return self._backend.compute_information_gain_batch_py(
+                t_arr, bounds, float(t_min), float(t_max), int(num_bins),
+                float(gamma_1), float(gamma_2)
+            )
+        except (ValueError, RuntimeError, TypeError) as e:
+            raise RustCoreError(f"Information gain evaluation failed: {e}") from e
+
+    def parse_array_column(self,
+                           buf: bytes,
+                           offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Decodes a column of serialized curve arrays in the Rust core.
+
+        Document IDs: SPEC-PIPELINE-DATA-FLOW, SPEC-GOV-ERROR-HIERARCHY
+
+        The cells are joined into one `bytes` buffer, which Rust borrows
+        without copying and decodes in parallel with the GIL released.
+
+        Args:
+            buf (bytes): Concatenated cell literals.
+            offsets (np.ndarray): int64 cell boundaries into `buf` (len = cells + 1).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (flat float64 values,
+                int64 per-cell lengths, bool per-cell success mask).
+
+        Raises:
+            RustCoreError: If the offsets do not partition `buf` or on FFI errors.
+        """
+        offsets_arr = np.ascontiguousarray(offsets, dtype=np.int64)
+
+        try:
+            return self._backend.parse_array_column_py(bytes(buf), offsets_arr)
+        except (ValueError, RuntimeError, TypeError) as e:
+            raise RustCoreError(f"Array column parsing failed: {e}") from e
+
     def audit_thermodynamic_states(
         self,
         s: Union[float, np.ndarray],
@@ -362,16 +593,16 @@ class RustCore:
         >>> tier_a_mask = audit["tier"] == 1
         >>> df = pd.DataFrame(audit)
         """
-        s_arr     = self._prepare_f64_array(s,     "s")
-        sigma_arr = self._prepare_f64_array(sigma, "sigma")
-        kappa_arr = self._prepare_f64_array(kappa, "kappa")
-        t_arr     = self._prepare_f64_array(t,     "t")
+        s_arr     = self._prepare_array(s,     "s")
+        sigma_arr = self._prepare_array(sigma, "sigma")
+        kappa_arr = self._prepare_array(kappa, "kappa")
+        t_arr     = self._prepare_array(t,     "t")
 
         # When no reported values are provided, Gate 3 is skipped via NaN sentinel.
         if zt_reported is None:
             zt_arr = np.full(s_arr.shape[0], np.nan, dtype=np.float64)
         else:
-            zt_arr = self._prepare_f64_array(zt_reported, "zt_reported")
+            zt_arr = self._prepare_array(zt_reported, "zt_reported")
 
         try:
             raw: Dict[str, np.ndarray] = self._backend.audit_thermodynamics_py(
@@ -0,0 +1,161 @@
+// rust_core/src/array_parser.rs
+
+//! # Thermognosis Engine - Serialized Curve Array Parser
+//!
+//! **Layer:** Ingestion / FFI Boundary
+//! **Status:** Normative — Strict Mathematical Execution Environment
+//! **Implements:** SPEC-PIPELINE-DATA-FLOW, SPEC-GOV-ERROR-HIERARCHY
+//!
+//! Decodes a column of bracketed numeric literals (e.g. `"[300.0, 350.5]"`)
+//! that has been joined into one contiguous byte buffer with cell offsets.
+//! The Python side hands the buffer across the FFI boundary without copying;
+//! cells are decoded in parallel via `rayon` and laid end to end in a single
+//! flat `f64` vector.
+//!
+//! ## Architectural Guarantees:
+//! 1. **Zero-Panic Execution:** Offsets are validated before any slicing.
+//! 2. **Exact Rounding:** Tokens are decoded with `str::parse::<f64>`, which
+//!    is correctly rounded, so values are bitwise identical to the Python
+//!    reference parser. Only plain decimal tokens with a finite value are
+//!    accepted; `nan`/`inf` spellings and overflowing exponents are deferred
+//!    to the reference parser, which owns their handling.
+//! 3. **Row-Level Isolation:** A malformed cell only clears its own `ok` flag;
+//!    the caller re-parses those cells to produce the canonical error.
+
+use rayon::prelude::*;
+use thiserror::Error;
+
+#[derive(Error, Debug)]
+pub enum ArrayParseError {
+    #[error("Cell offsets must start at 0, be non-decreasing and end at the buffer length ({0} bytes).")]
+    InvalidOffsets(usize),
+}
+
+/// Flat decoding of one column: values laid end to end, per-cell element
+/// counts, and a per-cell success mask (failed cells contribute no values).
+pub struct ParsedColumn {
+    pub flat: Vec<f64>,
+    pub lengths: Vec<i64>,
+    pub ok: Vec<bool>,
+}
+
+/// Decodes one decimal token (`[+-]digits[.digits][(e|E)[+-]digits]`, either
+/// side of the point may be empty). Alphabetic spellings such as `nan`, `inf`
+/// or `infinity`, which `str::parse::<f64>` would accept, and any token whose
+/// value is not finite are declined.
+fn parse_token(token: &str) -> Option<f64> {
+    let decimal = token
+        .bytes()
+        .all(|b| b.is_ascii_digit() || matches!(b, b'+' | b'-' | b'.' | b'e' | b'E'));
+    if !decimal {
+        return None;
+    }
+    token.parse::<f64>().ok().filter(|v| v.is_finite())
+}
+
+/// Decodes a single cell, trimming whitespace and one enclosing bracket pair.
+/// Returns `None` for anything the reference parser would not accept verbatim.
+fn parse_cell(raw: &[u8]) -> Option<Vec<f64>> {
+    let text = std::str::from_utf8(raw).ok()?.trim();
+    let inner = match (text.strip_prefix('['), text.ends_with(']')) {
+        (Some(rest), true) => &rest[..rest.len() - 1],
+        (None, false) => text,
+        _ => return None,
+    };
+    if inner.trim().is_empty() {
+        return Some(Vec::new());
+    }
+    inner
+        .split(',')
+        .map(|token| parse_token(token.trim()))
+        .collect()
+}
+
+/// Decodes every cell `buf[offsets[i]..offsets[i + 1]]` of a joined column.
+///
+/// # Errors
+/// `ArrayParseError::InvalidOffsets` if the offsets do not partition `buf`.
+pub fn parse_array_column(buf: &[u8], offsets: &[i64]) -> Result<ParsedColumn, ArrayParseError> {
+    let valid = offsets.first() == Some(&0)
+        && offsets.last().map(|&end| end as usize) == Some(buf.len())
+        && offsets.windows(2).all(|w| w[0] <= w[1]);
+    if !valid {
+        return Err(ArrayParseError::InvalidOffsets(buf.len()));
+    }
+
+    let cells: Vec<Option<Vec<f64>>> = offsets
+        .par_windows(2)
+        .map(|w| parse_cell(&buf[w[0] as usize..w[1] as usize]))
+        .collect();
+
+    let total = cells.iter().map(|c| c.as_ref().map_or(0, Vec::len)).sum();
+    let mut parsed = ParsedColumn {
+        flat: Vec::with_capacity(total),
+        lengths: Vec::with_capacity(cells.len()),
+        ok: Vec::with_capacity(cells.len()),
+    };
+    for cell in cells {
+        match cell {
+            Some(values) => {
+                parsed.lengths.push(values.len() as i64);
+                parsed.ok.push(true);
+                parsed.flat.extend_from_slice(&values);
+            }
+            None => {
+                parsed.lengths.push(0);
+                parsed.ok.push(false);
+            }
+        }
+    }
+    Ok(parsed)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn run(cells: &[&str]) -> ParsedColumn {
+        let mut offsets = vec![0i64];
+        let mut buf = Vec::new();
+        for cell in cells {
+            buf.extend_from_slice(cell.as_bytes());
+            offsets.push(buf.len() as i64);
+        }
+        parse_array_column(&buf, &offsets).expect("valid offsets")
+    }
+
+    #[test]
+    fn decodes_cells_end_to_end() {
+        let parsed = run(&["[300.0, 350.5]", " [] ", "[1e-5,-2]"]);
+        assert_eq!(parsed.flat, vec![300.0, 350.5, 1e-5, -2.0]);
+        assert_eq!(parsed.lengths, vec![2, 0, 2]);
+        assert_eq!(parsed.ok, vec![true, true, true]);
+    }
+
+    #[test]
+    fn isolates_malformed_cells() {
+        let parsed = run(&["[1.0, bad]", "[1.0,,2.0]", "[1.0", "[4.0]"]);
+        assert_eq!(parsed.ok, vec![false, false, false, true]);
+        assert_eq!(parsed.lengths, vec![0, 0, 0, 1]);
+        assert_eq!(parsed.flat, vec![4.0]);
+    }
+
+    #[test]
+    fn declines_non_finite_tokens() {
+        let parsed = run(&[
+            "[nan, 1.0]",
+            "[inf]",
+            "[-Infinity]",
+            "[1e999]",
+            "[+1, .5, 1.]",
+        ]);
+        assert_eq!(parsed.ok, vec![false, false, false, false, true]);
+        assert_eq!(parsed.flat, vec![1.0, 0.5, 1.0]);
+    }
+
+    #[test]
+    fn rejects_offsets_outside_buffer() {
+        assert!(parse_array_column(b"[1.0]", &[0, 9]).is_err());
+        assert!(parse_array_column(b"[1.0]", &[1, 5]).is_err());
+    }
+}
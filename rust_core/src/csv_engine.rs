@@ -2,8 +2,10 @@
 
 use std::fs::File;
 use std::io::BufReader;
+use std::path::Path;
 use thiserror::Error;
 use std::collections::HashMap;
+use rayon::prelude::*;
 
 #[derive(Error, Debug)]
 pub enum CsvEngineError {
@@ -43,7 +45,7 @@ struct ThermoState {
     kappa: Option<f64>,
 }
 
-pub fn compute_zt_from_csv(path: &str, _deterministic: bool) -> Result<BenchmarkReport, CsvEngineError> {
+pub fn compute_zt_from_csv(path: &Path, _deterministic: bool) -> Result<BenchmarkReport, CsvEngineError> {
     let file = File::open(path)?;
     let reader = BufReader::new(file);
     let mut csv_reader = csv::ReaderBuilder::new()
@@ -219,4 +221,82 @@ fn extract_f64_robust(raw: &str) -> Option<f64> {
     } else {
         trimmed.parse::<f64>().ok()
     }
-}
\ No newline at end of file
+}
+
+// ============================================================================
+// COLUMNAR CURVES READER
+// ============================================================================
+
+/// Records buffered per block before the columns are parsed in parallel.
+const CURVES_BLOCK_ROWS: usize = 65_536;
+
+/// Reads the named numeric columns of a curves CSV into one `Vec<f64>` each.
+///
+/// Columns are selected by header name, in the order requested; every other
+/// column is skipped without being parsed. Rows are pulled as raw
+/// `ByteRecord`s (no UTF-8 validation of the whole row) into a reusable
+/// block; each block is then parsed column-parallel, one rayon task per
+/// selected column, so output order is deterministic. The reader is
+/// flexible, so ragged rows are accepted: cells that are missing, empty or
+/// unparsable become NaN.
+///
+/// # Errors
+/// `CsvEngineError::MissingRequiredColumns` if any requested column is absent
+/// from the header.
+pub fn read_curves_csv(
+    path: &Path,
+    columns: &[String],
+) -> Result<Vec<(String, Vec<f64>)>, CsvEngineError> {
+    let file = File::open(path)?;
+    let mut csv_reader = csv::ReaderBuilder::new()
+        .buffer_capacity(1 << 20)
+        .has_headers(true)
+        .flexible(true)
+        .from_reader(file);
+
+    let names: Vec<String> = csv_reader
+        .byte_headers()?
+        .iter()
+        .map(|h| String::from_utf8_lossy(h).trim().to_string())
+        .collect();
+    let indices = columns
+        .iter()
+        .map(|wanted| names.iter().position(|name| name == wanted))
+        .collect::<Option<Vec<usize>>>()
+        .ok_or(CsvEngineError::MissingRequiredColumns)?;
+
+    let mut values: Vec<Vec<f64>> = vec![Vec::new(); indices.len()];
+    let mut block: Vec<csv::ByteRecord> = vec![csv::ByteRecord::new(); CURVES_BLOCK_ROWS];
+
+    loop {
+        let mut filled = 0;
+        while filled < CURVES_BLOCK_ROWS && csv_reader.read_byte_record(&mut block[filled])? {
+            filled += 1;
+        }
+        if filled == 0 {
+            break;
+        }
+
+        let rows = &block[..filled];
+        values.par_iter_mut().zip(&indices).for_each(|(col, &c)| {
+            col.extend(
+                rows.iter()
+                    .map(|r| r.get(c).map_or(f64::NAN, parse_f64_bytes)),
+            );
+        });
+
+        if filled < CURVES_BLOCK_ROWS {
+            break;
+        }
+    }
+
+    Ok(columns.iter().cloned().zip(values).collect())
+}
+
+#[inline(always)]
+fn parse_f64_bytes(raw: &[u8]) -> f64 {
+    std::str::from_utf8(raw)
+        .ok()
+        .and_then(|s| s.trim().parse::<f64>().ok())
+        .unwrap_or(f64::NAN)
+}
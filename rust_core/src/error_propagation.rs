@@ -105,6 +105,34 @@ pub fn calculate_zt_linear_propagation(
         return Err(ErrorPropagationError::InvalidTemperature(t));
     }
 
+    let (zt, var_zt) = zt_and_variance(s, sigma, kappa, t, errs.err_s, errs.err_sigma, errs.err_kappa, errs.err_t);
+
+    // Section 11 Constraint: Ensure Physical Consistency of Variance
+    if var_zt < 0.0 {
+        return Err(ErrorPropagationError::NegativeVariance(var_zt));
+    }
+
+    Ok(ZtResult {
+        zt,
+        uncertainty: var_zt.sqrt(),
+    })
+}
+
+/// Nominal zT and its first-order variance, without constraint checks.
+///
+/// Shared by [`calculate_zt_linear_propagation`] and the vectorized column
+/// blocks so both paths round identically (no FMA contraction).
+#[inline(always)]
+fn zt_and_variance(
+    s: f64,
+    sigma: f64,
+    kappa: f64,
+    t: f64,
+    err_s: f64,
+    err_sigma: f64,
+    err_kappa: f64,
+    err_t: f64,
+) -> (f64, f64) {
     // Nominal zT Calculation
     let zt = (s * s * sigma * t) / kappa;
 
@@ -115,20 +143,12 @@ pub fn calculate_zt_linear_propagation(
     let dz_dt = (s * s * sigma) / kappa;
 
     // Independent First-Order Variance Propagation
-    let var_zt = (dz_ds * dz_ds) * (errs.err_s * errs.err_s)
-        + (dz_dsigma * dz_dsigma) * (errs.err_sigma * errs.err_sigma)
-        + (dz_dkappa * dz_dkappa) * (errs.err_kappa * errs.err_kappa)
-        + (dz_dt * dz_dt) * (errs.err_t * errs.err_t);
-
-    // Section 11 Constraint: Ensure Physical Consistency of Variance
-    if var_zt < 0.0 {
-        return Err(ErrorPropagationError::NegativeVariance(var_zt));
-    }
+    let var_zt = (dz_ds * dz_ds) * (err_s * err_s)
+        + (dz_dsigma * dz_dsigma) * (err_sigma * err_sigma)
+        + (dz_dkappa * dz_dkappa) * (err_kappa * err_kappa)
+        + (dz_dt * dz_dt) * (err_t * err_t);
 
-    Ok(ZtResult {
-        zt,
-        uncertainty: var_zt.sqrt(),
-    })
+    (zt, var_zt)
 }
 
 /// High-throughput parallel calculation of zT and its uncertainties.
@@ -154,4 +174,138 @@ pub fn calculate_zt_batch_parallel(
         .zip(errs_list.par_iter())
         .map(|(props, errs)| calculate_zt_linear_propagation(props, errs))
         .collect()
-}
\ No newline at end of file
+}
+
+/// Column-wise propagation written straight into caller-owned `zT` and
+/// uncertainty buffers (typically NumPy memory): no per-state structs or
+/// result vectors are materialized. With `deterministic` states are processed
+/// in order and the lowest-index violation is reported; otherwise the rayon
+/// pool is used with the fail-fast semantics of [`calculate_zt_batch_parallel`].
+/// On error the output contents are unspecified.
+/// Callers guarantee all ten slices share one length.
+///
+/// **Document ID:** T03-UNCERTAINTY-PROPAGATION
+pub fn propagate_columns_into(
+    s: &[f64],
+    sigma: &[f64],
+    kappa: &[f64],
+    t: &[f64],
+    err_s: &[f64],
+    err_sigma: &[f64],
+    err_kappa: &[f64],
+    err_t: &[f64],
+    out_zt: &mut [f64],
+    out_unc: &mut [f64],
+    deterministic: bool,
+) -> Result<(), ErrorPropagationError> {
+    let block_at = |b: usize, zt: &mut [f64], unc: &mut [f64]| {
+        let r = b * PROPAGATION_BLOCK..b * PROPAGATION_BLOCK + zt.len();
+        propagate_block(
+            &s[r.clone()], &sigma[r.clone()], &kappa[r.clone()], &t[r.clone()],
+            &err_s[r.clone()], &err_sigma[r.clone()], &err_kappa[r.clone()], &err_t[r],
+            zt, unc,
+        )
+    };
+    if deterministic {
+        for (b, (zt, unc)) in out_zt
+            .chunks_mut(PROPAGATION_BLOCK)
+            .zip(out_unc.chunks_mut(PROPAGATION_BLOCK))
+            .enumerate()
+        {
+            block_at(b, zt, unc)?;
+        }
+        Ok(())
+    } else {
+        out_zt
+            .par_chunks_mut(PROPAGATION_BLOCK)
+            .zip(out_unc.par_chunks_mut(PROPAGATION_BLOCK))
+            .enumerate()
+            .try_for_each(|(b, (zt, unc))| block_at(b, zt, unc))
+    }
+}
+
+/// States per block in [`propagate_columns_into`].
+const PROPAGATION_BLOCK: usize = 1024;
+
+// Hot path: every state of the block is propagated branch-free with a single
+// OR-reduced violation flag, so LLVM auto-vectorizes the gradient products,
+// divisions and `sqrt` into packed AVX2/AVX-512 lanes. A block that contains
+// a violation is re-walked through the scalar checks to report the exact
+// error in index order.
+#[inline(always)]
+#[allow(clippy::needless_range_loop)] // ten parallel columns; zip chains obscure the kernel
+fn propagate_block(
+    s: &[f64],
+    sigma: &[f64],
+    kappa: &[f64],
+    t: &[f64],
+    err_s: &[f64],
+    err_sigma: &[f64],
+    err_kappa: &[f64],
+    err_t: &[f64],
+    out_zt: &mut [f64],
+    out_unc: &mut [f64],
+) -> Result<(), ErrorPropagationError> {
+    // Equal-length reslicing lets LLVM drop the per-lane bounds checks.
+    let n = out_zt.len();
+    let (s, sigma, kappa, t) = (&s[..n], &sigma[..n], &kappa[..n], &t[..n]);
+    let (err_s, err_sigma, err_kappa, err_t) = (&err_s[..n], &err_sigma[..n], &err_kappa[..n], &err_t[..n]);
+    let out_unc = &mut out_unc[..n];
+
+    let mut violated = false;
+    for i in 0..n {
+        let (zt, var_zt) = zt_and_variance(
+            s[i], sigma[i], kappa[i], t[i], err_s[i], err_sigma[i], err_kappa[i], err_t[i],
+        );
+        out_zt[i] = zt;
+        out_unc[i] = var_zt.sqrt();
+        violated |= (kappa[i] <= 0.0) | (t[i] <= 0.0) | (var_zt < 0.0);
+    }
+    if violated {
+        for i in 0..n {
+            let r = calculate_zt_linear_propagation(
+                &ThermoelectricProperties { s: s[i], sigma: sigma[i], kappa: kappa[i], t: t[i] },
+                &PropertyUncertainties {
+                    err_s: err_s[i], err_sigma: err_sigma[i], err_kappa: err_kappa[i], err_t: err_t[i],
+                },
+            )?;
+            out_zt[i] = r.zt;
+            out_unc[i] = r.uncertainty;
+        }
+    }
+    Ok(())
+}
+
+#[cfg(test)]
+mod column_tests {
+    use super::*;
+
+    #[test]
+    fn block_propagation_matches_scalar_across_blocks() {
+        let n = 2 * PROPAGATION_BLOCK + 33;
+        let col = |a: f64, b: f64| -> Vec<f64> { (0..n).map(|i| a + i as f64 * b).collect() };
+        let (s, sigma, mut kappa, t) = (col(1e-4, 1e-8), col(1e4, 1.0), col(0.5, 1e-3), col(300.0, 0.1));
+        let (es, esig, ek, et) = (col(1e-6, 0.0), col(1e2, 0.0), col(0.01, 0.0), col(1.0, 0.0));
+
+        for deterministic in [true, false] {
+            let (mut zt, mut unc) = (vec![0.0; n], vec![0.0; n]);
+            propagate_columns_into(&s, &sigma, &kappa, &t, &es, &esig, &ek, &et, &mut zt, &mut unc, deterministic)
+                .unwrap();
+            for i in 0..n {
+                let r = calculate_zt_linear_propagation(
+                    &ThermoelectricProperties { s: s[i], sigma: sigma[i], kappa: kappa[i], t: t[i] },
+                    &PropertyUncertainties { err_s: es[i], err_sigma: esig[i], err_kappa: ek[i], err_t: et[i] },
+                )
+                .unwrap();
+                assert_eq!((zt[i].to_bits(), unc[i].to_bits()), (r.zt.to_bits(), r.uncertainty.to_bits()));
+            }
+        }
+
+        kappa[PROPAGATION_BLOCK + 3] = 0.0;
+        let (mut zt, mut unc) = (vec![0.0; n], vec![0.0; n]);
+        assert_eq!(
+            propagate_columns_into(&s, &sigma, &kappa, &t, &es, &esig, &ek, &et, &mut zt, &mut unc, true),
+            Err(ErrorPropagationError::InvalidThermalConductivity(0.0))
+        );
+    }
+}
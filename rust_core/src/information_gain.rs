@@ -16,12 +16,17 @@
 //! 2. **L'Hôpital's Singularity Resolution:** Implicitly limits $\lim_{p \to 0} p \ln(p) = 0$.
 //! 3. **Zero-Copy Traversal:** Executes directly over contiguous memory slices via `rayon`.
 
+use pyo3::prelude::*;
 use rayon::prelude::*;
 use std::f64;
 
 /// Struct containing the decoupled entropic evaluations for spatial data gap analysis.
 /// 
 /// **Implements:** CL02-INFORMATION-GAIN-SELECTION (Score Segregation)
+///
+/// Exported to Python as a frozen class with read-only attributes, giving the
+/// FFI a single stable return type (one attribute read per field).
+#[pyclass(frozen, get_all, module = "thermognosis.rust_core")]
 #[derive(Clone, Debug, Default, PartialEq)]
 pub struct GapScore {
     /// Shannon Entropy ($H$) of the measurement distribution.
@@ -32,6 +37,118 @@ pub struct GapScore {
     pub total_score: f64,
 }
 
+/// Evaluates $H$, $D_{KL}$ and $G$ for a single sub-manifold.
+///
+/// `counts` is a caller-owned histogram buffer of length $K$ that is reset on
+/// entry, so each rayon worker reuses one allocation across all the
+/// sub-manifolds it processes. Bin counts are `u32` (a sub-manifold never
+/// exceeds $2^{32}$ states; enforced by the caller), halving histogram
+/// bandwidth relative to `usize`.
+///
+/// `#[inline(always)]`: inlining into `score_fixed::<K>` exposes the
+/// histogram length as a compile-time constant, which is what lets the
+/// specialized kernels unroll the reduction loop.
+#[inline(always)]
+fn score_sub_manifold(
+    t_slice: &[f64],
+    counts: &mut [u32],
+    t_min: f64,
+    delta: f64,
+    ln_k: f64,
+    gamma_1: f64,
+    gamma_2: f64,
+) -> GapScore {
+    let total_counts = t_slice.len();
+
+    // Handle vacuous sub-manifolds (0 measurements)
+    if total_counts == 0 {
+        return GapScore::default();
+    }
+
+    let num_bins = counts.len();
+    counts.fill(0);
+
+    // 5. Compute the Empirical Histogram
+    for &temp in t_slice {
+        // Determine bin index strictly using finite mathematics
+        let mut idx = ((temp - t_min) / delta).floor() as isize;
+
+        // Clamping Policy: Measurements marginally outside the theoretical bounds
+        // are clamped to the terminal bins. This strictly preserves the total
+        // experimental effort metrics (n_k) and prevents probability leakage.
+        if idx < 0 {
+            idx = 0;
+        } else if idx >= num_bins as isize {
+            idx = (num_bins - 1) as isize;
+        }
+
+        counts[idx as usize] += 1;
+    }
+
+    let total_f64 = total_counts as f64;
+    let mut h = 0.0;
+    let mut d_kl = 0.0;
+
+    // 6. Project Entropies safely bounding singularities.
+    // Fused reduction: ln(p_k / u_k) = ln(p_k) + ln(K), so a single logarithm
+    // per occupied bin feeds both H and D_KL in one pass over the histogram.
+    for &count in counts.iter() {
+        if count > 0 {
+            let p_k = f64::from(count) / total_f64;
+
+            // Singularity safe execution: p_k > 0 prevents ln(0) = -inf
+            let ln_p = p_k.ln();
+            h -= p_k * ln_p;
+            d_kl += p_k * (ln_p + ln_k);
+        }
+    }
+
+    // 7. Compute the Aggregated Gap Score Functional
+    let total_score = (gamma_1 * h) + (gamma_2 * d_kl);
+
+    GapScore {
+        entropy: h,
+        kl_divergence: d_kl,
+        total_score,
+    }
+}
+
+/// Bin counts with a monomorphized kernel. Callers overwhelmingly use one of
+/// these small, fixed $K$ (default 10); any other value takes the dynamic path.
+pub const SPECIALIZED_BIN_COUNTS: [usize; 5] = [8, 10, 16, 32, 64];
+
+/// Fixed-$K$ specialization: a stack-resident `[u32; K]` histogram whose
+/// length is known at compile time, so the entropy/KL reduction is fully
+/// unrolled and the bin clamp compares against a constant.
+#[inline]
+fn score_fixed<const K: usize>(
+    t_slice: &[f64],
+    t_min: f64,
+    delta: f64,
+    ln_k: f64,
+    gamma_1: f64,
+    gamma_2: f64,
+) -> GapScore {
+    let mut counts = [0u32; K];
+    score_sub_manifold(t_slice, &mut counts, t_min, delta, ln_k, gamma_1, gamma_2)
+}
+
+/// Parallel driver for a fixed-$K$ kernel.
+fn batch_fixed<const K: usize>(
+    t: &[f64],
+    bounds: &[(usize, usize)],
+    t_min: f64,
+    delta: f64,
+    ln_k: f64,
+    gamma_1: f64,
+    gamma_2: f64,
+) -> Vec<GapScore> {
+    bounds
+        .par_iter()
+        .map(|&(start, end)| score_fixed::<K>(&t[start..end], t_min, delta, ln_k, gamma_1, gamma_2))
+        .collect()
+}
+
 /// Computes the Information Gain and Data Gap Analysis en masse across isolated sub-manifolds.
 /// 
 /// Evaluates the density of the macroscopic observations over the temperature domain $T$.
@@ -60,73 +177,79 @@ pub fn compute_information_gain_batch(
     let len = t.len();
     
     // 2. Strict O(N) Subgraph Boundary Pre-validation 
-    // Mathematically precludes out-of-bounds panics during threaded execution.
+    // Mathematically precludes out-of-bounds panics during threaded execution,
+    // and u32 histogram overflow for pathologically large sub-manifolds.
     for &(start, end) in bounds {
         if start > end || end > len {
             return Err(crate::ThermoError::DimensionMismatch(end, len));
         }
+        if end - start > u32::MAX as usize {
+            return Err(crate::ThermoError::DimensionMismatch(end - start, u32::MAX as usize));
+        }
     }
 
-    // 3. Define the Uniform Prior Density: u_k = 1.0 / K
-    let u_k = 1.0 / (num_bins as f64);
+    // 3. Define the Uniform Prior Density: u_k = 1.0 / K, hence ln(1/u_k) = ln(K)
+    let ln_k = (num_bins as f64).ln();
     let delta = (t_max - t_min) / (num_bins as f64);
 
     // 4. O(M/P) Highly Parallel Entropic Evaluation
-    let results: Vec<GapScore> = bounds
-        .par_iter()
-        .map(|&(start, end)| {
-            let t_slice = &t[start..end];
-            let total_counts = t_slice.len();
-
-            // Handle vacuous sub-manifolds (0 measurements)
-            if total_counts == 0 {
-                return GapScore::default();
-            }
-
-            let mut counts = vec![0usize; num_bins];
-
-            // 5. Compute the Empirical Histogram
-            for &temp in t_slice {
-                // Determine bin index strictly using finite mathematics
-                let mut idx = ((temp - t_min) / delta).floor() as isize;
-                
-                // Clamping Policy: Measurements marginally outside the theoretical bounds 
-                // are clamped to the terminal bins. This strictly preserves the total 
-                // experimental effort metrics (n_k) and prevents probability leakage.
-                if idx < 0 {
-                    idx = 0;
-                } else if idx >= num_bins as isize {
-                    idx = (num_bins - 1) as isize;
-                }
-                
-                counts[idx as usize] += 1;
-            }
-
-            let total_f64 = total_counts as f64;
-            let mut h = 0.0;
-            let mut d_kl = 0.0;
-
-            // 6. Project Entropies safely bounding singularities
-            for &count in &counts {
-                if count > 0 {
-                    let p_k = (count as f64) / total_f64;
-                    
-                    // Singularity safe execution: p_k > 0 prevents ln(0) = -inf
-                    h -= p_k * p_k.ln();
-                    d_kl += p_k * (p_k / u_k).ln();
-                }
-            }
-
-            // 7. Compute the Aggregated Gap Score Functional
-            let total_score = (gamma_1 * h) + (gamma_2 * d_kl);
-
-            GapScore {
-                entropy: h,
-                kl_divergence: d_kl,
-                total_score,
-            }
-        })
-        .collect();
+    // Common bin counts dispatch to monomorphized kernels (partial evaluation
+    // on K); otherwise each worker owns one K-bin histogram (L1-resident for
+    // practical K), reused across every sub-manifold it is assigned.
+    let results: Vec<GapScore> = match num_bins {
+        8 => batch_fixed::<8>(t, bounds, t_min, delta, ln_k, gamma_1, gamma_2),
+        10 => batch_fixed::<10>(t, bounds, t_min, delta, ln_k, gamma_1, gamma_2),
+        16 => batch_fixed::<16>(t, bounds, t_min, delta, ln_k, gamma_1, gamma_2),
+        32 => batch_fixed::<32>(t, bounds, t_min, delta, ln_k, gamma_1, gamma_2),
+        64 => batch_fixed::<64>(t, bounds, t_min, delta, ln_k, gamma_1, gamma_2),
+        _ => bounds
+            .par_iter()
+            .map_init(
+                || vec![0u32; num_bins],
+                |counts, &(start, end)| {
+                    score_sub_manifold(&t[start..end], counts, t_min, delta, ln_k, gamma_1, gamma_2)
+                },
+            )
+            .collect(),
+    };
 
     Ok(results)
-}
\ No newline at end of file
+}
+
+// ============================================================================
+// FIXED-K SPECIALIZATION EQUIVALENCE TESTS
+// ============================================================================
+
+#[cfg(test)]
+mod specialization_tests {
+    use super::*;
+
+    /// Deterministic, unevenly spread temperatures over [300, 1200] K.
+    fn temperatures(n: usize) -> Vec<f64> {
+        (0..n).map(|i| 300.0 + ((i * 7919) % 900) as f64 + 0.25).collect()
+    }
+
+    #[test]
+    fn specialized_kernels_match_dynamic_kernel() {
+        let t = temperatures(2_000);
+        for &k in SPECIALIZED_BIN_COUNTS.iter() {
+            let delta = 900.0 / (k as f64);
+            let ln_k = (k as f64).ln();
+            let mut counts = vec![0u32; k];
+            let dynamic = score_sub_manifold(&t, &mut counts, 300.0, delta, ln_k, 1.0, 0.5);
+            let batch = compute_information_gain_batch(&t, &[(0, t.len())], 300.0, 1200.0, k, 1.0, 0.5)
+                .unwrap();
+            assert_eq!(batch[0], dynamic, "K={} specialization diverged from the dynamic kernel", k);
+        }
+    }
+
+    #[test]
+    fn unspecialized_bin_count_uses_dynamic_path() {
+        let t = temperatures(500);
+        let r = compute_information_gain_batch(&t, &[(0, 250), (250, 500), (500, 500)], 300.0, 1200.0, 7, 1.0, 1.0)
+            .unwrap();
+        assert_eq!(r.len(), 3);
+        assert!(r[0].entropy > 0.0 && r[0].entropy <= 7f64.ln() + 1e-12);
+        assert_eq!(r[2], GapScore::default(), "Vacuous sub-manifold must score zero");
+    }
+}
@@ -20,10 +20,12 @@
 //! 4. **Panic-Free Safety**: All physical constraints, domain violations, and tensor 
 //!    dimension mismatches are trapped and gracefully promoted to Python `ValueError` or `RuntimeError`.
 
+use std::path::PathBuf;
+
 use pyo3::prelude::*;
 use pyo3::exceptions::{PyRuntimeError, PyValueError};
-use pyo3::types::{PyDict, PyList};
-use numpy::{IntoPyArray, PyArray1, PyReadonlyArray1};
+use pyo3::types::PyDict;
+use numpy::{IntoPyArray, PyArray1, PyReadonlyArray1, PyReadonlyArray2};
 
 // Internal module declarations mirroring the core library structure
 pub mod constants;   // Single source of truth for physical bounds (BUG-05)
@@ -40,6 +42,11 @@ pub mod bayesian;
 pub mod ranking_core;
 pub mod information_gain;
 
+// Serialized curve array decoding for the pipeline ingress (SPEC-PIPELINE-DATA-FLOW)
+pub mod array_parser;
+// Temperature binning + long-to-wide state pivot (SPEC-PIPELINE-DATA-FLOW)
+pub mod state_pivot;
+
 // Epistemic Quality Gate — Triple-Gate Physics Arbiter (SPEC-AUDIT-01)
 pub mod audit;
 
@@ -59,10 +66,8 @@ pub mod statistics;
 // Export ThermoError centrally to satisfy crate-level internal references
 pub use bayesian::ThermoError;
 
-use error_propagation::{calculate_zt_linear_propagation, PropertyUncertainties, ThermoelectricProperties};
 use scoring::{QualityEvaluator, QualityVector, ScoringWeights};
 use units::{PhysicalQuantity, UnitDefinition};
-use validation::ThermoelectricState;
 
 /// Macro to securely project flat NumPy arrays into zero-copy, C-contiguous Rust slices.
 /// Implements: SPEC-GOV-ERROR-HIERARCHY (Zero Panic Guarantee)
@@ -77,6 +82,38 @@ macro_rules! extract_slice {
     };
 }
 
+/// Macro to borrow a caller-supplied (or freshly allocated) output array as a
+/// mutable, C-contiguous Rust slice of exactly `len` elements.
+/// Implements: SPEC-GOV-ERROR-HIERARCHY (Zero Panic Guarantee)
+macro_rules! extract_out_slice {
+    ($array:expr, $name:expr, $len:expr) => {{
+        let slice = $array.as_slice_mut().map_err(|_| {
+            PyValueError::new_err(format!(
+                "FFI Egress Violation: Output array '{}' is not C-contiguous in memory.",
+                $name
+            ))
+        })?;
+        enforce_equal_lengths(&[$len, slice.len()])?;
+        slice
+    }};
+}
+
+/// Returns the caller's output buffer, or allocates an uninitialized
+/// NumPy-owned float64 array of length `len`. Kernels receiving it write
+/// every element before returning `Ok`, so no uninitialized value escapes.
+fn output_array<'py>(
+    py: Python<'py>,
+    out: Option<Bound<'py, PyArray1<f64>>>,
+    len: usize,
+) -> PyResult<Bound<'py, PyArray1<f64>>> {
+    Ok(match out {
+        Some(array) => array,
+        // SAFETY: the array is fully overwritten by the kernel on success and
+        // dropped on error.
+        None => unsafe { PyArray1::<f64>::new_bound(py, len, false) },
+    })
+}
+
 /// Validates tensor dimensionality parity across heterogenous arrays.
 /// Implements: SPEC-GOV-ERROR-HIERARCHY
 #[inline(always)]
@@ -167,7 +204,7 @@ pub fn validate_dimensions_py<'py>(
 /// 
 /// **Document IDs**: SPEC-PHYS-CONSISTENCY, SPEC-PHYS-CONSTRAINTS
 #[pyfunction]
-#[pyo3(signature = (s, sigma, kappa, t, deterministic=false))]
+#[pyo3(signature = (s, sigma, kappa, t, deterministic=false, out=None))]
 pub fn check_physics_consistency_py<'py>(
     py: Python<'py>,
     s: PyReadonlyArray1<'py, f64>,
@@ -175,6 +212,7 @@ pub fn check_physics_consistency_py<'py>(
     kappa: PyReadonlyArray1<'py, f64>,
     t: PyReadonlyArray1<'py, f64>,
     deterministic: bool,
+    out: Option<Bound<'py, PyArray1<f64>>>,
 ) -> PyResult<Bound<'py, PyArray1<f64>>> {
     let s_slice = extract_slice!(s, "S");
     let sigma_slice = extract_slice!(sigma, "sigma");
@@ -188,36 +226,29 @@ pub fn check_physics_consistency_py<'py>(
         t_slice.len(),
     ])?;
 
-    let mut states = Vec::with_capacity(len);
-    for i in 0..len {
-        states.push(ThermoelectricState {
-            s: s_slice[i],
-            sigma: sigma_slice[i],
-            kappa: kappa_slice[i],
-            t: t_slice[i],
-        });
+    let zt_out = output_array(py, out, len)?;
+    {
+        let mut zt_rw = zt_out.try_readwrite()?;
+        let zt_slice = extract_out_slice!(zt_rw, "out", len);
+
+        // Validation runs straight on the borrowed NumPy buffers without the
+        // GIL, so other Python threads (I/O, concurrent FFI calls) progress
+        // meanwhile; zT is written into NumPy-owned memory in place.
+        py.allow_threads(|| {
+            validation::validate_columns_zt_into(
+                s_slice, sigma_slice, kappa_slice, t_slice, zt_slice, deterministic,
+            )
+        }).map_err(|e| PyValueError::new_err(e.to_string()))?;
     }
 
-    let validated = py.allow_threads(|| {
-        if deterministic {
-            states
-                .iter()
-                .map(|st| st.validate())
-                .collect::<Result<Vec<_>, _>>()
-        } else {
-            validation::validate_states_par(&states)
-        }
-    }).map_err(|e| PyValueError::new_err(e.to_string()))?;
-
-    let zt_out: Vec<f64> = validated.into_iter().map(|v| v.zt()).collect();
-    Ok(zt_out.into_pyarray_bound(py))
+    Ok(zt_out)
 }
 
 /// Computes the first-order analytical propagation of standard measurement uncertainties for zT.
 /// 
 /// **Document IDs**: P02-ZT-ERROR-PROPAGATION, T03-UNCERTAINTY-PROPAGATION, SPEC-PHYS-ERROR-PROPAGATION
 #[pyfunction]
-#[pyo3(signature = (s, sigma, kappa, t, err_s, err_sigma, err_kappa, err_t, deterministic=false))]
+#[pyo3(signature = (s, sigma, kappa, t, err_s, err_sigma, err_kappa, err_t, deterministic=false, out_zt=None, out_unc=None))]
 #[allow(clippy::too_many_arguments)]
 pub fn propagate_error_py<'py>(
     py: Python<'py>,
@@ -230,6 +261,8 @@ pub fn propagate_error_py<'py>(
     err_kappa: PyReadonlyArray1<'py, f64>,
     err_t: PyReadonlyArray1<'py, f64>,
     deterministic: bool,
+    out_zt: Option<Bound<'py, PyArray1<f64>>>,
+    out_unc: Option<Bound<'py, PyArray1<f64>>>,
 ) -> PyResult<(Bound<'py, PyArray1<f64>>, Bound<'py, PyArray1<f64>>)> {
     let s_slice = extract_slice!(s, "S");
     let sigma_slice = extract_slice!(sigma, "sigma");
@@ -245,39 +278,61 @@ pub fn propagate_error_py<'py>(
         es_slice.len(), esigma_slice.len(), ekappa_slice.len(), et_slice.len(),
     ])?;
 
-    let mut props = Vec::with_capacity(len);
-    let mut errs = Vec::with_capacity(len);
-    for i in 0..len {
-        props.push(ThermoelectricProperties {
-            s: s_slice[i], sigma: sigma_slice[i], kappa: kappa_slice[i], t: t_slice[i],
-        });
-        errs.push(PropertyUncertainties {
-            err_s: es_slice[i], err_sigma: esigma_slice[i], err_kappa: ekappa_slice[i], err_t: et_slice[i],
-        });
+    let zt_out = output_array(py, out_zt, len)?;
+    let unc_out = output_array(py, out_unc, len)?;
+    {
+        // Passing the same array as both outputs fails this second borrow.
+        let mut zt_rw = zt_out.try_readwrite()?;
+        let mut unc_rw = unc_out.try_readwrite()?;
+        let zt_slice = extract_out_slice!(zt_rw, "out_zt", len);
+        let unc_slice = extract_out_slice!(unc_rw, "out_unc", len);
+
+        // Propagation reads the input columns and writes both outputs in
+        // place, entirely without the GIL.
+        py.allow_threads(|| {
+            error_propagation::propagate_columns_into(
+                s_slice, sigma_slice, kappa_slice, t_slice,
+                es_slice, esigma_slice, ekappa_slice, et_slice,
+                zt_slice, unc_slice, deterministic,
+            )
+        }).map_err(|e| PyValueError::new_err(e.to_string()))?;
     }
 
-    let results = py.allow_threads(|| {
-        if deterministic {
-            props.iter().zip(errs.iter())
-                .map(|(p, e)| calculate_zt_linear_propagation(p, e))
-                .collect::<Result<Vec<_>, _>>()
-        } else {
-            error_propagation::calculate_zt_batch_parallel(&props, &errs)
-        }
-    }).map_err(|e| PyValueError::new_err(e.to_string()))?;
+    Ok((zt_out, unc_out))
+}
 
-    let mut out_zt = Vec::with_capacity(len);
-    let mut out_unc = Vec::with_capacity(len);
-    for r in results {
-        out_zt.push(r.zt);
-        out_unc.push(r.uncertainty);
-    }
+/// Evaluates the positivity hard-constraint gate in one fused pass:
+/// `(zT >= 0) & (T > 0) & (kappa > 0) & (sigma > 0)` per state.
+///
+/// **Document IDs**: SPEC-PHYS-CONSTRAINTS
+#[pyfunction]
+#[pyo3(signature = (zt, t, kappa, sigma))]
+pub fn compute_hard_constraint_gate_py<'py>(
+    py: Python<'py>,
+    zt: PyReadonlyArray1<'py, f64>,
+    t: PyReadonlyArray1<'py, f64>,
+    kappa: PyReadonlyArray1<'py, f64>,
+    sigma: PyReadonlyArray1<'py, f64>,
+) -> PyResult<Bound<'py, PyArray1<bool>>> {
+    let zt_slice = extract_slice!(zt, "zT");
+    let t_slice = extract_slice!(t, "T");
+    let kappa_slice = extract_slice!(kappa, "kappa");
+    let sigma_slice = extract_slice!(sigma, "sigma");
+
+    enforce_equal_lengths(&[zt_slice.len(), t_slice.len(), kappa_slice.len(), sigma_slice.len()])?;
 
-    Ok((out_zt.into_pyarray_bound(py), out_unc.into_pyarray_bound(py)))
+    let gate = py.allow_threads(|| {
+        validation::hard_constraint_gate(zt_slice, t_slice, kappa_slice, sigma_slice)
+    });
+    Ok(gate.into_pyarray_bound(py))
 }
 
 /// Evaluates epistemological bounds, data credibility, and thermodynamic consistency 
 /// to assign an authoritative Quality Class to empirical samples.
+///
+/// `completeness`, `smoothness` and `metadata` may be `None`, meaning a uniform
+/// score of 1.0 for every record; nothing is materialized for them on either
+/// side of the FFI boundary.
 /// 
 /// **Document IDs**: SPEC-QUAL-SCORING, SPEC-QUAL-CREDIBILITY, SPEC-QUAL-COMPLETENESS
 #[pyfunction]
@@ -285,67 +340,80 @@ pub fn propagate_error_py<'py>(
 #[allow(clippy::too_many_arguments)]
 pub fn compute_quality_score_py<'py>(
     py: Python<'py>,
-    completeness: PyReadonlyArray1<'py, f64>,
+    completeness: Option<PyReadonlyArray1<'py, f64>>,
     credibility: PyReadonlyArray1<'py, f64>,
     phys_consistency: PyReadonlyArray1<'py, f64>,
     error_mag: PyReadonlyArray1<'py, f64>,
-    smoothness: PyReadonlyArray1<'py, f64>,
-    metadata: PyReadonlyArray1<'py, f64>,
+    smoothness: Option<PyReadonlyArray1<'py, f64>>,
+    metadata: Option<PyReadonlyArray1<'py, f64>>,
     hard_gate: PyReadonlyArray1<'py, bool>, 
     lambda_reg: f64,
     deterministic: bool,
 ) -> PyResult<(Bound<'py, PyArray1<f64>>, Bound<'py, PyArray1<f64>>, Bound<'py, PyArray1<f64>>, Bound<'py, PyArray1<u8>>)> {
-    let c_slice = extract_slice!(completeness, "completeness");
+    let c_slice = match &completeness {
+        Some(a) => Some(extract_slice!(a, "completeness")),
+        None => None,
+    };
     let cr_slice = extract_slice!(credibility, "credibility");
     let ph_slice = extract_slice!(phys_consistency, "physics_consistency");
     let err_slice = extract_slice!(error_mag, "error_magnitude");
-    let sm_slice = extract_slice!(smoothness, "smoothness");
-    let meta_slice = extract_slice!(metadata, "metadata");
+    let sm_slice = match &smoothness {
+        Some(a) => Some(extract_slice!(a, "smoothness")),
+        None => None,
+    };
+    let meta_slice = match &metadata {
+        Some(a) => Some(extract_slice!(a, "metadata")),
+        None => None,
+    };
     let hg_slice = extract_slice!(hard_gate, "hard_constraint_gate");
 
-    let len = enforce_equal_lengths(&[
-        c_slice.len(), cr_slice.len(), ph_slice.len(),
-        err_slice.len(), sm_slice.len(), meta_slice.len(), hg_slice.len(),
-    ])?;
-
-    let mut vectors = Vec::with_capacity(len);
-    for i in 0..len {
-        vectors.push(QualityVector {
-            completeness: c_slice[i],
-            credibility: cr_slice[i],
-            physics_consistency: ph_slice[i],
-            error_magnitude: err_slice[i],
-            smoothness: sm_slice[i],
-            metadata: meta_slice[i],
-            hard_constraint_gate: hg_slice[i],
-        });
-    }
+    let mut lengths = vec![cr_slice.len(), ph_slice.len(), err_slice.len(), hg_slice.len()];
+    lengths.extend([c_slice, sm_slice, meta_slice].iter().flatten().map(|s| s.len()));
+    let len = enforce_equal_lengths(&lengths)?;
 
     let evaluator = QualityEvaluator::new(ScoringWeights::default(), lambda_reg)
         .map_err(|e| PyRuntimeError::new_err(e.to_string()))?;
 
-    let evaluated = py.allow_threads(|| {
-        if deterministic {
+    // Packing, evaluation and output extraction all run without the GIL.
+    let (out_base, out_reg, out_ent, out_cls) = py.allow_threads(|| {
+        // Absent uniform metrics read as 1.0 without allocating a backing array.
+        let uniform = |slice: Option<&[f64]>, i: usize| slice.map_or(1.0, |s| s[i]);
+
+        let mut vectors = Vec::with_capacity(len);
+        for i in 0..len {
+            vectors.push(QualityVector {
+                completeness: uniform(c_slice, i),
+                credibility: cr_slice[i],
+                physics_consistency: ph_slice[i],
+                error_magnitude: err_slice[i],
+                smoothness: uniform(sm_slice, i),
+                metadata: uniform(meta_slice, i),
+                hard_constraint_gate: hg_slice[i],
+            });
+        }
+
+        let evaluated = if deterministic {
             vectors.iter()
                 .map(|v| evaluator.evaluate_record(v))
                 .collect::<Result<Vec<_>, _>>()
         } else {
             evaluator.evaluate_batch(&vectors)
+        }?;
+
+        let mut out_base = Vec::with_capacity(len);
+        let mut out_reg = Vec::with_capacity(len);
+        let mut out_ent = Vec::with_capacity(len);
+        let mut out_cls = Vec::with_capacity(len);
+
+        for res in evaluated {
+            out_base.push(res.base_score);
+            out_reg.push(res.regularized_score);
+            out_ent.push(res.entropy);
+            out_cls.push(res.class as u8); // Strictly maps back to discrete QualityClass levels
         }
+        Ok::<_, scoring::ScoringError>((out_base, out_reg, out_ent, out_cls))
     }).map_err(|e| PyValueError::new_err(e.to_string()))?;
 
-    let mut out_base = Vec::with_capacity(len);
-    let mut out_reg = Vec::with_capacity(len);
-    let mut out_ent = Vec::with_capacity(len);
-    let mut out_cls = Vec::with_capacity(len);
-
-    for res in evaluated {
-        out_base.push(res.base_score);
-        out_reg.push(res.regularized_score);
-        out_ent.push(res.entropy);
-        out_cls.push(res.class as u8); // Strictly maps back to discrete QualityClass levels
-    }
-
     Ok((
         out_base.into_pyarray_bound(py),
         out_reg.into_pyarray_bound(py),
@@ -385,17 +453,47 @@ pub fn py_compute_zt_batch<'py>(
     Ok(zt_out.into_pyarray_bound(py))
 }
 
+/// Fused stress-test kernel: generates `n` seeded synthetic states and gates
+/// them through the `py_compute_zt_batch` physics criteria tile by tile, so no
+/// S/σ/κ/T input arrays are materialized on either side of the FFI.
+///
+/// **Implements:** SPEC-PHYS-CONSTRAINTS, P01-THERMOELECTRIC-EQUATIONS
+#[pyfunction]
+#[pyo3(signature = (n, seed=0))]
+pub fn py_stress_test_zt(py: Python<'_>, n: usize, seed: u64) -> Bound<'_, PyArray1<f64>> {
+    let zt_out = py.allow_threads(|| physics::stress_test_zt(n, seed));
+    zt_out.into_pyarray_bound(py)
+}
+
+/// Reduces a gated zT vector to `(valid_count, invalid_count, mean, max)` in
+/// one GIL-free pass over the borrowed buffer, skipping NaN rejections.
+///
+/// **Implements:** SPEC-PHYS-CONSTRAINTS
+#[pyfunction]
+#[pyo3(signature = (zt))]
+pub fn summarize_zt_py(py: Python<'_>, zt: PyReadonlyArray1<'_, f64>) -> PyResult<(usize, usize, f64, f64)> {
+    let zt_slice = extract_slice!(zt, "zT");
+    Ok(py.allow_threads(|| physics::summarize_zt(zt_slice)))
+}
+
 /// Computes theoretical figure of merit (zT) directly from structured CSV streams.
 ///
 /// Interrogates massive CSV datasets utilizing our zero-allocation `csv_engine`.
 /// Maps mathematical instability directly to Python equivalents (SPEC-GOV-ERROR-HIERARCHY)
 /// to strictly prevent unwinding or panic leaks at the library boundary.
+///
+/// `path` accepts any `str` or `os.PathLike`; it is taken via `os.fspath`
+/// straight into an OS-native `PathBuf`, so no `str(path)` round-trip is
+/// needed and non-UTF-8 file names are opened as-is.
 #[pyfunction]
 #[pyo3(signature = (path, deterministic=true))]
-pub fn compute_zt_from_csv_py(py: Python, path: String, deterministic: bool) -> PyResult<PyObject> {
+pub fn compute_zt_from_csv_py(py: Python, path: PathBuf, deterministic: bool) -> PyResult<PyObject> {
     // 1. Delegate execution to the dedicated, robust I/O parsing engine.
-    let report = csv_engine::compute_zt_from_csv(&path, deterministic)
-        .map_err(|e| PyValueError::new_err(e.to_string()))?;
+    //    File read and parse touch no Python objects, so the GIL is released
+    //    for the whole pass and concurrent callers proceed in parallel.
+    let report = py.allow_threads(|| {
+        csv_engine::compute_zt_from_csv(&path, deterministic)
+    }).map_err(|e| PyValueError::new_err(e.to_string()))?;
 
     // 2. Initialize a bound, native Python Dictionary for zero-overhead transit.
     let dict = PyDict::new_bound(py);
@@ -414,6 +512,28 @@ pub fn compute_zt_from_csv_py(py: Python, path: String, deterministic: bool) ->
     Ok(dict.into())
 }
 
+/// Loads the named numeric columns of a Starrydata curves CSV as a dict of
+/// column name -> float64 array.
+///
+/// Replaces `pandas.read_csv` for the raw property table: columns are picked
+/// by header name, rows are parsed in a bounded buffer with the GIL released,
+/// and each column is handed to NumPy without a copy. Missing or unparsable
+/// cells are NaN; a requested column absent from the header raises
+/// `ValueError`. `path` is taken as in `compute_zt_from_csv_py`.
+#[pyfunction]
+#[pyo3(signature = (path, columns))]
+pub fn read_curves_csv_py(py: Python, path: PathBuf, columns: Vec<String>) -> PyResult<PyObject> {
+    let parsed = py.allow_threads(|| {
+        csv_engine::read_curves_csv(&path, &columns)
+    }).map_err(|e| PyValueError::new_err(e.to_string()))?;
+
+    let dict = PyDict::new_bound(py);
+    for (name, values) in parsed {
+        dict.set_item(name, values.into_pyarray_bound(py))?;
+    }
+    Ok(dict.into())
+}
+
 // ============================================================================
 // ADVANCED ANALYTICS: BAYESIAN, RANKING & INFORMATION GAIN
 // ============================================================================
@@ -458,6 +578,9 @@ pub fn compute_log_posterior_batch_py<'py>(
 
 /// Computes the citation-aware, entropy-regularized material ranking manifold
 /// concurrently over massive topological representations.
+///
+/// `material_bounds` is a C-contiguous (M, 2) `int64` array of half-open
+/// `[start, end)` slices into `p`, `zt` and `c`.
 /// 
 /// **Implements:** SPEC-GRAPH-RANK, G03-EMBEDDING-RANK-THEORY
 #[pyfunction]
@@ -467,7 +590,7 @@ pub fn compute_material_rank_batch_py<'py>(
     p: PyReadonlyArray1<'py, f64>,
     zt: PyReadonlyArray1<'py, f64>,
     c: PyReadonlyArray1<'py, f64>,
-    material_bounds: Vec<(usize, usize)>,
+    material_bounds: PyReadonlyArray2<'py, i64>,
     alpha: f64,
     beta: f64,
 ) -> PyResult<Bound<'py, PyArray1<f64>>> {
@@ -475,6 +598,28 @@ pub fn compute_material_rank_batch_py<'py>(
     let zt_slice = extract_slice!(zt, "zt");
     let c_slice = extract_slice!(c, "c");
 
+    // (M, 2) int64 bounds arrive as one buffer; unpack rows without touching
+    // Python objects. Negative entries are rejected before the usize cast.
+    let bounds_view = material_bounds.as_array();
+    if bounds_view.ncols() != 2 {
+        return Err(PyValueError::new_err(format!(
+            "FFI Ingress Violation: 'material_bounds' must have shape (M, 2), found (M, {}).",
+            bounds_view.ncols()
+        )));
+    }
+    let material_bounds: Vec<(usize, usize)> = bounds_view
+        .outer_iter()
+        .map(|row| {
+            if row[0] < 0 || row[1] < 0 {
+                Err(PyValueError::new_err(
+                    "FFI Ingress Violation: 'material_bounds' contains negative indices.",
+                ))
+            } else {
+                Ok((row[0] as usize, row[1] as usize))
+            }
+        })
+        .collect::<PyResult<_>>()?;
+
     // Bounding vectors map sub-graph boundaries, averting expensive allocations
     let ranks = py.allow_threads(|| {
         ranking_core::compute_material_rank_batch(
@@ -487,6 +632,9 @@ pub fn compute_material_rank_batch_py<'py>(
 
 /// Computes the Information Gain and Data Gap Analysis en masse.
 /// Evaluates spatial exploration entropy strictly limiting undefined singularities.
+///
+/// Returns one frozen `GapScore` per bound (`entropy`, `kl_divergence`,
+/// `total_score` attributes) — a stable PyO3 type rather than ad-hoc dicts.
 /// 
 /// **Implements:** SPEC-ACTIVE-GAP, CL02-INFORMATION-GAIN-SELECTION
 #[pyfunction]
@@ -500,28 +648,117 @@ pub fn compute_information_gain_batch_py<'py>(
     num_bins: usize,
     gamma_1: f64,
     gamma_2: f64,
-) -> PyResult<Bound<'py, PyList>> {
+) -> PyResult<Vec<information_gain::GapScore>> {
     let t_slice = extract_slice!(t, "t");
 
-    let results = py.allow_threads(|| {
+    py.allow_threads(|| {
         information_gain::compute_information_gain_batch(
             t_slice, &bounds, t_min, t_max, num_bins, gamma_1, gamma_2
         )
+    }).map_err(|e| PyValueError::new_err(e.to_string()))
+}
+
+/// Decodes a column of serialized curve arrays joined into one byte buffer.
+///
+/// `offsets` has one more entry than there are cells; cell `i` spans
+/// `buf[offsets[i]..offsets[i + 1]]`. The `bytes` object is borrowed without
+/// copying and decoded in parallel with the GIL released.
+///
+/// Returns `(flat, lengths, ok)` as NumPy arrays; cells with `ok == False`
+/// contribute no values and must be re-parsed by the caller.
+///
+/// **Implements:** SPEC-PIPELINE-DATA-FLOW, SPEC-GOV-ERROR-HIERARCHY
+#[pyfunction]
+#[pyo3(signature = (buf, offsets))]
+pub fn parse_array_column_py<'py>(
+    py: Python<'py>,
+    buf: &[u8],
+    offsets: PyReadonlyArray1<'py, i64>,
+) -> PyResult<(Bound<'py, PyArray1<f64>>, Bound<'py, PyArray1<i64>>, Bound<'py, PyArray1<bool>>)> {
+    let offsets_slice = extract_slice!(offsets, "offsets");
+
+    let parsed = py.allow_threads(|| array_parser::parse_array_column(buf, offsets_slice))
+        .map_err(|e| PyValueError::new_err(e.to_string()))?;
+
+    Ok((
+        parsed.flat.into_pyarray_bound(py),
+        parsed.lengths.into_pyarray_bound(py),
+        parsed.ok.into_pyarray_bound(py),
+    ))
+}
+
+/// Bins temperatures and pivots long-format property points into the wide
+/// state matrix in one GIL-free hash pass.
+///
+/// Returns `(sample_id, t_binned, columns)` where `columns[p]` holds the mean
+/// of property index `p` per `(sample_id, t_binned)` row (NaN if absent);
+/// rows are sorted by `(sample_id, t_binned)`.
+///
+/// **Implements:** SPEC-PIPELINE-DATA-FLOW
+#[pyfunction]
+#[pyo3(signature = (sample_id, t, prop_idx, y, n_props, bin_width=10.0))]
+pub fn bin_and_pivot_py<'py>(
+    py: Python<'py>,
+    sample_id: PyReadonlyArray1<'py, i64>,
+    t: PyReadonlyArray1<'py, f64>,
+    prop_idx: PyReadonlyArray1<'py, u8>,
+    y: PyReadonlyArray1<'py, f64>,
+    n_props: usize,
+    bin_width: f64,
+) -> PyResult<(Bound<'py, PyArray1<i64>>, Bound<'py, PyArray1<f64>>, Vec<Bound<'py, PyArray1<f64>>>)> {
+    let sample_id_slice = extract_slice!(sample_id, "sample_id");
+    let t_slice = extract_slice!(t, "T");
+    let prop_slice = extract_slice!(prop_idx, "prop_idx");
+    let y_slice = extract_slice!(y, "y");
+
+    let table = py.allow_threads(|| {
+        state_pivot::bin_and_pivot(sample_id_slice, t_slice, prop_slice, y_slice, n_props, bin_width)
     }).map_err(|e| PyValueError::new_err(e.to_string()))?;
 
-    // Pre-allocate the vector to sidestep reallocation costs
-    let mut dicts = Vec::with_capacity(results.len());
+    Ok((
+        table.sample_id.into_pyarray_bound(py),
+        table.t_binned.into_pyarray_bound(py),
+        table.columns.into_iter().map(|c| c.into_pyarray_bound(py)).collect(),
+    ))
+}
 
-    // Transparently project the strict metrics back into dynamically typed Python bindings
-    for res in results {
-        let dict = PyDict::new_bound(py);
-        dict.set_item("entropy", res.entropy)?;
-        dict.set_item("kl_divergence", res.kl_divergence)?;
-        dict.set_item("total_score", res.total_score)?;
-        dicts.push(dict);
-    }
+/// [`bin_and_pivot_py`] with SI unit normalization fused into the same pass:
+/// `y[i]` is scaled by `unit_factors[prop_idx[i] * n_units + unit_idx[i]]`,
+/// a row-major `n_props x n_units` codebook, before it is averaged.
+///
+/// **Implements:** SPEC-PIPELINE-DATA-FLOW
+#[pyfunction]
+#[pyo3(signature = (sample_id, t, prop_idx, unit_idx, y, unit_factors, n_props, bin_width=10.0))]
+#[allow(clippy::too_many_arguments)]
+pub fn normalize_and_bin_py<'py>(
+    py: Python<'py>,
+    sample_id: PyReadonlyArray1<'py, i64>,
+    t: PyReadonlyArray1<'py, f64>,
+    prop_idx: PyReadonlyArray1<'py, u8>,
+    unit_idx: PyReadonlyArray1<'py, u32>,
+    y: PyReadonlyArray1<'py, f64>,
+    unit_factors: PyReadonlyArray1<'py, f64>,
+    n_props: usize,
+    bin_width: f64,
+) -> PyResult<(Bound<'py, PyArray1<i64>>, Bound<'py, PyArray1<f64>>, Vec<Bound<'py, PyArray1<f64>>>)> {
+    let sample_id_slice = extract_slice!(sample_id, "sample_id");
+    let t_slice = extract_slice!(t, "T");
+    let prop_slice = extract_slice!(prop_idx, "prop_idx");
+    let unit_slice = extract_slice!(unit_idx, "unit_idx");
+    let y_slice = extract_slice!(y, "y");
+    let factor_slice = extract_slice!(unit_factors, "unit_factors");
+
+    let table = py.allow_threads(|| {
+        state_pivot::normalize_and_bin(
+            sample_id_slice, t_slice, prop_slice, unit_slice, y_slice, factor_slice, n_props, bin_width,
+        )
+    }).map_err(|e| PyValueError::new_err(e.to_string()))?;
 
-    Ok(PyList::new_bound(py, &dicts))
+    Ok((
+        table.sample_id.into_pyarray_bound(py),
+        table.t_binned.into_pyarray_bound(py),
+        table.columns.into_iter().map(|c| c.into_pyarray_bound(py)).collect(),
+    ))
 }
 
 // ============================================================================
@@ -634,24 +871,33 @@ pub fn audit_thermodynamics_py<'py>(
 fn rust_core(m: &Bound<'_, PyModule>) -> PyResult<()> {
     // Register mathematical & governance bounding functions
     m.add_function(wrap_pyfunction!(py_compute_zt_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(py_stress_test_zt, m)?)?;
+    m.add_function(wrap_pyfunction!(summarize_zt_py, m)?)?;
     m.add_function(wrap_pyfunction!(validate_dimensions_py, m)?)?;
     m.add_function(wrap_pyfunction!(check_physics_consistency_py, m)?)?;
     m.add_function(wrap_pyfunction!(propagate_error_py, m)?)?;
     m.add_function(wrap_pyfunction!(compute_quality_score_py, m)?)?;
+    m.add_function(wrap_pyfunction!(compute_hard_constraint_gate_py, m)?)?;
     
     // High-Performance I/O Parsing
     m.add_function(wrap_pyfunction!(compute_zt_from_csv_py, m)?)?; 
+    m.add_function(wrap_pyfunction!(read_curves_csv_py, m)?)?;
 
     // Advanced Analytica Bindings
     m.add_function(wrap_pyfunction!(compute_log_posterior_batch_py, m)?)?;
     m.add_function(wrap_pyfunction!(compute_material_rank_batch_py, m)?)?;
     m.add_function(wrap_pyfunction!(compute_information_gain_batch_py, m)?)?;
+    m.add_function(wrap_pyfunction!(parse_array_column_py, m)?)?;
+    m.add_function(wrap_pyfunction!(bin_and_pivot_py, m)?)?;
+    m.add_function(wrap_pyfunction!(normalize_and_bin_py, m)?)?;
+    m.add_class::<information_gain::GapScore>()?;
 
     // Triple-Gate Epistemic Audit (SPEC-AUDIT-01)
     m.add_function(wrap_pyfunction!(audit_thermodynamics_py, m)?)?;
 
     // Parallel Mirror Directory Walker (SPEC-IO-WALKER-01)
     m.add_function(wrap_pyfunction!(mirror_walker::py_scan_domain, m)?)?;
+    m.add_function(wrap_pyfunction!(mirror_walker::py_scan_domain_columnar, m)?)?;
     m.add_function(wrap_pyfunction!(mirror_walker::py_enumerate_domain_paths, m)?)?;
     m.add_function(wrap_pyfunction!(mirror_walker::py_validate_single_file, m)?)?;
 
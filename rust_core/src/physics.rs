@@ -226,6 +226,48 @@ pub fn wiedemann_franz_decomposition(
 // MASSIVE MACROSCOPIC BATCH OPERATORS
 // ============================================================================
 
+/// Per-state physics gate shared by the batch kernels: returns zT, or
+/// `f64::NAN` if any rejection criterion of [`calc_zt_batch`] fails.
+#[inline(always)] // hot path: evaluated once per state inside rayon loops
+fn gated_zt(s_val: f64, sigma_val: f64, kappa_val: f64, t_val: f64) -> f64 {
+    // Stage 1 — P03 Positivity + Finiteness (hard thermodynamic invariants)
+    if !s_val.is_finite()
+        || !sigma_val.is_finite()
+        || !kappa_val.is_finite()
+        || !t_val.is_finite()
+        || t_val <= 0.0
+        || kappa_val <= 0.0
+        || sigma_val <= 0.0
+    {
+        return f64::NAN;
+    }
+
+    // Stage 2 — P04 Wiedemann-Franz Limit: L = κ/(σT) ∈ [L_MIN, L_MAX]
+    let implied_l = kappa_val / (sigma_val * t_val);
+    if implied_l < L_MIN || implied_l > L_MAX {
+        return f64::NAN;
+    }
+
+    // Stage 3 — P03 Empirical Bounds (BUG-05 corrected to use canonical constants)
+    // |S| must not exceed 1000 µV/K = 1 mV/K = 1e-3 V/K (S_MAX_ABS).
+    // σ must not exceed 10^7 S/m (SIGMA_MAX).
+    // κ must not exceed 100 W/(m·K) (KAPPA_MAX).
+    if s_val.abs() > S_MAX_ABS || sigma_val > SIGMA_MAX || kappa_val > KAPPA_MAX {
+        return f64::NAN;
+    }
+
+    // Stage 4 — P01 Evaluation: zT = S²σT/κ
+    let zt = (s_val * s_val * sigma_val * t_val) / kappa_val;
+
+    // Stage 5 — P05 Resultant Positivity and physical upper bound
+    // zT ≤ 4 is a practical limit; no bulk material exceeds ~3.5 as of 2025.
+    if !zt.is_finite() || zt < 0.0 || zt > 4.0 {
+        return f64::NAN;
+    }
+
+    zt
+}
+
 /// Highly optimized batch computation of Figure of Merit (zT) using parallel iterators.
 /// Designed for zero-copy FFI invocation over vast macroscopic parameter arrays.
 ///
@@ -269,52 +311,102 @@ pub fn calc_zt_batch(
         .zip(sigma)
         .zip(kappa)
         .zip(t)
-        .map(|(((si, sigi), kapi), ti)| {
-            let s_val = *si;
-            let sigma_val = *sigi;
-            let kappa_val = *kapi;
-            let t_val = *ti;
-
-            // Stage 1 — P03 Positivity + Finiteness (hard thermodynamic invariants)
-            if !s_val.is_finite()
-                || !sigma_val.is_finite()
-                || !kappa_val.is_finite()
-                || !t_val.is_finite()
-                || t_val <= 0.0
-                || kappa_val <= 0.0
-                || sigma_val <= 0.0
-            {
-                return f64::NAN;
-            }
+        .map(|(((&s_val, &sigma_val), &kappa_val), &t_val)| gated_zt(s_val, sigma_val, kappa_val, t_val))
+        .collect();
 
-            // Stage 2 — P04 Wiedemann-Franz Limit: L = κ/(σT) ∈ [L_MIN, L_MAX]
-            let implied_l = kappa_val / (sigma_val * t_val);
-            if implied_l < L_MIN || implied_l > L_MAX {
-                return f64::NAN;
-            }
+    Ok(results)
+}
 
-            // Stage 3 — P03 Empirical Bounds (BUG-05 corrected to use canonical constants)
-            // |S| must not exceed 1000 µV/K = 1 mV/K = 1e-3 V/K (S_MAX_ABS).
-            // σ must not exceed 10^7 S/m (SIGMA_MAX).
-            // κ must not exceed 100 W/(m·K) (KAPPA_MAX).
-            if s_val.abs() > S_MAX_ABS || sigma_val > SIGMA_MAX || kappa_val > KAPPA_MAX {
-                return f64::NAN;
-            }
+// ============================================================================
+// FUSED STRESS-TEST GENERATOR
+// ============================================================================
 
-            // Stage 4 — P01 Evaluation: zT = S²σT/κ
-            let zt = (s_val * s_val * sigma_val * t_val) / kappa_val;
+/// States per generator tile; every tile draws from its own RNG stream.
+const STRESS_TILE: usize = 4096;
+
+/// SplitMix64 (Steele, Lea & Flood, 2014): a tiny counter-based 64-bit
+/// generator, ample for synthetic benchmark states and dependency-free.
+struct SplitMix64(u64);
+
+impl SplitMix64 {
+    #[inline(always)] // hot path: four draws per generated state
+    fn next_u64(&mut self) -> u64 {
+        self.0 = self.0.wrapping_add(0x9E37_79B9_7F4A_7C15);
+        let mut z = self.0;
+        z = (z ^ (z >> 30)).wrapping_mul(0xBF58_476D_1CE4_E5B9);
+        z = (z ^ (z >> 27)).wrapping_mul(0x94D0_49BB_1331_11EB);
+        z ^ (z >> 31)
+    }
 
-            // Stage 5 — P05 Resultant Positivity and physical upper bound
-            // zT ≤ 4 is a practical limit; no bulk material exceeds ~3.5 as of 2025.
-            if !zt.is_finite() || zt < 0.0 || zt > 4.0 {
-                return f64::NAN;
+    /// Uniform draw in `[lo, hi)` from the top 53 bits.
+    #[inline(always)] // hot path: four draws per generated state
+    fn uniform(&mut self, lo: f64, hi: f64) -> f64 {
+        let unit = (self.next_u64() >> 11) as f64 * (1.0 / (1u64 << 53) as f64);
+        lo + (hi - lo) * unit
+    }
+}
+
+/// Generates `n` synthetic thermoelectric states and gates them through the
+/// [`calc_zt_batch`] criteria in one fused pass, returning only zT (`NAN` for
+/// rejected states).
+///
+/// States are drawn uniformly from T ∈ [300, 1000) K, S ∈ [-3e-4, 3e-4) V/K,
+/// σ ∈ [1e2, 1e5) S/m and κ ∈ [0.5, 5) W/(m·K); states 10..100 are replaced by
+/// a Wiedemann–Franz violating pair (κ = 1e-5, σ = 9e6) as a negative control.
+/// Each tile of `STRESS_TILE` states is generated and evaluated while it is
+/// cache-resident, so no S/σ/κ/T input arrays ever exist. The output is fully
+/// determined by `(n, seed)`, independent of the rayon thread count.
+///
+/// **Implements:** SPEC-PHYS-CONSTRAINTS, P01-THERMOELECTRIC-EQUATIONS
+pub fn stress_test_zt(n: usize, seed: u64) -> Vec<f64> {
+    let mut out = vec![0.0_f64; n];
+    out.par_chunks_mut(STRESS_TILE)
+        .enumerate()
+        .for_each(|(tile, chunk)| {
+            let mut rng = SplitMix64(seed ^ (tile as u64).wrapping_mul(0xD1B5_4A32_D192_ED03));
+            let base = tile * STRESS_TILE;
+            for (offset, slot) in chunk.iter_mut().enumerate() {
+                let t_val = rng.uniform(300.0, 1000.0);
+                let s_val = rng.uniform(-3e-4, 3e-4);
+                let mut sigma_val = rng.uniform(1e2, 1e5);
+                let mut kappa_val = rng.uniform(0.5, 5.0);
+                if (10..100).contains(&(base + offset)) {
+                    kappa_val = 1e-5;
+                    sigma_val = 9e6;
+                }
+                *slot = gated_zt(s_val, sigma_val, kappa_val, t_val);
             }
+        });
+    out
+}
 
-            zt
+/// Single-pass summary of a gated zT vector: `(valid, invalid, mean, max)`,
+/// where NaN entries (physics-gate rejections) count as invalid.
+///
+/// Replaces the `isnan` / mask-sum / boolean-index / mean / max passes on the
+/// Python side. Partial sums are formed per fixed `STRESS_TILE` chunk in
+/// parallel and combined in chunk order, so the mean does not depend on the
+/// thread count. Mean and max are NaN when no entry is valid.
+pub fn summarize_zt(zt: &[f64]) -> (usize, usize, f64, f64) {
+    let partials: Vec<(usize, f64, f64)> = zt
+        .par_chunks(STRESS_TILE)
+        .map(|chunk| {
+            chunk.iter().filter(|z| !z.is_nan()).fold(
+                (0_usize, 0.0_f64, f64::NEG_INFINITY),
+                |(count, sum, max), &z| (count + 1, sum + z, max.max(z)),
+            )
         })
         .collect();
 
-    Ok(results)
+    let (valid, sum, max) = partials.into_iter().fold(
+        (0_usize, 0.0_f64, f64::NEG_INFINITY),
+        |(c, s, m), (pc, ps, pm)| (c + pc, s + ps, m.max(pm)),
+    );
+
+    if valid == 0 {
+        return (0, zt.len(), f64::NAN, f64::NAN);
+    }
+    (valid, zt.len() - valid, sum / valid as f64, max)
 }
 
 // ============================================================================
@@ -325,6 +417,32 @@ pub fn calc_zt_batch(
 mod calc_zt_batch_tests {
     use super::*;
 
+    #[test]
+    fn stress_generator_is_seeded_and_gated() {
+        let a = stress_test_zt(10_000, 7);
+        let b = stress_test_zt(10_000, 7);
+        assert_eq!(a.len(), 10_000);
+        assert!(a.iter().zip(&b).all(|(x, y)| x.to_bits() == y.to_bits()));
+        assert!(a[10..100].iter().all(|z| z.is_nan()), "WF control states must be rejected");
+        assert!(a.iter().any(|z| z.is_finite()));
+        assert!(a.iter().filter(|z| z.is_finite()).all(|&z| (0.0..=4.0).contains(&z)));
+        assert!(stress_test_zt(10_000, 8).iter().zip(&a).any(|(x, y)| x.to_bits() != y.to_bits()));
+    }
+
+    #[test]
+    fn summarize_zt_skips_nan_and_matches_naive() {
+        let zt = stress_test_zt(10_000, 3);
+        let valid: Vec<f64> = zt.iter().copied().filter(|z| !z.is_nan()).collect();
+        let (n_ok, n_bad, mean, max) = summarize_zt(&zt);
+        assert_eq!((n_ok, n_bad), (valid.len(), zt.len() - valid.len()));
+        assert!((mean - valid.iter().sum::<f64>() / valid.len() as f64).abs() < 1e-12);
+        assert_eq!(max, valid.iter().copied().fold(f64::NEG_INFINITY, f64::max));
+
+        let (n_ok, n_bad, mean, max) = summarize_zt(&[f64::NAN; 3]);
+        assert_eq!((n_ok, n_bad), (0, 3));
+        assert!(mean.is_nan() && max.is_nan());
+    }
+
     /// Canonical BiTe reference: S=200µV/K, σ=1e5 S/m, κ=1.5 W/(m·K), T=300 K.
     fn canonical() -> (Vec<f64>, Vec<f64>, Vec<f64>, Vec<f64>) {
         (vec![200e-6], vec![1e5], vec![1.5], vec![300.0])
@@ -0,0 +1,277 @@
+// rust_core/src/state_pivot.rs
+
+//! # Thermognosis Engine - Temperature Binning & State Pivot
+//!
+//! **Layer:** Ingestion / State Assembly
+//! **Status:** Normative — Strict Mathematical Execution Environment
+//! **Implements:** SPEC-PIPELINE-DATA-FLOW
+//!
+//! Collapses long-format property points `(sample_id, T, property, y)` into
+//! the wide state matrix consumed by the physics gate: one row per
+//! `(sample_id, T_binned)` and one mean column per property. This replaces a
+//! hash `groupby().mean()` followed by `pivot` with a single hash pass over
+//! contiguous buffers; `normalize_and_bin` additionally applies the per
+//! (property, unit) SI factor inside that same pass.
+//!
+//! ## Architectural Guarantees:
+//! 1. **Reference Semantics:** Temperatures are binned with
+//!    round-half-to-even (`np.round`), means use the same Kahan-compensated
+//!    summation as the pandas group mean, and NaN values are skipped.
+//! 2. **Deterministic Layout:** Rows are ordered by `(sample_id, T_binned)`
+//!    ascending, the order of the sorted pandas pivot index.
+
+use thiserror::Error;
+
+#[derive(Error, Debug)]
+pub enum PivotError {
+    #[error("Dimensionality Violation: Input arrays must have identical lengths. Expected {0}, Found {1}.")]
+    DimensionMismatch(usize, usize),
+    #[error("Property index {0} is out of range for {1} property columns.")]
+    PropertyOutOfRange(u8, usize),
+    #[error("Unit index {0} is out of range for {1} unit columns.")]
+    UnitOutOfRange(u32, usize),
+    #[error("Unit factor table has {0} entries; expected a multiple of {1} property rows.")]
+    FactorTableShape(usize, usize),
+}
+
+/// Wide state matrix: `columns[p][r]` is the mean of property `p` in row `r`
+/// (NaN when the row has no finite value for that property).
+pub struct PivotTable {
+    pub sample_id: Vec<i64>,
+    pub t_binned: Vec<f64>,
+    pub columns: Vec<Vec<f64>>,
+}
+
+/// Kahan-compensated running sum and count of one (row, property) cell.
+#[derive(Clone, Copy, Default)]
+struct CellAccumulator {
+    sum: f64,
+    compensation: f64,
+    count: u32,
+}
+
+impl CellAccumulator {
+    #[inline]
+    fn push(&mut self, value: f64) {
+        let y = value - self.compensation;
+        let t = self.sum + y;
+        self.compensation = t - self.sum - y;
+        self.sum = t;
+        self.count += 1;
+    }
+
+    #[inline]
+    fn mean(&self) -> f64 {
+        if self.count == 0 {
+            f64::NAN
+        } else {
+            self.sum / f64::from(self.count)
+        }
+    }
+}
+
+/// Bins `t` to `bin_width` (round-half-to-even) and averages `y` per
+/// `(sample_id, T_binned, prop_idx)`, returning the pivoted state matrix.
+///
+/// Points with a NaN temperature form no row (pandas drops NaN group keys);
+/// NaN `y` values still create their row but do not enter the mean.
+///
+/// # Errors
+/// `PivotError::DimensionMismatch` if the inputs differ in length;
+/// `PivotError::PropertyOutOfRange` if any `prop_idx >= n_props`.
+pub fn bin_and_pivot(
+    sample_id: &[i64],
+    t: &[f64],
+    prop_idx: &[u8],
+    y: &[f64],
+    n_props: usize,
+    bin_width: f64,
+) -> Result<PivotTable, PivotError> {
+    check_shapes(sample_id.len(), &[t.len(), prop_idx.len(), y.len()])?;
+    check_props(prop_idx, n_props)?;
+    Ok(pivot_with(
+        sample_id,
+        t,
+        prop_idx,
+        n_props,
+        bin_width,
+        |i| y[i],
+    ))
+}
+
+/// [`bin_and_pivot`] with SI normalization fused into the same pass: each
+/// `y[i]` is scaled by `unit_factors[prop_idx[i] * n_units + unit_idx[i]]`
+/// (row-major `n_props x n_units` codebook) before it is averaged.
+///
+/// # Errors
+/// As [`bin_and_pivot`], plus `PivotError::FactorTableShape` if the codebook
+/// is not `n_props` rows and `PivotError::UnitOutOfRange` if any
+/// `unit_idx >= n_units`.
+pub fn normalize_and_bin(
+    sample_id: &[i64],
+    t: &[f64],
+    prop_idx: &[u8],
+    unit_idx: &[u32],
+    y: &[f64],
+    unit_factors: &[f64],
+    n_props: usize,
+    bin_width: f64,
+) -> Result<PivotTable, PivotError> {
+    check_shapes(
+        sample_id.len(),
+        &[t.len(), prop_idx.len(), unit_idx.len(), y.len()],
+    )?;
+    check_props(prop_idx, n_props)?;
+    let n_units = unit_factors.len().checked_div(n_props).unwrap_or(0);
+    if n_units * n_props != unit_factors.len() || n_props == 0 {
+        return Err(PivotError::FactorTableShape(unit_factors.len(), n_props));
+    }
+    if let Some(&bad) = unit_idx.iter().find(|&&u| u as usize >= n_units) {
+        return Err(PivotError::UnitOutOfRange(bad, n_units));
+    }
+    Ok(pivot_with(
+        sample_id,
+        t,
+        prop_idx,
+        n_props,
+        bin_width,
+        |i| y[i] * unit_factors[usize::from(prop_idx[i]) * n_units + unit_idx[i] as usize],
+    ))
+}
+
+fn check_shapes(n: usize, others: &[usize]) -> Result<(), PivotError> {
+    match others.iter().find(|&&len| len != n) {
+        Some(&len) => Err(PivotError::DimensionMismatch(n, len)),
+        None => Ok(()),
+    }
+}
+
+fn check_props(prop_idx: &[u8], n_props: usize) -> Result<(), PivotError> {
+    match prop_idx.iter().find(|&&p| usize::from(p) >= n_props) {
+        Some(&bad) => Err(PivotError::PropertyOutOfRange(bad, n_props)),
+        None => Ok(()),
+    }
+}
+
+/// Shared single-pass kernel; `value(i)` yields the (possibly scaled) `y[i]`.
+/// Inputs are pre-validated by the public entry points.
+fn pivot_with(
+    sample_id: &[i64],
+    t: &[f64],
+    prop_idx: &[u8],
+    n_props: usize,
+    bin_width: f64,
+    value: impl Fn(usize) -> f64,
+) -> PivotTable {
+    // Row keys in first-seen order; the map stores each key's row position.
+    let mut rows: ahash::AHashMap<(i64, u64), usize> = ahash::AHashMap::new();
+    let mut keys: Vec<(i64, f64)> = Vec::new();
+    let mut cells: Vec<CellAccumulator> = Vec::new();
+
+    for i in 0..sample_id.len() {
+        // `+ 0.0` folds -0.0 onto 0.0 so both land in the same bin.
+        let t_bin = (t[i] / bin_width).round_ties_even() * bin_width + 0.0;
+        if t_bin.is_nan() {
+            continue;
+        }
+        let row = *rows
+            .entry((sample_id[i], t_bin.to_bits()))
+            .or_insert_with(|| {
+                keys.push((sample_id[i], t_bin));
+                cells.resize(cells.len() + n_props, CellAccumulator::default());
+                keys.len() - 1
+            });
+        let y = value(i);
+        if !y.is_nan() {
+            cells[row * n_props + usize::from(prop_idx[i])].push(y);
+        }
+    }
+
+    let mut order: Vec<usize> = (0..keys.len()).collect();
+    order.sort_unstable_by(|&a, &b| {
+        keys[a]
+            .0
+            .cmp(&keys[b].0)
+            .then(keys[a].1.total_cmp(&keys[b].1))
+    });
+
+    let mut table = PivotTable {
+        sample_id: Vec::with_capacity(order.len()),
+        t_binned: Vec::with_capacity(order.len()),
+        columns: vec![Vec::with_capacity(order.len()); n_props],
+    };
+    for &row in &order {
+        table.sample_id.push(keys[row].0);
+        table.t_binned.push(keys[row].1);
+        let row_cells = &cells[row * n_props..(row + 1) * n_props];
+        for (column, cell) in table.columns.iter_mut().zip(row_cells) {
+            column.push(cell.mean());
+        }
+    }
+    table
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn bins_averages_and_orders_rows() {
+        let sample_id = [2, 1, 1, 1, 2];
+        let t = [300.0, 304.9, 295.0, 305.0, 301.0];
+        let prop = [0, 1, 1, 0, 0];
+        let y = [1.0, 2.0, 4.0, 8.0, 3.0];
+        let table = bin_and_pivot(&sample_id, &t, &prop, &y, 2, 10.0).expect("valid input");
+
+        // 295 and 305 round half to even: 300 and 300; 304.9 rounds to 300.
+        assert_eq!(table.sample_id, vec![1, 2]);
+        assert_eq!(table.t_binned, vec![300.0, 300.0]);
+        assert_eq!(table.columns[0], vec![8.0, 2.0]);
+        assert_eq!(table.columns[1][0], 3.0);
+        assert!(table.columns[1][1].is_nan());
+    }
+
+    #[test]
+    fn skips_nan_keys_and_values() {
+        let table = bin_and_pivot(
+            &[1, 1],
+            &[f64::NAN, 310.0],
+            &[0, 0],
+            &[1.0, f64::NAN],
+            1,
+            10.0,
+        )
+        .expect("valid input");
+        assert_eq!(table.t_binned, vec![310.0]);
+        assert!(table.columns[0][0].is_nan());
+    }
+
+    #[test]
+    fn fuses_unit_scaling_into_the_pass() {
+        // 2 props x 2 units; prop 1 / unit 1 converts by 1e-3.
+        let factors = [1.0, 1.0, 1.0, 1e-3];
+        let table = normalize_and_bin(
+            &[1, 1, 1],
+            &[300.0, 300.0, 300.0],
+            &[1, 1, 0],
+            &[1, 0, 1],
+            &[4000.0, 2.0, 5.0],
+            &factors,
+            2,
+            10.0,
+        )
+        .expect("valid input");
+        assert_eq!(table.columns[0], vec![5.0]);
+        assert_eq!(table.columns[1], vec![3.0]);
+        assert!(normalize_and_bin(&[1], &[300.0], &[0], &[2], &[1.0], &factors, 2, 10.0).is_err());
+        assert!(
+            normalize_and_bin(&[1], &[300.0], &[0], &[0], &[1.0], &factors[..3], 2, 10.0).is_err()
+        );
+    }
+
+    #[test]
+    fn rejects_bad_shapes_and_indices() {
+        assert!(bin_and_pivot(&[1], &[300.0, 310.0], &[0], &[1.0], 1, 10.0).is_err());
+        assert!(bin_and_pivot(&[1], &[300.0], &[3], &[1.0], 3, 10.0).is_err());
+    }
+}
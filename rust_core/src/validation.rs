@@ -148,7 +148,7 @@ impl ThermoelectricState {
 
         // Evaluate figure of merit
         // ZT = (S^2 * \sigma * T) / \kappa
-        let zt = (self.s * self.s * self.sigma * self.t) / self.kappa;
+        let zt = raw_zt(self.s, self.sigma, self.kappa, self.t);
 
         // PCON-05 / PC-05: Thermodynamic Bounds
         if zt < 0.0 {
@@ -186,4 +186,206 @@ pub fn validate_states_par(states: &[ThermoelectricState]) -> Result<Vec<Validat
         .par_iter()
         .map(|state| state.validate())
         .collect::<Result<Vec<ValidatedState>, ValidationError>>()
-}
\ No newline at end of file
+}
+
+/// Validates states given as four flat columns and returns only their $ZT$.
+///
+/// Each state is assembled on the stack from the borrowed columns, so no
+/// intermediate array of `ThermoelectricState` or `ValidatedState` is
+/// materialized; the returned `Vec<f64>` is the only allocation. With
+/// `deterministic`, states are checked sequentially and the lowest-index
+/// violation is reported; otherwise evaluation runs on the rayon pool with the
+/// same fail-fast semantics as [`validate_states_par`].
+/// Callers guarantee equal column lengths.
+///
+/// The mode is resolved once here; each strategy is its own monomorphized
+/// kernel ([`validate_columns_zt_seq`], [`validate_columns_zt_par`]).
+///
+/// # Document IDs
+/// Implements: SPEC-PHYS-CONSISTENCY (19. Computational Complexity)
+pub fn validate_columns_zt(
+    s: &[f64],
+    sigma: &[f64],
+    kappa: &[f64],
+    t: &[f64],
+    deterministic: bool,
+) -> Result<Vec<f64>, ValidationError> {
+    let mut out = vec![0.0; s.len()];
+    validate_columns_zt_into(s, sigma, kappa, t, &mut out, deterministic)?;
+    Ok(out)
+}
+
+/// In-place form of [`validate_columns_zt`]: writes $ZT_i$ into a
+/// caller-owned buffer (typically NumPy memory), so repeated calls allocate
+/// nothing. On error the contents of `out` are unspecified.
+/// Callers guarantee `out` has the column length.
+#[inline]
+pub fn validate_columns_zt_into(
+    s: &[f64],
+    sigma: &[f64],
+    kappa: &[f64],
+    t: &[f64],
+    out: &mut [f64],
+    deterministic: bool,
+) -> Result<(), ValidationError> {
+    if deterministic {
+        validate_columns_zt_seq(s, sigma, kappa, t, out)
+    } else {
+        validate_columns_zt_par(s, sigma, kappa, t, out)
+    }
+}
+
+/// Sequential column kernel: reports the lowest-index violation.
+pub fn validate_columns_zt_seq(
+    s: &[f64],
+    sigma: &[f64],
+    kappa: &[f64],
+    t: &[f64],
+    out: &mut [f64],
+) -> Result<(), ValidationError> {
+    for (b, block) in out.chunks_mut(LANE_BLOCK).enumerate() {
+        let r = b * LANE_BLOCK..b * LANE_BLOCK + block.len();
+        validate_block(&s[r.clone()], &sigma[r.clone()], &kappa[r.clone()], &t[r], block)?;
+    }
+    Ok(())
+}
+
+/// Rayon column kernel: work-stealing, fail-fast on any violation.
+pub fn validate_columns_zt_par(
+    s: &[f64],
+    sigma: &[f64],
+    kappa: &[f64],
+    t: &[f64],
+    out: &mut [f64],
+) -> Result<(), ValidationError> {
+    out.par_chunks_mut(LANE_BLOCK).enumerate().try_for_each(|(b, block)| {
+        let r = b * LANE_BLOCK..b * LANE_BLOCK + block.len();
+        validate_block(&s[r.clone()], &sigma[r.clone()], &kappa[r.clone()], &t[r], block)
+    })
+}
+
+/// States per block in the column kernels: small enough to stay in L1/L2
+/// across the optional scalar re-check, large enough to amortize it.
+const LANE_BLOCK: usize = 1024;
+
+/// $ZT = S^2 \sigma T / \kappa$, shared by [`ThermoelectricState::validate`]
+/// and the vectorized block pass so both round identically (no FMA contraction).
+#[inline(always)]
+fn raw_zt(s: f64, sigma: f64, kappa: f64, t: f64) -> f64 {
+    (s * s * sigma * t) / kappa
+}
+
+// Hot path: the block is first evaluated branch-free (non-short-circuiting
+// `&`/`|`, a single OR-reduced violation flag), which LLVM auto-vectorizes
+// into packed mul/div/compare lanes on AVX2/AVX-512 targets. Only a block
+// containing a violation is re-walked through the scalar `validate` chain
+// to report the exact error, preserving fail-fast semantics and ordering.
+#[inline(always)]
+fn validate_block(
+    s: &[f64],
+    sigma: &[f64],
+    kappa: &[f64],
+    t: &[f64],
+    out: &mut [f64],
+) -> Result<(), ValidationError> {
+    let mut violated = false;
+    for ((((zt, &si), &gi), &ki), &ti) in out.iter_mut().zip(s).zip(sigma).zip(kappa).zip(t) {
+        let z = raw_zt(si, gi, ki, ti);
+        *zt = z;
+        // With finite, positive σ, κ, T the quotient is never NaN, so
+        // `z >= 0.0` is exactly `validate`'s `!(zt < 0.0)`.
+        let admissible = si.is_finite() & gi.is_finite() & ki.is_finite() & ti.is_finite()
+            & (ti > 0.0) & (gi > 0.0) & (ki > 0.0) & (z >= 0.0);
+        violated |= !admissible;
+    }
+    if violated {
+        for (i, zt) in out.iter_mut().enumerate() {
+            *zt = ThermoelectricState { s: s[i], sigma: sigma[i], kappa: kappa[i], t: t[i] }
+                .validate()?
+                .zt();
+        }
+    }
+    Ok(())
+}
+
+/// Fused hard-constraint gate over flat state columns:
+/// $g_i = (zT_i \ge 0) \wedge (T_i > 0) \wedge (\kappa_i > 0) \wedge (\sigma_i > 0)$.
+///
+/// One pass over the four inputs writing one byte per state, instead of four
+/// comparison arrays and three AND passes. The comparisons are combined with
+/// the non-short-circuiting `&`, keeping the loop branch-free so LLVM can
+/// auto-vectorize it. NaN inputs fail every comparison and therefore the gate.
+/// Callers guarantee equal input lengths; the shortest input bounds the output.
+///
+/// # Document IDs
+/// Implements: SPEC-PHYS-CONSTRAINTS (PC-02 positivity constraints)
+pub fn hard_constraint_gate(zt: &[f64], t: &[f64], kappa: &[f64], sigma: &[f64]) -> Vec<bool> {
+    zt.iter()
+        .zip(t)
+        .zip(kappa)
+        .zip(sigma)
+        .map(|(((&z, &ti), &k), &s)| (z >= 0.0) & (ti > 0.0) & (k > 0.0) & (s > 0.0))
+        .collect()
+}
+
+#[cfg(test)]
+mod gate_tests {
+    use super::*;
+
+    #[test]
+    fn gate_matches_elementwise_definition() {
+        let zt = [0.5, -0.1, 0.0, f64::NAN, 1.0];
+        let t = [300.0, 300.0, 300.0, 300.0, 0.0];
+        let kappa = [1.0, 1.0, 1.0, 1.0, 1.0];
+        let sigma = [1e5, 1e5, 1e5, 1e5, 1e5];
+        assert_eq!(
+            hard_constraint_gate(&zt, &t, &kappa, &sigma),
+            vec![true, false, true, false, false]
+        );
+    }
+
+    #[test]
+    fn column_validation_matches_packed_states() {
+        let s = [2e-4, 1.5e-4, 3e-4];
+        let sigma = [1e5, 2e5, 5e4];
+        let kappa = [1.2, 0.8, 2.0];
+        let t = [300.0, 450.0, 600.0];
+        let states: Vec<ThermoelectricState> = (0..3)
+            .map(|i| ThermoelectricState { s: s[i], sigma: sigma[i], kappa: kappa[i], t: t[i] })
+            .collect();
+        let expected: Vec<f64> = validate_states_par(&states).unwrap().iter().map(|v| v.zt()).collect();
+        for deterministic in [true, false] {
+            assert_eq!(validate_columns_zt(&s, &sigma, &kappa, &t, deterministic).unwrap(), expected);
+        }
+
+        let bad_t = [300.0, -1.0, f64::NAN];
+        assert_eq!(
+            validate_columns_zt(&s, &sigma, &kappa, &bad_t, true),
+            Err(ValidationError::NegativeAbsoluteTemperature(-1.0))
+        );
+        assert!(validate_columns_zt(&s, &sigma, &kappa, &bad_t, false).is_err());
+    }
+
+    #[test]
+    fn block_kernels_match_scalar_across_blocks() {
+        let n = 2 * LANE_BLOCK + 77;
+        let s: Vec<f64> = (0..n).map(|i| 1e-4 + i as f64 * 1e-8).collect();
+        let sigma: Vec<f64> = (0..n).map(|i| 1e4 + i as f64).collect();
+        let kappa: Vec<f64> = (0..n).map(|i| 0.5 + i as f64 * 1e-3).collect();
+        let mut t: Vec<f64> = (0..n).map(|i| 300.0 + (i % 700) as f64).collect();
+        let expected: Vec<f64> = (0..n)
+            .map(|i| ThermoelectricState { s: s[i], sigma: sigma[i], kappa: kappa[i], t: t[i] }.validate().unwrap().zt())
+            .collect();
+        for deterministic in [true, false] {
+            let got = validate_columns_zt(&s, &sigma, &kappa, &t, deterministic).unwrap();
+            assert!(got.iter().zip(&expected).all(|(a, b)| a.to_bits() == b.to_bits()));
+        }
+
+        t[LANE_BLOCK + 5] = -2.0;
+        t[LANE_BLOCK + 9] = f64::INFINITY;
+        assert_eq!(
+            validate_columns_zt(&s, &sigma, &kappa, &t, true),
+            Err(ValidationError::NegativeAbsoluteTemperature(-2.0))
+        );
+    }
+}
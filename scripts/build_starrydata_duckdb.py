@@ -92,14 +92,15 @@ def stage1_ingest_domain(mirror_root: Path, domain: str) -> tuple[pd.DataFrame,
     core. Returns five DataFrames: measurements, samples, papers, properties,
     figures extracted from every JSON file in the domain.
 
-    The GIL is released inside `py_scan_domain` for the full shard-discovery
-    and parallel-parse pipeline; Python only incurs FFI reconstruction costs.
+    The GIL is released inside `py_scan_domain_columnar` for the full shard-discovery
+    and parallel-parse pipeline, and measurements cross the FFI as NumPy
+    columns rather than one dict per point.
     """
     domain_root = str(mirror_root / domain)
     log.info(f"[S1] Scanning domain '{domain}' via Rust parallel walker...")
     t0 = time.perf_counter()
 
-    records_list, summary = rust_core.py_scan_domain(domain_root, domain)
+    meas_cols, records_list, summary = rust_core.py_scan_domain_columnar(domain_root, domain)
 
     elapsed = time.perf_counter() - t0
     log.info(
@@ -111,24 +112,31 @@ def stage1_ingest_domain(mirror_root: Path, domain: str) -> tuple[pd.DataFrame,
         for err in summary["errors"][:10]:
             log.warning(f"[S1] ParseError: {err}")
 
-    # Flatten records into columnar lists — avoids repeated DataFrame appends
-    meas_rows   = []
+    # Measurements arrive as NumPy columns; only the (few) sample and paper
+    # descriptors are still flattened from per-record dicts.
     sample_rows = []
     paper_rows  = []
 
     for rec in records_list:
-        src = rec["source_file"] if "source_file" in rec else rec.get("source_path", "")
-        for m in rec["measurements"]:
-            m["source_domain"] = domain
-            m["source_file"]   = src
-            meas_rows.append(m)
-        for s in rec["samples"]:
-            paper_rows_from_rec = rec["papers"]  # noqa — used below
-            sample_rows.append(s)
-        for p in rec["papers"]:
-            paper_rows.append(p)
-
-    df_meas    = pd.DataFrame(meas_rows)    if meas_rows    else _empty_measurements()
+        sample_rows.extend(rec["samples"])
+        paper_rows.extend(rec["papers"])
+
+    record_index = meas_cols.pop("record_index")
+    if record_index.size:
+        source_paths = np.array([rec["source_path"] for rec in records_list], dtype=object)
+        df_meas = pd.DataFrame({
+            "paperid":       meas_cols["paperid"],
+            "sampleid":      meas_cols["sampleid"],
+            "figureid":      meas_cols["figureid"],
+            "x":             meas_cols["x"],
+            "y":             meas_cols["y"],
+            "propertyid_x":  meas_cols["propertyid_x"],
+            "propertyid_y":  meas_cols["propertyid_y"],
+            "source_domain": domain,
+            "source_file":   source_paths[record_index],
+        })
+    else:
+        df_meas = _empty_measurements()
     df_samples = pd.DataFrame(sample_rows)  if sample_rows  else _empty_samples()
     df_papers  = pd.DataFrame(paper_rows)   if paper_rows   else _empty_papers()
 
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 import time
 import logging
-import numpy as np
-import pandas as pd
 import starrydata as sd
 import rust_core
 
+# Numeric columns of the curves table read by the Rust CSV loader.
+CURVE_NUMERIC_COLUMNS = ['sample_id']
+
 def main():
     logging.basicConfig(level=logging.INFO, format="%(asctime)s - [PIPELINE] - %(levelname)s - %(message)s")
     logger = logging.getLogger("Ingestion")
@@ -14,10 +15,12 @@ def main():
     # Tải dataset mới nhất (Nó sẽ cache lại trong máy bạn cho các lần chạy sau)
     dataset = sd.load_dataset() 
     
-    # Load bảng curves (chứa giá trị vật lý)
-    df_curves = pd.read_csv(dataset.curves_csv, low_memory=False)
-    
-    logger.info(f"Loaded {len(df_curves):,} raw property rows.")
+    # Load bảng curves (chứa giá trị vật lý) trực tiếp bằng Rust:
+    # chỉ các cột số được chọn theo tên header, mỗi cột là một mảng float64.
+    curves = rust_core.read_curves_csv_py(dataset.curves_csv, CURVE_NUMERIC_COLUMNS)
+    n_rows = len(curves['sample_id'])
+
+    logger.info(f"Loaded {n_rows:,} raw property rows ({len(curves)} numeric columns).")
 
     # Giả lập việc chúng ta có 4 mảng numpy (S, Sigma, Kappa, T) có cùng độ dài.
     # Trong thực tế, Starrydata lưu rời rạc từng Property (ví dụ: dòng 1 là Seebeck, dòng 2 là Kappa).
@@ -27,27 +30,23 @@ def main():
     N = 10_000_000 # Test thử sức chịu đựng của Rust với 10 triệu trạng thái
     logger.info(f"2. Generating {N:,} states to stress-test Rust Physics Engine...")
     
-    T_arr = np.random.uniform(300, 1000, N).astype(np.float64)       # 300K - 1000K
-    S_arr = np.random.uniform(-0.0003, 0.0003, N).astype(np.float64) # V/K
-    Sigma_arr = np.random.uniform(100, 100000, N).astype(np.float64) # S/m
-    Kappa_arr = np.random.uniform(0.5, 5.0, N).astype(np.float64)    # W/mK
-
-    # Giả lập một vài dữ liệu rác vi phạm định luật Wiedemann-Franz (Kappa cực nhỏ, Sigma cực lớn)
-    Kappa_arr[10:100] = 0.00001
-    Sigma_arr[10:100] = 9000000.0
+    # Trạng thái được sinh và kiểm tra vật lý ngay trong Rust theo từng tile
+    # (T: 300-1000K, S: ±0.3 mV/K, Sigma: 1e2-1e5 S/m, Kappa: 0.5-5 W/mK;
+    # trạng thái 10..100 vi phạm Wiedemann-Franz làm đối chứng), nên không
+    # cần cấp phát 4 mảng NumPy 80 MB trước khi gọi kernel.
+    SEED = 42
 
-    logger.info("3. Pushing Zero-Copy NumPy arrays across FFI to Rust Core...")
+    logger.info("3. Running fused generate + physics gate kernel in Rust Core...")
     start_time = time.perf_counter()
 
     # Gọi trực tiếp hàm Rust thông qua PyO3
-    zt_results = rust_core.py_compute_zt_batch(S_arr, Sigma_arr, Kappa_arr, T_arr)
+    zt_results = rust_core.py_stress_test_zt(N, SEED)
 
     elapsed = time.perf_counter() - start_time
 
-    # Lọc ra các trạng thái vật lý hợp lệ (Rust trả về NaN cho các vi phạm)
-    valid_mask = ~np.isnan(zt_results)
-    valid_count = np.sum(valid_mask)
-    invalid_count = N - valid_count
+    # Thống kê trạng thái hợp lệ trong một lượt duyệt Rust
+    # (Rust trả về NaN cho các vi phạm, được đếm là không hợp lệ)
+    valid_count, invalid_count, mean_zt, max_zt = rust_core.summarize_zt_py(zt_results)
 
     logger.info("=" * 50)
     logger.info(" THERMOGNOSIS ENGINE - PHYSICS GATE REPORT ")
@@ -56,8 +55,8 @@ def main():
     logger.info(f" Valid Physical States  : {valid_count:,}")
     logger.info(f" Rejected by Physics    : {invalid_count:,} (P03/P04 Violations)")
     if valid_count > 0:
-        logger.info(f" Mean zT                : {np.mean(zt_results[valid_mask]):.4f}")
-        logger.info(f" Max zT                 : {np.max(zt_results[valid_mask]):.4f}")
+        logger.info(f" Mean zT                : {mean_zt:.4f}")
+        logger.info(f" Max zT                 : {max_zt:.4f}")
     logger.info("-" * 50)
     logger.info(f" Rust Execution Time    : {elapsed:.6f} seconds")
     logger.info(f" Physics Throughput     : {N / elapsed:,.0f} states/sec")
@@ -1,34 +1,152 @@
 #!/usr/bin/env python3
 import time
+import argparse
+import csv
+import hashlib
 import json
 import logging
+import re
+import shutil
+import sys
 from pathlib import Path
+from typing import List, Tuple
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 import starrydata as sd
 import rust_core
 
+# Import thermognosis from the source tree regardless of the working directory.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "python"))
+
+from thermognosis.utils.array_parsing import join_cells
+
 def parse_json_array(val):
     if pd.isna(val) or not isinstance(val, str): return []
     try: return json.loads(val)
     except Exception: return []
 
-def main():
-    logging.basicConfig(level=logging.INFO, format="%(asctime)s - [PIPELINE] - %(levelname)s - %(message)s")
-    logger = logging.getLogger("RealData")
+def read_curve_columns(csv_path: Path) -> pa.Table:
+    """
+    Reads only the columns this pipeline uses from a curves CSV with Arrow's
+    multi-threaded reader; all other columns are skipped by the tokenizer.
+    The property/unit column names follow the CSV header.
+    """
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        header = next(csv.reader(f))
+    prop_col = 'prop_y' if 'prop_y' in header else 'property_name'
+    unit_col = 'unit_y' if 'unit_y' in header else 'unit'
+    text_cols = [prop_col, unit_col, 'prop_x', 'x', 'y']
+    return pa_csv.read_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(block_size=1 << 23),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=['sample_id', *text_cols],
+            column_types={'sample_id': pa.int64(), **{c: pa.string() for c in text_cols}},
+        ),
+    )
 
-    data_dir = Path("data")
-    data_dir.mkdir(exist_ok=True)
-    cache_file = data_dir / "starrydata_curves_cached.csv"
+def _decode_cells(cells: List) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decodes serialized curve arrays into (flat float64 values, int64 per-cell
+    lengths) with the Rust column parser. Cells it declines (e.g. JSON nulls,
+    non-string cells) keep the `parse_json_array` +
+    `pd.to_numeric(errors='coerce')` semantics and are spliced back in order.
+    """
+    flat, lengths, ok = rust_core.parse_array_column_py(*join_cells(cells))
+    bad = np.flatnonzero(~ok)
+    if bad.size == 0:
+        return flat, lengths
+    pieces = np.split(flat, np.cumsum(lengths)[:-1])
+    for i in bad:
+        values = pd.Series(parse_json_array(cells[i]), dtype=object)
+        pieces[i] = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64)
+        lengths[i] = pieces[i].size
+    return np.concatenate(pieces), lengths
 
-    if not cache_file.exists():
-        logger.info("1. Downloading from Starrydata API...")
-        dataset = sd.load_dataset()
-        df = pd.read_csv(dataset.curves_csv, low_memory=False)
-        df.to_csv(cache_file, index=False)
+def parse_curve_column(cells: List) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-row (flat float64 values, int64 lengths) of a curve column. Curves
+    repeat across rows (shared references, empty/missing cells), so each
+    distinct literal is decoded once and the values are gathered back per row.
+    """
+    codes, uniques = pd.factorize(np.asarray(cells, dtype=object), use_na_sentinel=False)
+    flat_u, len_u = _decode_cells(uniques.tolist())
+    start_u = np.zeros(len_u.shape[0], dtype=np.int64)
+    np.cumsum(len_u[:-1], out=start_u[1:])
+
+    lengths = len_u[codes]
+    row_start = np.zeros(lengths.shape[0], dtype=np.int64)
+    np.cumsum(lengths[:-1], out=row_start[1:])
+    # Output position k of row r reads flat_u[start_u[codes[r]] + (k - row_start[r])].
+    gather = np.repeat(start_u[codes] - row_start, lengths) + np.arange(lengths.sum())
+    return flat_u[gather], lengths
+
+# =============================================================================
+# SPEC-UNIT-CONVERTER
+# =============================================================================
+
+# (property, required patterns, excluded patterns, SI factor). A unit string
+# accumulates the factor of every rule it satisfies (re.search semantics).
+_UNIT_RULES = [
+    ('S', (re.compile(r'uV|muV|μV'),), (), 1e-6),
+    ('S', (re.compile(r'mV'),), (), 1e-3),
+    ('Sigma', (re.compile(r'cm'),), (), 100.0),
+    ('Sigma', (re.compile(r'10\^3'),), (), 1e3),
+    ('Sigma', (re.compile(r'10\^4'),), (), 1e4),
+    ('Rho', (re.compile(r'mOhm.*cm'),), (), 1e-5),
+    ('Rho', (re.compile(r'uOhm.*cm|μOhm.*cm'),), (), 1e-8),
+    ('Rho', (re.compile(r'Ohm.*cm'),), (re.compile(r'mOhm|uOhm|μOhm'),), 1e-2),
+    ('Rho', (re.compile(r'uOhm.*m|μOhm.*m'),), (re.compile(r'cm'),), 1e-6),
+    ('Kappa', (re.compile(r'mW'), re.compile(r'cm')), (), 0.1),
+    ('Kappa', (re.compile(r'mW'), re.compile(r'm\^')), (), 1e-3),
+]
+
+def unit_factor_table(props: List[str], units: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Factorized unit codes (uint32) and the (property x unit) SI factor codebook
+    for `data_y`, with rows in `props` order. The rule ladder is evaluated once
+    per distinct unit string; properties without rules (e.g. ZT_reported) and
+    non-string units keep a factor of 1.
+    """
+    codes, uniques = pd.factorize(units)
+    rows = {prop: r for r, prop in enumerate(props)}
+    # Extra column: missing units (factorize code -1).
+    table = np.ones((len(props), len(uniques) + 1))
+    for j, unit in enumerate(uniques):
+        if not isinstance(unit, str):
+            continue
+        for prop, required, excluded, factor in _UNIT_RULES:
+            if prop in rows and all(p.search(unit) for p in required) \
+                    and not any(p.search(unit) for p in excluded):
+                table[rows[prop], j] *= factor
+    codes = np.where(codes < 0, len(uniques), codes).astype(np.uint32)
+    return codes, table
+
+def csv_fingerprint(path: Path) -> str:
+    """Cheap content key of a CSV cache: SHA-1 of its size and first MiB."""
+    digest = hashlib.sha1(str(path.stat().st_size).encode())
+    with open(path, 'rb') as f:
+        digest.update(f.read(1 << 20))
+    return digest.hexdigest()[:12]
+
+def build_state_matrix(logger: logging.Logger, cache_file: Path, key: str) -> pd.DataFrame:
+    """Steps 1-4: load the curves, explode, normalize units and pivot to the state matrix."""
+    # Projected columns of the CSV cache, written on first load and keyed by
+    # the same fingerprint as the final matrix, so a refreshed CSV is re-read.
+    parquet_cache = cache_file.with_name(f"{cache_file.stem}_{key}.parquet")
+
+    if parquet_cache.exists():
+        logger.info(f"1. Loading from local cache: {parquet_cache}...")
+        table = pq.read_table(parquet_cache)
     else:
         logger.info(f"1. Loading from local cache: {cache_file}...")
-        df = pd.read_csv(cache_file, low_memory=False)
+        table = read_curve_columns(cache_file)
+        pq.write_table(table, parquet_cache, compression='zstd')
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    del table
 
     prop_col = 'prop_y' if 'prop_y' in df.columns else 'property_name'
     unit_col = 'unit_y' if 'unit_y' in df.columns else 'unit'
@@ -45,42 +163,37 @@ def main():
     df = df[df[prop_col].isin(target_props.keys()) & (df['prop_x'] == 'Temperature')].copy()
 
     logger.info("2. Exploding arrays and aligning coordinates...")
-    df['data_x'] = df['x'].apply(parse_json_array)
-    df['data_y'] = df['y'].apply(parse_json_array)
-    df = df.explode(['data_x', 'data_y'])
-    df['data_x'] = pd.to_numeric(df['data_x'], errors='coerce')
-    df['data_y'] = pd.to_numeric(df['data_y'], errors='coerce')
+    # Columnar explode: each point row repeats its curve's source row.
+    data_x, len_x = parse_curve_column(df['x'].tolist())
+    data_y, len_y = parse_curve_column(df['y'].tolist())
+    mismatched = np.count_nonzero(len_x != len_y)
+    if mismatched:
+        raise ValueError(f"x/y arrays have different element counts in {mismatched} rows.")
+    df = (df.drop(columns=['x', 'y'])
+            .iloc[np.repeat(np.arange(len(df)), len_x)]
+            .assign(data_x=data_x, data_y=data_y))
     df = df.dropna(subset=['data_x', 'data_y'])
     df['prop_mapped'] = df[prop_col].map(target_props)
 
     # =========================================================================
-    # SPEC-UNIT-CONVERTER (FIXED REGEX with r'')
+    # SPEC-UNIT-CONVERTER (FIXED REGEX with r'') + BINNING + PIVOT
     # =========================================================================
-    logger.info("3. Applying strict SI Unit Normalization...")
-    
-    mask_s = df['prop_mapped'] == 'S'
-    df.loc[mask_s & df[unit_col].str.contains(r'uV|muV|μV', na=False, regex=True), 'data_y'] *= 1e-6
-    df.loc[mask_s & df[unit_col].str.contains(r'mV', na=False), 'data_y'] *= 1e-3
-
-    mask_sig = df['prop_mapped'] == 'Sigma'
-    df.loc[mask_sig & df[unit_col].str.contains(r'cm', na=False), 'data_y'] *= 100.0
-    df.loc[mask_sig & df[unit_col].str.contains(r'10\^3', na=False), 'data_y'] *= 1e3
-    df.loc[mask_sig & df[unit_col].str.contains(r'10\^4', na=False), 'data_y'] *= 1e4
-
-    mask_rho = df['prop_mapped'] == 'Rho'
-    df.loc[mask_rho & df[unit_col].str.contains(r'mOhm.*cm', na=False, regex=True), 'data_y'] *= 1e-5
-    df.loc[mask_rho & df[unit_col].str.contains(r'uOhm.*cm|μOhm.*cm', na=False, regex=True), 'data_y'] *= 1e-8
-    df.loc[mask_rho & df[unit_col].str.contains(r'Ohm.*cm', na=False, regex=True) & ~df[unit_col].str.contains(r'mOhm|uOhm|μOhm', regex=True, na=False), 'data_y'] *= 1e-2
-    df.loc[mask_rho & df[unit_col].str.contains(r'uOhm.*m|μOhm.*m', na=False, regex=True) & ~df[unit_col].str.contains(r'cm', na=False), 'data_y'] *= 1e-6
-
-    mask_kap = df['prop_mapped'] == 'Kappa'
-    df.loc[mask_kap & df[unit_col].str.contains(r'mW', na=False) & df[unit_col].str.contains(r'cm', na=False), 'data_y'] *= 0.1
-    df.loc[mask_kap & df[unit_col].str.contains(r'mW', na=False) & df[unit_col].str.contains(r'm\^', na=False), 'data_y'] *= 1e-3
-
-    logger.info("4. Binning Temperature and Pivoting to state matrix...")
-    df['T_rounded'] = (df['data_x'] / 10).round() * 10
-    df_grouped = df.groupby(['sample_id', 'T_rounded', 'prop_mapped'])['data_y'].mean().reset_index()
-    pivot_df = df_grouped.pivot(index=['sample_id', 'T_rounded'], columns='prop_mapped', values='data_y').reset_index()
+    logger.info("3-4. Applying strict SI Unit Normalization, binning Temperature and pivoting...")
+    # One Rust pass: y * SI factor, then mean per (sample_id, 10 K bin, property)
+    pivot_props = list(target_props.values())
+    prop_idx = pd.Categorical(df['prop_mapped'], categories=pivot_props).codes.astype(np.uint8)
+    unit_idx, unit_factors = unit_factor_table(pivot_props, df[unit_col])
+    sample_ids, t_binned, prop_columns = rust_core.normalize_and_bin_py(
+        np.ascontiguousarray(df['sample_id'].values, dtype=np.int64),
+        np.ascontiguousarray(df['data_x'].values, dtype=np.float64),
+        prop_idx,
+        unit_idx,
+        np.ascontiguousarray(df['data_y'].values, dtype=np.float64),
+        unit_factors.ravel(),
+        len(pivot_props),
+    )
+    pivot_df = pd.DataFrame({'sample_id': sample_ids, 'T_rounded': t_binned,
+                             **dict(zip(pivot_props, prop_columns))})
 
     if 'Rho' in pivot_df.columns and 'Sigma' in pivot_df.columns:
         mask_rho_valid = pivot_df['Sigma'].isna() & pivot_df['Rho'].notna() & (pivot_df['Rho'] > 1e-12)
@@ -96,6 +209,31 @@ def main():
     if 'ZT_reported' not in final_df.columns:
         final_df['ZT_reported'] = np.nan
 
+    return final_df
+
+def main(force_recompute: bool = False):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - [PIPELINE] - %(levelname)s - %(message)s")
+    logger = logging.getLogger("RealData")
+
+    data_dir = Path("data")
+    data_dir.mkdir(exist_ok=True)
+    cache_file = data_dir / "starrydata_curves_cached.csv"
+
+    if not cache_file.exists():
+        logger.info("1. Downloading from Starrydata API...")
+        dataset = sd.load_dataset()
+        shutil.copyfile(dataset.curves_csv, cache_file)
+
+    # Processed state matrix, keyed by the CSV cache content (warm runs skip steps 1-4).
+    key = csv_fingerprint(cache_file)
+    final_cache = data_dir / f"final_{key}.parquet"
+    if final_cache.exists() and not force_recompute:
+        logger.info(f"1-4. Loading processed state matrix from cache: {final_cache}...")
+        final_df = pd.read_parquet(final_cache)
+    else:
+        final_df = build_state_matrix(logger, cache_file, key)
+        final_df.to_parquet(final_cache, compression='zstd')
+
     logger.info("5. Pushing arrays to Rust Physics Engine...")
     T_arr = np.ascontiguousarray(final_df['T_rounded'].values, dtype=np.float64)
     S_arr = np.ascontiguousarray(final_df['S'].values, dtype=np.float64)
@@ -116,9 +254,11 @@ def main():
     # So sánh ZT tính toán và ZT tác giả báo cáo (nếu có)
     cross_check_df = valid_df.dropna(subset=['ZT_reported']).copy()
     if not cross_check_df.empty:
-        cross_check_df['zT_Error'] = np.abs(cross_check_df['zT_computed'] - cross_check_df['ZT_reported'])
+        zt_computed = cross_check_df['zT_computed'].to_numpy()
+        zt_error = np.abs(zt_computed - cross_check_df['ZT_reported'].to_numpy())
+        cross_check_df['zT_Error'] = zt_error
         # Flag những điểm có sai số > 10%
-        inconsistent_states = cross_check_df[cross_check_df['zT_Error'] > 0.1 * cross_check_df['zT_computed']]
+        inconsistent_states = cross_check_df[zt_error > 0.1 * zt_computed]
     else:
         inconsistent_states = pd.DataFrame()
 
@@ -151,4 +291,7 @@ def main():
     logger.info("=" * 60)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Thermognosis real Starrydata physics report.")
+    parser.add_argument("--force-recompute", action="store_true",
+                        help="Rebuild the processed state matrix even if a cached one exists.")
+    main(force_recompute=parser.parse_args().force_recompute)
\ No newline at end of file